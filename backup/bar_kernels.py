@@ -0,0 +1,62 @@
+"""
+Bar-building kernels for the intelligent signal trader.
+
+update_bar is loaded from the ahead-of-time compiled ``trader_kernels``
+extension when it has been built (see compile_kernels.py), so startup pays
+no JIT cost. Otherwise it is compiled on first use with numba, or runs as
+plain Python when numba is not installed.
+"""
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional - fall back to plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Argument types of update_bar, used by compile_kernels.py
+UPDATE_BAR_SIGNATURE = 'i8(f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], i8, i8, f8, f8, f8, f8, f8)'
+
+
+def _update_bar(ts_arr, o, h, l, c, v, cursor, keep, ts_minute, first, high, low, last):
+    """Fold a run of ticks into the bar arrays and return the new cursor.
+
+    first/high/low/last summarise the ticks (all four are equal for a single
+    tick). Starts a new bar when ts_minute is past the last bar's timestamp,
+    otherwise updates high/low/close of the current bar in place. When the
+    buffer is full the newest keep - 1 bars are moved to the front.
+    """
+    if cursor > 0 and ts_arr[cursor - 1] >= ts_minute:
+        i = cursor - 1
+        if high > h[i]:
+            h[i] = high
+        if low < l[i]:
+            l[i] = low
+        c[i] = last
+        return cursor
+
+    if cursor == ts_arr.shape[0]:
+        shift = cursor - (keep - 1)
+        for j in range(keep - 1):
+            ts_arr[j] = ts_arr[j + shift]
+            o[j] = o[j + shift]
+            h[j] = h[j + shift]
+            l[j] = l[j + shift]
+            c[j] = c[j + shift]
+            v[j] = v[j + shift]
+        cursor = keep - 1
+
+    ts_arr[cursor] = ts_minute
+    o[cursor] = first
+    h[cursor] = high
+    l[cursor] = low
+    c[cursor] = last
+    v[cursor] = 0.0
+    return cursor + 1
+
+
+try:
+    from trader_kernels import update_bar
+except ImportError:
+    update_bar = njit(cache=True)(_update_bar)
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time compile the trader's numba kernels.
+
+Builds the ``trader_kernels`` extension module next to this file, which
+bar_kernels.py imports in preference to JIT compiling at startup.
+
+To run:
+    python compile_kernels.py
+"""
+
+import os
+
+from numba.pycc import CC
+
+from bar_kernels import UPDATE_BAR_SIGNATURE, _update_bar
+
+
+def main():
+    cc = CC('trader_kernels')
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+    cc.export('update_bar', UPDATE_BAR_SIGNATURE)(_update_bar)
+    cc.compile()
+    print(f"✅ Built trader_kernels in {cc.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,14 +14,25 @@ Date: November 2025
 """
 
 import asyncio
+import atexit
 import logging
 import os
+import queue
 import sys
 from datetime import datetime, timedelta, time
+from time import monotonic, time as wall_time
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional, Dict, List
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (and unavailable on Windows)
+    uvloop = None
+
 # Add the import fix for running from project directory
 current_dir = os.getcwd()
 if current_dir in sys.path:
@@ -36,23 +47,121 @@ for mod in modules_to_remove:
 import ironbeam
 from ironbeam import (
     IronBeam, IronBeamStream, OrderRequest, OrderType, OrderSide, 
-    DurationType, OrderStatus, ConnectionState, ThreadedExecutor,
+    DurationType, OrderStatus, OrderUpdateRequest, ConnectionState, ThreadedExecutor,
     AutoBreakevenConfig, RunningTPConfig, PositionState, BreakevenState
 )
 
 from indicators_optimized import OptimizedSignalGenerator
+from bar_kernels import update_bar
+from position_eval import CLOSE_PROFIT_TARGET, CLOSE_TIME_LIMIT, evaluate_position
 
 # Load environment variables
 load_dotenv()
 
-# Enhanced logging setup
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s.%(msecs)03d | %(levelname)-8s | %(message)s',
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that runs strftime at most once per second.
+
+    asctime has second resolution (milliseconds come from %(msecs)), so the
+    formatted time is reused for every record created within the same second.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_second = None
+        self._cached_time = ''
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = super().formatTime(record, datefmt)
+            self._cached_second = second
+        return self._cached_time
+
+
+# Enhanced logging setup: records are queued on the calling thread and
+# formatted/written to stderr by a background listener thread
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(CachedTimeFormatter(
+    '%(asctime)s.%(msecs)03d | %(levelname)-8s | %(message)s',
     datefmt='%H:%M:%S'
-)
+))
+_log_queue: queue.Queue = queue.Queue(-1)
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Only merge args before queueing
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Flushes queued records on exit
 logger = logging.getLogger(__name__)
 
+# Bar storage: MAX_BARS bars are kept for signal generation, the buffer has
+# some headroom so the window only needs shifting once every few bars.
+MAX_BARS = 200
+BAR_BUFFER_SIZE = 256
+BAR_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+# Hot-path log formats, filled in lazily by the logging module
+NEW_BAR_LOG_FMT = "📊 New bar: %s O:%.2f"
+SIGNAL_LOG_FMT = ("📡 Signal: %s | ST:%s OB/OS:%s TR:%s | "
+                  "Votes: Buy=%s/3, Sell=%s/3 | ADX: %.1f (%s)%s")
+
+# Stream messages are queued and drained in batches of at most this many
+MARKET_DATA_BATCH_MAX = 64
+# Position checks wait this long for more ticks and only use the latest price
+TICK_COALESCE_S = 0.002
+
+# Order status is polled over REST this often (the stream has no order/fill channel)
+ORDER_FILL_POLL_S = 2.0
+# How long close_position waits for its market order to fill
+CLOSE_FILL_TIMEOUT_S = 3.0
+
+# Session boundaries (local time): Sunday 6pm open, daily 4:30pm-6pm break,
+# Friday 4:30pm close. Both land on half-hour marks, so the schedule is a
+# (weekday, half-hour slot) truth table built once at import.
+SESSION_OPEN = time(18, 0)
+SESSION_CLOSE = time(16, 30)
+
+
+def _build_market_hours_table() -> np.ndarray:
+    open_slot = (SESSION_OPEN.hour * 60 + SESSION_OPEN.minute) // 30
+    close_slot = (SESSION_CLOSE.hour * 60 + SESSION_CLOSE.minute) // 30
+    table = np.zeros((7, 48), dtype=bool)  # 0=Monday, 6=Sunday
+    for weekday in range(5):
+        table[weekday, :close_slot] = True
+    for weekday in (0, 1, 2, 3, 6):
+        table[weekday, open_slot:] = True
+    return table
+
+
+MARKET_HOURS_TABLE = _build_market_hours_table()
+
+
+@dataclass(slots=True)
+class BracketChildren:
+    """Order ids of the position's protective orders (None while missing)."""
+    stop_loss_id: Optional[str] = None
+    take_profit_id: Optional[str] = None
+
+
+@dataclass(slots=True)
+class TradePosition:
+    """The bot's open (or pending) position, read on every monitored tick."""
+    order_id: str
+    side: str  # 'BUY' or 'SELL'
+    entry_price: float
+    stop_loss: float
+    take_profit: float
+    quantity: int
+    filled: bool = False
+    fill_time: Optional[datetime] = None  # Wall clock, for logs
+    fill_monotonic: float = 0.0  # Event loop clock at fill, for hold time
+    has_stop_loss_order: bool = False
+    has_take_profit_order: bool = False
+    last_status_minute: int = -1  # Minute held of the last status log
+    profit_target: float = 0.0  # P&L that triggers the profit-based exit
+    pnl_sign: int = 1  # +1 long, -1 short
+
 
 class IntelligentSignalTrader:
     """
@@ -67,6 +176,29 @@ class IntelligentSignalTrader:
     - Comprehensive position monitoring and risk management
     """
     
+    __slots__ = (
+        # Configuration
+        'client', 'account_id', 'symbol', 'quantity', 'risk_per_trade',
+        'profit_target_multiplier', 'max_hold_minutes', 'profit_close_percentage',
+        'min_bars_for_signals', 'signal_eval_interval_s', 'auto_breakeven_enabled',
+        'running_tp_enabled', '_log_info', '_mh_cache',
+        # Signals
+        'signal_generator', '_last_signal_eval', '_last_signal_bar',
+        'last_signal_direction',
+        # Bar buffer
+        '_bars_np', '_bars_df', '_bar_ts', '_bar_open', '_bar_high', '_bar_low',
+        '_bar_close', '_bar_volume', '_bar_cursor', '_bar_count',
+        '_last_minute_ts', '_last_minute_dt',
+        # Stream plumbing
+        'stream', 'streaming_active', '_market_data_queue', '_tick_event', '_tick_queue',
+        # Position and order state
+        'is_running', 'current_position', 'position_entry_time', 'bracket_child_orders',
+        'position_monitoring_active', '_order_templates',
+        'trade_executor',
+        # Statistics
+        'trades_today', 'daily_pnl', 'total_trades',
+    )
+    
     def __init__(
         self,
         client: IronBeam,
@@ -87,7 +219,9 @@ class IntelligentSignalTrader:
         # Trade management parameters
         auto_breakeven_enabled: bool = True,
         running_tp_enabled: bool = True,
-        min_bars_for_signals: int = 50
+        min_bars_for_signals: int = 50,
+        signal_eval_interval_s: Optional[float] = None,
+        bars_cache_path: Optional[str] = None
     ):
         """Initialize the intelligent trading bot."""
         self.client = client
@@ -99,6 +233,12 @@ class IntelligentSignalTrader:
         self.max_hold_minutes = max_hold_minutes
         self.profit_close_percentage = profit_close_percentage
         self.min_bars_for_signals = min_bars_for_signals
+        # Signals are evaluated on bar close; optionally also every N seconds
+        self.signal_eval_interval_s = signal_eval_interval_s
+        # Log level is fixed at startup, so the INFO check is resolved once
+        self._log_info = logger.isEnabledFor(logging.INFO)
+        self._mh_cache = (-1, False)  # (epoch minute, is_market_hours result)
+        self._last_signal_eval = 0.0
         
         # Initialize signal generator
         self.signal_generator = OptimizedSignalGenerator(
@@ -112,15 +252,36 @@ class IntelligentSignalTrader:
         
         # Trading state
         self.is_running = False
-        self.current_position: Optional[Dict] = None
+        self.current_position: Optional[TradePosition] = None
         self.position_entry_time: Optional[datetime] = None
-        self.bars_data: List[Dict] = []
+
+        # 1-minute OHLCV bars in one column-major buffer, filled up to
+        # _bar_cursor. The column views feed update_bar and _bars_df wraps
+        # the same memory, so only the timestamp column is converted on the
+        # way to the generator.
+        # With bars_cache_path the buffer is a memmap, so a restart resumes
+        # with the bars already collected instead of warming up again.
+        self._bars_np = self._open_bar_buffer(bars_cache_path)
+        (self._bar_ts, self._bar_open, self._bar_high,
+         self._bar_low, self._bar_close, self._bar_volume) = np.asarray(self._bars_np).T
+        self._bars_df = pd.DataFrame(self._bars_np, columns=BAR_COLUMNS, copy=False)
+        self._bar_cursor = self._restored_bar_cursor()
+        self._bar_count = self._bar_cursor  # Total bars started, keeps growing across shifts
+        self._last_signal_bar = -1
+        self._market_data_queue: asyncio.Queue = asyncio.Queue()
+        self._last_minute_ts = 0  # Epoch seconds of the current minute bucket
+        self._last_minute_dt: Optional[datetime] = None
+        self._tick_event = asyncio.Event()  # Set whenever a quote for symbol arrives
+        self._tick_queue: asyncio.Queue = asyncio.Queue()  # Prices for monitor_position
         
         # Position management state
-        self.bracket_child_orders: Dict[str, bool] = {}  # Track SL/TP child order success
+        self.bracket_child_orders = BracketChildren()  # Track SL/TP child orders
         self.last_signal_direction: Optional[str] = None  # Track signal changes for reversal detection
         self.position_monitoring_active = False
         
+        # Pre-validated order templates for entries and protective orders
+        self._build_order_templates()
+        
         # WebSocket streaming
         self.stream: Optional[IronBeamStream] = None
         self.streaming_active = False
@@ -142,49 +303,99 @@ class IntelligentSignalTrader:
         logger.info(f"   Auto-breakeven: {'✅' if auto_breakeven_enabled else '❌'}")
         logger.info(f"   Running TP: {'✅' if running_tp_enabled else '❌'}")
 
+    @staticmethod
+    def _open_bar_buffer(path: Optional[str]) -> np.ndarray:
+        """Allocate the bar buffer, backed by the file at path if given."""
+        shape = (BAR_BUFFER_SIZE, len(BAR_COLUMNS))
+        if path is None:
+            return np.zeros(shape, dtype=np.float64, order='F')
+        
+        # Reuse the file only if it was written with the same buffer layout
+        size = BAR_BUFFER_SIZE * len(BAR_COLUMNS) * np.dtype(np.float64).itemsize
+        mode = 'r+' if os.path.exists(path) and os.path.getsize(path) == size else 'w+'
+        return np.memmap(path, dtype=np.float64, mode=mode, shape=shape, order='F')
+
+    def _restored_bar_cursor(self) -> int:
+        """Find where a persisted buffer left off (0 for a fresh one).
+
+        Bars before the cursor have increasing timestamps and anything past
+        it is left over from before the last shift, so the newest timestamp
+        marks the last bar written. Bars older than MAX_BARS minutes are
+        dropped, so a restart after a long pause doesn't feed the generator
+        a stale window as if it were recent history.
+        """
+        last = int(self._bar_ts.argmax())
+        if self._bar_ts[last] <= 0:
+            return 0
+        
+        first = int(np.searchsorted(self._bar_ts[:last + 1], wall_time() - MAX_BARS * 60))
+        count = last + 1 - first
+        if first:
+            self._bars_np[:count] = self._bars_np[first:last + 1]
+            # Clear the rest so the next restart finds the same newest bar
+            self._bars_np[count:] = 0
+        if not count:
+            logger.info("💾 Discarded cached bars older than %d minutes", MAX_BARS)
+            return 0
+        
+        logger.info(f"💾 Restored {count} bars, last bar at "
+                    f"{datetime.fromtimestamp(self._bar_ts[count - 1]):%Y-%m-%d %H:%M}")
+        return count
+
+    def _build_order_templates(self):
+        """Validate the fixed order fields once per (order type, side).
+
+        Orders are then stamped out with model_copy(update=...), which
+        copies the template and sets the prices without re-running the
+        field validators. Market orders need no prices and use the
+        template directly.
+        """
+        self._order_templates: Dict[tuple, OrderRequest] = {
+            (order_type, side): OrderRequest(
+                accountId=self.account_id,
+                exchSym=self.symbol,
+                side=side,
+                quantity=self.quantity,
+                orderType=order_type,
+                duration=DurationType.DAY,
+                waitForOrderId=True
+            )
+            for order_type in (OrderType.LIMIT, OrderType.STOP, OrderType.MARKET)
+            for side in (OrderSide.BUY, OrderSide.SELL)
+        }
+
     def is_market_hours(self) -> bool:
         """
         Check if we're in trading hours (6pm-4:30pm next day, Mon-Fri).
         Pauses Friday 4:30pm to Sunday 6pm.
         """
-        now = datetime.now()
-        current_time = now.time()
-        weekday = now.weekday()  # 0=Monday, 6=Sunday
-        
-        # Friday after 4:30pm - pause until Sunday 6pm
-        if weekday == 4 and current_time >= time(16, 30):  # Friday 4:30pm+
-            return False
-        
-        # Saturday - no trading
-        if weekday == 5:
-            return False
-        
-        # Sunday before 6pm - no trading
-        if weekday == 6 and current_time < time(18, 0):
-            return False
-        
-        # Monday-Thursday: 6pm-4:30pm next day
-        # Friday: 6pm-4:30pm (then pause)
-        # Sunday: 6pm+ (resume)
-        
-        # Between 6pm and midnight
-        if current_time >= time(18, 0):
-            return True
-        
-        # Between midnight and 4:30pm
-        if current_time <= time(16, 30):
-            return True
+        # The answer only changes on minute boundaries
+        minute = int(wall_time()) // 60
+        if minute == self._mh_cache[0]:
+            return self._mh_cache[1]
         
-        # Between 4:30pm and 6pm - no trading
-        return False
+        now = datetime.now()
+        result = bool(MARKET_HOURS_TABLE[now.weekday(), (now.hour * 60 + now.minute) // 30])
+        self._mh_cache = (minute, result)
+        return result
+
+    def _next_market_open(self, now: datetime) -> datetime:
+        """Start of the first open half-hour slot after now."""
+        slot = now.replace(minute=now.minute - now.minute % 30, second=0, microsecond=0)
+        for _ in range(MARKET_HOURS_TABLE.size):
+            slot += timedelta(minutes=30)
+            if MARKET_HOURS_TABLE[slot.weekday(), (slot.hour * 60 + slot.minute) // 30]:
+                break
+        return slot
 
     async def start_streaming(self):
         """Initialize and start WebSocket streaming."""
         try:
             logger.info("🔄 Starting WebSocket stream...")
             
-            # Create WebSocket stream
-            self.stream = IronBeamStream(self.client)
+            # Create WebSocket stream; quotes are small and frequent, so skip
+            # per-message compression and let the reader buffer freely
+            self.stream = IronBeamStream(self.client, compression=None, max_queue=None)
             
             # Register message callback
             self.stream.on_message(self.on_market_data)
@@ -193,8 +404,10 @@ class IntelligentSignalTrader:
             await self.stream.connect()
             logger.info("🌐 WebSocket connected")
             
-            # Start listener task
+            # Start listener task and the batch consumer it feeds
             listen_task = asyncio.create_task(self.stream.listen())
+            consumer_task = asyncio.create_task(self._consume_market_data())
+            tick_task = asyncio.create_task(self._consume_ticks())
             
             # Subscribe to symbol
             self.stream.subscribe_quotes([self.symbol])
@@ -204,77 +417,128 @@ class IntelligentSignalTrader:
             logger.info("✅ Streaming started")
             
             # Wait for listener task (runs forever)
-            await listen_task
+            try:
+                await listen_task
+            finally:
+                consumer_task.cancel()
+                tick_task.cancel()
             
         except Exception as e:
             logger.error(f"❌ Error in streaming: {e}")
             self.streaming_active = False
 
     async def on_market_data(self, msg):
-        """Handle incoming WebSocket messages."""
+        """Queue an incoming WebSocket message for the batch consumer."""
+        self._market_data_queue.put_nowait(msg)
+
+    async def _consume_market_data(self):
+        """Drain queued stream messages in batches and apply each batch once."""
+        md_queue = self._market_data_queue
+        while True:
+            batch = [await md_queue.get()]
+            while not md_queue.empty() and len(batch) < MARKET_DATA_BATCH_MAX:
+                batch.append(md_queue.get_nowait())
+            await self._ingest_batch(batch)
+
+    async def _consume_ticks(self):
+        """Run monitor_position once per burst of ticks with the latest price.
+
+        Also supervises it: unexpected errors are logged with a traceback and
+        the consumer keeps going, cancellation ends it.
+        """
+        tick_queue = self._tick_queue
+        while True:
+            price = await tick_queue.get()
+            await asyncio.sleep(TICK_COALESCE_S)
+            while not tick_queue.empty():
+                price = tick_queue.get_nowait()
+            try:
+                await self.monitor_position(price)
+            except Exception:
+                logger.exception("❌ Unexpected error in position monitor")
+
+    async def _ingest_batch(self, batch: List[Dict]):
+        """Handle a batch of WebSocket messages.
+
+        Quotes for the traded symbol are reduced to first/high/low/last mid prices, so the whole
+        batch costs one bar update, at most one signal evaluation and one
+        position check.
+        """
         try:
-            if 'q' in msg and msg['q']:
-                for quote in msg['q']:
-                    symbol = quote.get('s')
+            symbol = self.symbol
+            prices = []
+            for msg in batch:
+                # Drop other symbols before touching any quote fields
+                quotes = [q for q in msg.get('q') or () if q.get('s') == symbol]
+                for quote in quotes:
                     bid = quote.get('b')
                     ask = quote.get('a')
-                    last = quote.get('l')
-                    
-                    if symbol == self.symbol and bid and ask:
-                        # Calculate OHLC bar data (simplified 1-minute bars)
-                        current_time = datetime.now()
-                        current_minute = current_time.replace(second=0, microsecond=0)
-                        
-                        price = (bid + ask) / 2
-                        
-                        # Update or create current bar
-                        if (not self.bars_data or 
-                            self.bars_data[-1]['timestamp'] < current_minute):
-                            # New bar
-                            new_bar = {
-                                'timestamp': current_minute,
-                                'open': price,
-                                'high': price,
-                                'low': price,
-                                'close': price,
-                                'volume': 0
-                            }
-                            self.bars_data.append(new_bar)
-                            logger.debug(f"📊 New bar: {current_minute} O:{price:.2f}")
-                        else:
-                            # Update current bar
-                            current_bar = self.bars_data[-1]
-                            current_bar['high'] = max(current_bar['high'], price)
-                            current_bar['low'] = min(current_bar['low'], price)
-                            current_bar['close'] = price
-                        
-                        # Limit bars to last 200 for memory efficiency
-                        if len(self.bars_data) > 200:
-                            self.bars_data = self.bars_data[-200:]
-                        
-                        # Check if we have enough data for signals
-                        if len(self.bars_data) >= self.min_bars_for_signals:
-                            await self.process_signals()
-                        
-                        # Monitor existing position
-                        if self.current_position:
-                            await self.monitor_position(price)
+                    if bid and ask:
+                        prices.append((bid + ask) / 2)
+            
+            if not prices:
+                return
+            price = prices[-1]
+            self._tick_event.set()
+            
+            # Calculate OHLC bar data (simplified 1-minute bars); the datetime
+            # is only rebuilt when the wall clock enters a new minute
+            t = int(wall_time())
+            minute_ts = t - t % 60
+            if minute_ts != self._last_minute_ts:
+                self._last_minute_ts = minute_ts
+                self._last_minute_dt = datetime.fromtimestamp(minute_ts)
+            current_minute = self._last_minute_dt
+            
+            # Update or create current bar
+            cursor = update_bar(
+                self._bar_ts, self._bar_open, self._bar_high,
+                self._bar_low, self._bar_close, self._bar_volume,
+                self._bar_cursor, MAX_BARS, float(minute_ts),
+                prices[0], max(prices), min(prices), price
+            )
+            bar_closed = cursor != self._bar_cursor
+            if bar_closed:
+                self._bar_count += 1
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(NEW_BAR_LOG_FMT, current_minute, prices[0])
+            self._bar_cursor = cursor
+            
+            # Check if we have enough data for signals; only re-run
+            # them when a bar closes (or the heartbeat is due)
+            if self._bar_cursor >= self.min_bars_for_signals:
+                heartbeat = (
+                    self.signal_eval_interval_s is not None and
+                    monotonic() - self._last_signal_eval >= self.signal_eval_interval_s
+                )
+                if bar_closed or heartbeat:
+                    await self.process_signals(force=heartbeat)
+            
+            # Monitor existing position (coalesced in _consume_ticks)
+            if self.current_position:
+                self._tick_queue.put_nowait(price)
                         
         except Exception as e:
-            logger.error(f"❌ Error processing market data: {e}")
+            logger.error("❌ Error processing market data: %s", e)
 
-    async def process_signals(self):
-        """Process trading signals and execute trades."""
+    async def process_signals(self, force: bool = False):
+        """Process trading signals and execute trades.
+
+        Args:
+            force: Re-evaluate even if no new bar has started since the last run
+        """
         try:
             if not self.is_market_hours():
                 return
             
-            # Convert bars to DataFrame
-            df = pd.DataFrame(self.bars_data)
-            df.columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+            # Nothing new to evaluate until another bar has started
+            if not force and self._bar_count == self._last_signal_bar:
+                return
+            self._last_signal_bar = self._bar_count
+            self._last_signal_eval = monotonic()
             
             # Generate signals
-            signal_details = self.signal_generator.get_signal_details(df)
+            signal_details = self._generate_signal_details()
             
             current_signal = signal_details['final_signal']
             adx_strength = signal_details['adx_trend_strength']
@@ -282,15 +546,15 @@ class IntelligentSignalTrader:
             
             # Log signal status every 5 minutes
             now = datetime.now()
-            if now.minute % 5 == 0 and now.second < 5:
-                position_status = f" | Position: {self.current_position['side']} {self.symbol}" if self.current_position else " | No Position"
-                logger.info(f"📡 Signal: {current_signal} | ST:{signal_details['supertrend']} "
-                           f"OB/OS:{signal_details['overbought_oversold']} TR:{signal_details['trending']} | "
-                           f"Votes: Buy={signal_details['buy_votes']}/3, Sell={signal_details['sell_votes']}/3 | "
-                           f"ADX: {adx_value:.1f} ({adx_strength}){position_status}")
+            if now.minute % 5 == 0 and now.second < 5 and logger.isEnabledFor(logging.INFO):
+                position_status = f" | Position: {self.current_position.side} {self.symbol}" if self.current_position else " | No Position"
+                logger.info(SIGNAL_LOG_FMT, current_signal, signal_details['supertrend'],
+                            signal_details['overbought_oversold'], signal_details['trending'],
+                            signal_details['buy_votes'], signal_details['sell_votes'],
+                            adx_value, adx_strength, position_status)
             
             # If we have an open position, check for reversal signals
-            if self.current_position and self.current_position['filled']:
+            if self.current_position and self.current_position.filled:
                 await self.check_signal_reversal(current_signal, signal_details)
                 # Update last signal for trend monitoring
                 self.last_signal_direction = current_signal
@@ -310,15 +574,32 @@ class IntelligentSignalTrader:
             self.last_signal_direction = current_signal
                 
         except Exception as e:
-            logger.error(f"❌ Error processing signals: {e}")
+            logger.error("❌ Error processing signals: %s", e)
+
+    def _generate_signal_details(self) -> Dict:
+        """Run the signal generator over the last MAX_BARS bars of the buffer.
+
+        The buffer stores timestamps as epoch seconds; the generator is
+        handed naive local datetimes, as it was when bars were kept as dicts.
+        """
+        end = self._bar_cursor
+        window = self._bars_df.iloc[max(0, end - MAX_BARS):end]
+        return self.signal_generator.get_signal_details(
+            window.assign(timestamp=[datetime.fromtimestamp(ts) for ts in window['timestamp']])
+        )
 
     async def check_signal_reversal(self, current_signal: str, signal_details: Dict):
         """Check if current signals indicate a reversal and close position if needed."""
         try:
-            if not self.current_position or not self.current_position['filled']:
+            # A repeated non-directional signal can never trigger: trend
+            # weakening needs a signal change and BUY/SELL isn't involved
+            if current_signal == self.last_signal_direction and current_signal not in ('BUY', 'SELL'):
+                return
+            
+            if not self.current_position or not self.current_position.filled:
                 return
             
-            position_side = self.current_position['side']
+            position_side = self.current_position.side
             adx_value = signal_details['adx']
             
             # Determine if this is a strong reversal signal
@@ -326,10 +607,11 @@ class IntelligentSignalTrader:
             reversal_strength = 0
             
             # Check for signal direction change with strong ADX
-            if current_signal in ['BUY', 'SELL']:
-                # Strong reversal: opposite signal with 2+ votes and ADX >= 30
-                if ((position_side == 'BUY' and current_signal == 'SELL' and signal_details['sell_votes'] >= 2) or
-                    (position_side == 'SELL' and current_signal == 'BUY' and signal_details['buy_votes'] >= 2)):
+            if current_signal in ('BUY', 'SELL'):
+                # Reversal: opposite signal with 2+ votes and ADX >= 25 (strong at 30).
+                # ADX is compared first since most evaluations fail it.
+                if (adx_value >= 25 and current_signal != position_side and
+                        signal_details['sell_votes' if current_signal == 'SELL' else 'buy_votes'] >= 2):
                     
                     if adx_value >= 30:  # Strong ADX confirmation
                         is_reversal = True
@@ -358,7 +640,7 @@ class IntelligentSignalTrader:
         """Place a new trade with intelligent risk management."""
         try:
             # Get current market price
-            quotes = self.client.get_quotes([self.symbol])
+            quotes = await self._run_blocking(self.client.get_quotes, [self.symbol])
             if not quotes or not quotes.quotes:
                 logger.error(f"❌ Could not get quote for {self.symbol}")
                 return
@@ -402,25 +684,14 @@ class IntelligentSignalTrader:
             logger.info(f"{'='*60}\n")
             
             # Create bracket order with trade management features
-            order = OrderRequest(
-                accountId=self.account_id,
-                exchSym=self.symbol,
-                side=side,
-                quantity=self.quantity,
-                orderType=OrderType.LIMIT,
-                limitPrice=mid_price,
-                duration=DurationType.DAY,
-                stopPrice=None,
-                stopLoss=stop_loss_price,
-                takeProfit=take_profit_price,
-                stopLossOffset=None,
-                takeProfitOffset=None,
-                trailingStop=None,
-                waitForOrderId=True
-            )
+            order = self._order_templates[(OrderType.LIMIT, side)].model_copy(update={
+                'limit_price': mid_price,
+                'stop_loss': stop_loss_price,
+                'take_profit': take_profit_price
+            })
             
             # Place the order
-            response = self.client.place_order(self.account_id, order)
+            response = await self._run_blocking(self.client.place_order, self.account_id, order)
             
             if response and hasattr(response, 'order_id'):
                 order_id = response.order_id
@@ -428,20 +699,18 @@ class IntelligentSignalTrader:
                 logger.info(f"   Order ID: {order_id}")
                 
                 # Track position
-                self.current_position = {
-                    'order_id': order_id,
-                    'side': direction,
-                    'entry_price': mid_price,
-                    'stop_loss': stop_loss_price,
-                    'take_profit': take_profit_price,
-                    'quantity': self.quantity,
-                    'filled': False,
-                    'fill_time': None,
-                    'has_stop_loss_order': False,
-                    'has_take_profit_order': False
-                }
+                self.current_position = TradePosition(
+                    order_id=order_id,
+                    side=direction,
+                    entry_price=mid_price,
+                    stop_loss=stop_loss_price,
+                    take_profit=take_profit_price,
+                    quantity=self.quantity,
+                    profit_target=self.risk_per_trade * self.profit_close_percentage * 0.01,
+                    pnl_sign=1 if direction == 'BUY' else -1
+                )
                 self.position_entry_time = datetime.now()
-                self.bracket_child_orders = {'stop_loss': False, 'take_profit': False}
+                self.bracket_child_orders = BracketChildren()
                 self.position_monitoring_active = True
                 
                 # Start monitoring for fill
@@ -454,16 +723,32 @@ class IntelligentSignalTrader:
         except Exception as e:
             logger.error(f"❌ Error placing trade: {e}")
 
+    async def _run_blocking(self, func, *args):
+        """Run a blocking IronBeam client call in a worker thread.
+
+        Keeps the event loop (and with it the WebSocket reader) responsive
+        during the REST round-trip.
+        """
+        return await asyncio.to_thread(func, *args)
+
+    async def _order_filled(self, order_id: str) -> bool:
+        """Check over REST whether order_id has filled."""
+        orders_response = await self._run_blocking(self.client.get_orders, self.account_id)
+        for order in getattr(orders_response, 'orders', None) or ():
+            if order.order_id == order_id:
+                return order.status == OrderStatus.FILLED
+        return False
+
     async def monitor_order_fill(self, order_id: str):
         """Monitor order until filled, then set up trade management."""
         try:
             logger.info("⏳ Monitoring for order fill...")
             
-            while self.current_position and not self.current_position['filled']:
-                await asyncio.sleep(2)
+            while self.current_position and not self.current_position.filled:
+                await asyncio.sleep(ORDER_FILL_POLL_S)
                 
                 # Check order status and child orders
-                orders_response = self.client.get_orders(self.account_id)
+                orders_response = await self._run_blocking(self.client.get_orders, self.account_id)
                 
                 if orders_response and hasattr(orders_response, 'orders'):
                     parent_filled = False
@@ -474,18 +759,19 @@ class IntelligentSignalTrader:
                             parent_filled = True
                             
                             # Order filled!
-                            self.current_position['filled'] = True
-                            self.current_position['fill_time'] = datetime.now()
+                            self.current_position.filled = True
+                            self.current_position.fill_time = datetime.now()
+                            self.current_position.fill_monotonic = asyncio.get_running_loop().time()
                             
                             # Get actual fill price
-                            fills = self.client.get_fills(self.account_id)
+                            fills = await self._run_blocking(self.client.get_fills, self.account_id)
                             if fills and hasattr(fills, 'fills'):
                                 for fill in fills.fills:
                                     if fill.order_id == order_id:
-                                        self.current_position['entry_price'] = fill.price
+                                        self.current_position.entry_price = fill.price
                                         break
                             
-                            logger.info(f"✅ Order filled! Entry: {self.current_position['entry_price']:.2f}")
+                            logger.info(f"✅ Order filled! Entry: {self.current_position.entry_price:.2f}")
                             
                             # Set up SDK trade management
                             await self.setup_trade_management(order_id)
@@ -497,12 +783,12 @@ class IntelligentSignalTrader:
                         elif parent_filled and hasattr(order, 'parent_order_id') and str(order.parent_order_id) == str(order_id):
                             # This is a child order of our bracket
                             if 'STOP' in str(order.order_type) or order.stop_price:
-                                self.current_position['has_stop_loss_order'] = True
-                                self.bracket_child_orders['stop_loss'] = True
+                                self.current_position.has_stop_loss_order = True
+                                self.bracket_child_orders.stop_loss_id = order.order_id
                                 logger.info(f"✅ Stop-loss child order detected: {order.order_id}")
-                            elif order.limit_price and order.limit_price != self.current_position['entry_price']:
-                                self.current_position['has_take_profit_order'] = True
-                                self.bracket_child_orders['take_profit'] = True
+                            elif order.limit_price and order.limit_price != self.current_position.entry_price:
+                                self.current_position.has_take_profit_order = True
+                                self.bracket_child_orders.take_profit_id = order.order_id
                                 logger.info(f"✅ Take-profit child order detected: {order.order_id}")
                     
                     # If parent is filled, check if we need to create missing child orders
@@ -516,7 +802,7 @@ class IntelligentSignalTrader:
     async def check_and_create_missing_orders(self, parent_order_id: str):
         """Create stop-loss or take-profit orders if bracket child orders weren't successful."""
         try:
-            if not self.current_position or not self.current_position['filled']:
+            if not self.current_position or not self.current_position.filled:
                 return
             
             # Wait a moment for child orders to appear
@@ -525,15 +811,19 @@ class IntelligentSignalTrader:
             missing_orders = []
             
             # Check if stop-loss order is missing
-            if not self.bracket_child_orders['stop_loss']:
+            if not self.bracket_child_orders.stop_loss_id:
                 missing_orders.append('stop_loss')
                 logger.warning("⚠️  Stop-loss child order missing from bracket - will create manually")
             
             # Check if take-profit order is missing  
-            if not self.bracket_child_orders['take_profit']:
+            if not self.bracket_child_orders.take_profit_id:
                 missing_orders.append('take_profit')
                 logger.warning("⚠️  Take-profit child order missing from bracket - will create manually")
             
+            # Both legs missing: re-attach them to the parent in one request
+            if len(missing_orders) == 2 and await self.attach_bracket(parent_order_id):
+                return
+            
             # Create missing orders
             for order_type in missing_orders:
                 await self.create_protective_order(order_type, parent_order_id)
@@ -541,6 +831,35 @@ class IntelligentSignalTrader:
         except Exception as e:
             logger.error(f"❌ Error checking missing orders: {e}")
 
+    async def attach_bracket(self, parent_order_id: str) -> bool:
+        """Set stop-loss and take-profit on the parent order with a single update.
+
+        Returns:
+            True if the update was accepted, False if the legs have to be
+            created as separate orders instead.
+        """
+        position = self.current_position
+        update = OrderUpdateRequest(
+            orderId=parent_order_id,
+            stopLoss=position.stop_loss,
+            takeProfit=position.take_profit
+        )
+        
+        logger.info(f"🛡️  Re-attaching bracket: SL {position.stop_loss:.2f} / TP {position.take_profit:.2f}")
+        try:
+            await self._run_blocking(self.client.update_order, self.account_id, parent_order_id, update)
+        except Exception as e:
+            logger.warning(f"⚠️  Bracket update rejected ({e}) - creating orders individually")
+            return False
+        
+        position.has_stop_loss_order = True
+        position.has_take_profit_order = True
+        # The legs are managed through the parent order
+        self.bracket_child_orders.stop_loss_id = parent_order_id
+        self.bracket_child_orders.take_profit_id = parent_order_id
+        logger.info("✅ Bracket re-attached to parent order")
+        return True
+
     async def create_protective_order(self, order_type: str, parent_order_id: str):
         """Create a stop-loss or take-profit order manually."""
         try:
@@ -551,64 +870,38 @@ class IntelligentSignalTrader:
             
             if order_type == 'stop_loss':
                 # Create stop-loss order
-                stop_side = OrderSide.SELL if position['side'] == 'BUY' else OrderSide.BUY
+                stop_side = OrderSide.SELL if position.side == 'BUY' else OrderSide.BUY
                 
-                logger.info(f"🛡️  Creating manual stop-loss order at {position['stop_loss']:.2f}")
+                logger.info(f"🛡️  Creating manual stop-loss order at {position.stop_loss:.2f}")
                 
-                stop_order = OrderRequest(
-                    accountId=self.account_id,
-                    exchSym=self.symbol,
-                    side=stop_side,
-                    quantity=self.quantity,
-                    orderType=OrderType.STOP,
-                    duration=DurationType.DAY,
-                    limitPrice=None,
-                    stopPrice=position['stop_loss'],
-                    stopLoss=None,
-                    takeProfit=None,
-                    stopLossOffset=None,
-                    takeProfitOffset=None,
-                    trailingStop=None,
-                    waitForOrderId=True
+                stop_order = self._order_templates[(OrderType.STOP, stop_side)].model_copy(
+                    update={'stop_price': position.stop_loss}
                 )
                 
-                response = self.client.place_order(self.account_id, stop_order)
+                response = await self._run_blocking(self.client.place_order, self.account_id, stop_order)
                 
                 if response and hasattr(response, 'order_id'):
-                    self.current_position['has_stop_loss_order'] = True
-                    self.bracket_child_orders['stop_loss'] = True
+                    self.current_position.has_stop_loss_order = True
+                    self.bracket_child_orders.stop_loss_id = response.order_id
                     logger.info(f"✅ Manual stop-loss created: {response.order_id}")
                 else:
                     logger.error(f"❌ Failed to create stop-loss: {response}")
             
             elif order_type == 'take_profit':
                 # Create take-profit order
-                tp_side = OrderSide.SELL if position['side'] == 'BUY' else OrderSide.BUY
+                tp_side = OrderSide.SELL if position.side == 'BUY' else OrderSide.BUY
                 
-                logger.info(f"🎯 Creating manual take-profit order at {position['take_profit']:.2f}")
+                logger.info(f"🎯 Creating manual take-profit order at {position.take_profit:.2f}")
                 
-                tp_order = OrderRequest(
-                    accountId=self.account_id,
-                    exchSym=self.symbol,
-                    side=tp_side,
-                    quantity=self.quantity,
-                    orderType=OrderType.LIMIT,
-                    duration=DurationType.DAY,
-                    limitPrice=position['take_profit'],
-                    stopPrice=None,
-                    stopLoss=None,
-                    takeProfit=None,
-                    stopLossOffset=None,
-                    takeProfitOffset=None,
-                    trailingStop=None,
-                    waitForOrderId=True
+                tp_order = self._order_templates[(OrderType.LIMIT, tp_side)].model_copy(
+                    update={'limit_price': position.take_profit}
                 )
                 
-                response = self.client.place_order(self.account_id, tp_order)
+                response = await self._run_blocking(self.client.place_order, self.account_id, tp_order)
                 
                 if response and hasattr(response, 'order_id'):
-                    self.current_position['has_take_profit_order'] = True
-                    self.bracket_child_orders['take_profit'] = True
+                    self.current_position.has_take_profit_order = True
+                    self.bracket_child_orders.take_profit_id = response.order_id
                     logger.info(f"✅ Manual take-profit created: {response.order_id}")
                 else:
                     logger.error(f"❌ Failed to create take-profit: {response}")
@@ -628,17 +921,17 @@ class IntelligentSignalTrader:
                 return
             
             # Create position state for SDK trade manager
-            position_side = OrderSide.BUY if self.current_position['side'] == 'BUY' else OrderSide.SELL
+            position_side = OrderSide.BUY if self.current_position.side == 'BUY' else OrderSide.SELL
             
             position_state = PositionState(
                 order_id=order_id,
                 account_id=self.account_id,
                 symbol=self.symbol,
                 side=position_side,
-                entry_price=self.current_position['entry_price'],
-                quantity=self.current_position['quantity'],
-                current_stop_loss=self.current_position['stop_loss'],
-                current_take_profit=self.current_position['take_profit']
+                entry_price=self.current_position.entry_price,
+                quantity=self.current_position.quantity,
+                current_stop_loss=self.current_position.stop_loss,
+                current_take_profit=self.current_position.take_profit
             )
             
             # Initialize trade executor if not already done
@@ -682,52 +975,51 @@ class IntelligentSignalTrader:
     async def monitor_position(self, current_price: float):
         """Monitor existing position for time-based and profit-based exits."""
         try:
-            if not self.current_position or not self.current_position['filled']:
+            if not self.current_position or not self.current_position.filled:
                 return
             
             position = self.current_position
-            entry_price = position['entry_price']
-            is_long = position['side'] == 'BUY'
-            
-            # Calculate current profit/loss
-            if is_long:
-                pnl = (current_price - entry_price) * self.quantity
-            else:
-                pnl = (entry_price - current_price) * self.quantity
             
-            # Calculate time held
-            time_held = datetime.now() - position['fill_time']
-            minutes_held = time_held.total_seconds() / 60
+            # Time-based (max hold) and profit-based (20% of risk) exits
+            action, pnl, secs_held = evaluate_position(
+                position.entry_price, current_price, position.quantity, position.pnl_sign,
+                position.fill_monotonic, asyncio.get_running_loop().time(),
+                position.profit_target, self.max_hold_minutes * 60.0
+            )
             
-            # Check time-based exit (max hold time)
-            if minutes_held >= self.max_hold_minutes:
+            if action == CLOSE_TIME_LIMIT:
                 logger.info(f"⏰ Max hold time reached ({self.max_hold_minutes} min) - closing position")
                 await self.close_position("TIME_LIMIT")
                 return
             
-            # Check profit-based exit (20% of risk)
-            profit_target = self.risk_per_trade * (self.profit_close_percentage / 100)
-            if pnl >= profit_target:
-                logger.info(f"💰 Profit target reached (${pnl:.2f} >= ${profit_target:.2f}) - closing position")
+            if action == CLOSE_PROFIT_TARGET:
+                logger.info(f"💰 Profit target reached (${pnl:.2f} >= ${position.profit_target:.2f}) - closing position")
                 await self.close_position("PROFIT_TARGET")
                 return
             
-            # Log position status every 10 minutes
-            if int(minutes_held) % 10 == 0 and int(time_held.total_seconds()) % 600 < 5:
-                profit_pct = (pnl / self.risk_per_trade) * 100
-                sl_status = "✅" if self.current_position.get('has_stop_loss_order', False) else "❌"
-                tp_status = "✅" if self.current_position.get('has_take_profit_order', False) else "❌"
+            int_min = int(secs_held) // 60
+            
+            # Log position status every 10 minutes (once per mark)
+            if int_min != position.last_status_minute and int_min % 10 == 0:
+                position.last_status_minute = int_min
+                has_sl = position.has_stop_loss_order
+                has_tp = position.has_take_profit_order
                 
-                logger.info(f"📊 Position status: {position['side']} {self.symbol} | "
-                           f"P&L: ${pnl:.2f} ({profit_pct:+.1f}%) | "
-                           f"Time: {int(minutes_held)}m/{self.max_hold_minutes}m | "
-                           f"SL: {sl_status} TP: {tp_status}")
+                if self._log_info:
+                    profit_pct = (pnl / self.risk_per_trade) * 100
+                    sl_status = "✅" if has_sl else "❌"
+                    tp_status = "✅" if has_tp else "❌"
+                    logger.info(f"📊 Position status: {position.side} {self.symbol} | "
+                               f"P&L: ${pnl:.2f} ({profit_pct:+.1f}%) | "
+                               f"Time: {int_min}m/{self.max_hold_minutes}m | "
+                               f"SL: {sl_status} TP: {tp_status}")
                 
                 # Check if we need to create missing protective orders
-                if not self.current_position.get('has_stop_loss_order', False) or not self.current_position.get('has_take_profit_order', False):
-                    await self.check_and_create_missing_orders(position['order_id'])
+                if not has_sl or not has_tp:
+                    await self.check_and_create_missing_orders(position.order_id)
                 
-        except Exception as e:
+        except (AttributeError, TypeError, ValueError) as e:
+            # Position state changed under us (e.g. closed mid-check)
             logger.error(f"❌ Error monitoring position: {e}")
 
     async def close_position(self, reason: str):
@@ -737,51 +1029,50 @@ class IntelligentSignalTrader:
                 return
             
             position = self.current_position
-            close_side = OrderSide.SELL if position['side'] == 'BUY' else OrderSide.BUY
+            close_side = OrderSide.SELL if position.side == 'BUY' else OrderSide.BUY
             
-            logger.info(f"\n{'='*60}")
-            logger.info(f"🔴 CLOSING POSITION - {reason}")
-            logger.info(f"{'='*60}")
-            logger.info(f"Position: {position['side']} {self.quantity} {self.symbol}")
-            logger.info(f"Entry: {position['entry_price']:.2f}")
-            logger.info(f"Closing with: {close_side.value} MARKET order")
+            if self._log_info:
+                logger.info(f"\n{'='*60}")
+                logger.info(f"🔴 CLOSING POSITION - {reason}")
+                logger.info(f"{'='*60}")
+                logger.info(f"Position: {position.side} {self.quantity} {self.symbol}")
+                logger.info(f"Entry: {position.entry_price:.2f}")
+                logger.info(f"Closing with: {close_side.value} MARKET order")
             
-            # Place market close order
-            close_order = OrderRequest(
-                accountId=self.account_id,
-                exchSym=self.symbol,
-                side=close_side,
-                quantity=self.quantity,
-                orderType=OrderType.MARKET,
-                duration=DurationType.DAY,
-                limitPrice=None,
-                stopPrice=None,
-                stopLoss=None,
-                takeProfit=None,
-                stopLossOffset=None,
-                takeProfitOffset=None,
-                trailingStop=None,
-                waitForOrderId=True
-            )
+            # Place market close order; it has no prices, so the template
+            # is sent as-is (place_order only serializes it)
+            close_order = self._order_templates[(OrderType.MARKET, close_side)]
             
-            response = self.client.place_order(self.account_id, close_order)
+            response = await self._run_blocking(self.client.place_order, self.account_id, close_order)
             
-            if response and hasattr(response, 'order_id'):
-                logger.info(f"✅ Close order placed - Order ID: {response.order_id}")
+            try:
+                close_order_id = response.order_id
+            except AttributeError:
+                close_order_id = None
+            
+            if close_order_id:
+                logger.info(f"✅ Close order placed - Order ID: {close_order_id}")
                 
                 # Stop SDK trade management for this position
-                if self.trade_executor and position['order_id']:
-                    self.trade_executor.remove_position(position['order_id'])
+                if self.trade_executor and position.order_id:
+                    self.trade_executor.remove_position(position.order_id)
                     logger.info("🛡️  SDK trade management stopped for position")
                 
                 # Clear position tracking
                 self.current_position = None
                 self.position_entry_time = None
-                self.bracket_child_orders = {}
+                self.bracket_child_orders = BracketChildren()
                 self.position_monitoring_active = False
                 
-                # Brief pause to let the order fill
-                await asyncio.sleep(3)
+                # Poll the close order until it fills, giving up after
+                # CLOSE_FILL_TIMEOUT_S
+                loop = asyncio.get_running_loop()
+                deadline = loop.time() + CLOSE_FILL_TIMEOUT_S
+                while not await self._order_filled(str(close_order_id)):
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    await asyncio.sleep(min(ORDER_FILL_POLL_S, remaining))
                 logger.info(f"✅ Position closed - Reason: {reason}\n")
                 
             else:
@@ -809,6 +1100,10 @@ class IntelligentSignalTrader:
                 await self.stream.close()
                 logger.info("🌐 WebSocket closed")
             
+            # Persist the bar buffer for the next start
+            if isinstance(self._bars_np, np.memmap):
+                self._bars_np.flush()
+            
             # Final statistics
             logger.info(f"\n📊 Session Summary:")
             logger.info(f"   Trades today: {self.trades_today}")
@@ -841,15 +1136,22 @@ class IntelligentSignalTrader:
                 try:
                     # Check market hours
                     if not self.is_market_hours():
-                        # Market closed - log status and wait
+                        # Market closed - sleep until the open, waking every
+                        # 30 minutes to log status
                         now = datetime.now()
-                        if now.minute % 30 == 0:  # Log every 30 minutes during off-hours
-                            logger.info("😴 Market closed - bot paused (Fri 4:30pm - Sun 6pm)")
-                        await asyncio.sleep(60)  # Check every minute
+                        next_open = self._next_market_open(now)
+                        logger.info(f"😴 Market closed - bot paused until {next_open:%a %H:%M}")
+                        delay = (next_open - now).total_seconds()
+                        await asyncio.sleep(min(max(delay, 1.0), 1800))
                         continue
                     
-                    # Market open - normal operation
-                    await asyncio.sleep(5)  # Main loop delay
+                    # Market open - wake on the next tick, or after a minute of
+                    # silence to flag a stalled feed
+                    try:
+                        await asyncio.wait_for(self._tick_event.wait(), timeout=60)
+                    except asyncio.TimeoutError:
+                        logger.warning(f"⚠️  No quotes for {self.symbol} in the last 60s")
+                    self._tick_event.clear()
                     
                 except KeyboardInterrupt:
                     logger.info("\n⚠️  Shutdown requested by user")
@@ -883,6 +1185,7 @@ async def main():
         PROFIT_TARGET_MULT = 2.0  # 2:1 reward:risk ratio
         MAX_HOLD_MINUTES = 300   # 5 hours max hold
         PROFIT_CLOSE_PCT = 20.0  # Close at 20% of risk as profit
+        BARS_CACHE_PATH = f"bars_{SYMBOL.replace(':', '_')}.dat"  # Survives restarts
         
         logger.info("🔗 Initializing IronBeam client...")
         client = IronBeam(api_key=api_key, username=username, password=password, mode="demo")
@@ -911,7 +1214,8 @@ async def main():
             max_hold_minutes=MAX_HOLD_MINUTES,
             profit_close_percentage=PROFIT_CLOSE_PCT,
             auto_breakeven_enabled=True,
-            running_tp_enabled=True
+            running_tp_enabled=True,
+            bars_cache_path=BARS_CACHE_PATH
         )
         
         # Run the bot
@@ -941,8 +1245,10 @@ if __name__ == "__main__":
     2. Run: python intelligent_signal_trader.py
     3. Press Ctrl+C to stop gracefully
     """
+    # uvloop.run replaces the deprecated uvloop.install() policy swap (uvloop >= 0.18)
+    run = uvloop.run if uvloop is not None else asyncio.run
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         logger.info("\n⚠️  Script interrupted by user")
     except Exception as e:
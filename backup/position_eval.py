@@ -0,0 +1,48 @@
+"""
+Exit checks for the intelligent signal trader's open position.
+
+Kept free of I/O and fully annotated so it can be compiled with mypyc
+(``mypyc position_eval.py`` in this directory); the trader imports the
+compiled extension transparently when it is present.
+"""
+
+from typing import Tuple
+
+HOLD = 0
+CLOSE_TIME_LIMIT = 1
+CLOSE_PROFIT_TARGET = 2
+
+
+def evaluate_position(
+    entry: float,
+    current: float,
+    qty: int,
+    sign: int,
+    fill_mono: float,
+    now_mono: float,
+    profit_target: float,
+    max_secs: float,
+) -> Tuple[int, float, float]:
+    """Decide whether the position should be closed at the current price.
+
+    Args:
+        entry: Entry price
+        current: Current price
+        qty: Position size
+        sign: +1 for long, -1 for short
+        fill_mono: Monotonic clock reading at fill
+        now_mono: Current monotonic clock reading
+        profit_target: P&L at which to take profit
+        max_secs: Maximum hold time in seconds
+
+    Returns:
+        Tuple of (action code, P&L, seconds held). The max hold time is
+        checked before the profit target.
+    """
+    pnl = (current - entry) * qty * sign
+    secs_held = now_mono - fill_mono
+    if secs_held >= max_secs:
+        return CLOSE_TIME_LIMIT, pnl, secs_held
+    if pnl >= profit_target:
+        return CLOSE_PROFIT_TARGET, pnl, secs_held
+    return HOLD, pnl, secs_held
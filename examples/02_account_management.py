@@ -2,214 +2,283 @@
 Example 2: Account Management
 Demonstrates account balance, positions, risk, and fills
 """
-from ironbeam import IronBeam, AccountBalanceRequest, BalanceType
+import asyncio
+import sys
+from collections import defaultdict
+
+import numpy as np
+
+from ironbeam import get_client, AccountBalanceRequest, BalanceType, OrderSide
 
 # Demo credentials
 DEMO_USERNAME = "51392077"
 DEMO_PASSWORD = "207341"
 DEMO_KEY = "cfcf8651c7914cf988ffc026db9849b1"
 
+# Most examples allowed to have requests in flight at once
+MAX_CONCURRENT_EXAMPLES = 8
+
+# Per-row templates for the position and fill loops
+_POS_LINE = (
+    "\n  Position {}:\n"
+    "    Symbol: {}\n"
+    "    Side: {}\n"
+    "    Quantity: {}\n"
+    "    Entry Price: ${:,.2f}"
+).format
+_FILL_LINE = (
+    "    Order ID: {}\n"
+    "    Symbol: {}\n"
+    "    Side: {}\n"
+    "    Quantity: {}"
+).format
+_FILL_SUMMARY_LINE = (
+    "\n    {}:\n"
+    "      Total Fills: {}\n"
+    "      Buy Quantity: {}\n"
+    "      Sell Quantity: {}\n"
+    "      Net Position: {:+.0f}"
+).format
+
 
 def setup_client():
-    """Initialize and authenticate client."""
-    client = IronBeam(
+    """Get the shared authenticated client."""
+    client = get_client(
         api_key=DEMO_KEY,
         username=DEMO_USERNAME,
         password=DEMO_PASSWORD
     )
-    client.authenticate()
-    trader_info = client.get_trader_info()
-    return client, trader_info.accounts[0]
+    trader = client.get_trader_info()
+    return client, trader
 
 
 def example_account_balance(client, account_id):
     """Get account balance with different methods."""
-    print("\n" + "="*70)
-    print("EXAMPLE 1: Account Balance")
-    print("="*70)
+    out = []
+    out.append("\n" + "="*70)
+    out.append("EXAMPLE 1: Account Balance")
+    out.append("="*70)
 
     # Method 1: Simple string parameter (legacy)
-    print("\n1. Using simple string parameter:")
+    out.append("\n1. Using simple string parameter:")
     balance = client.get_account_balance(account_id)
 
-    print(f"  Account ID: {account_id}")
-    print(f"  Status: {balance.status}")
+    out.append(f"  Account ID: {account_id}")
+    out.append(f"  Status: {balance.status}")
 
     for bal in balance.balances:
-        print(f"\n  Currency: {bal.currency_code}")
-        print(f"  Cash Balance: ${bal.cash_balance:,.2f}")
-        print(f"  Open Trade Equity: ${bal.open_trade_equity:,.2f}")
+        out.append(f"\n  Currency: {bal.currency_code}")
+        out.append(f"  Cash Balance: ${bal.cash_balance:,.2f}")
+        out.append(f"  Open Trade Equity: ${bal.open_trade_equity:,.2f}")
         if bal.unrealized_pl is not None:
-            print(f"  Unrealized P&L: ${bal.unrealized_pl:,.2f}")
+            out.append(f"  Unrealized P&L: ${bal.unrealized_pl:,.2f}")
         if bal.margin_balance is not None:
-            print(f"  Margin Balance: ${bal.margin_balance:,.2f}")
+            out.append(f"  Margin Balance: ${bal.margin_balance:,.2f}")
         if bal.available_for_trading is not None:
-            print(f"  Available for Trading: ${bal.available_for_trading:,.2f}")
+            out.append(f"  Available for Trading: ${bal.available_for_trading:,.2f}")
 
     # Method 2: Typed request with specific balance type
-    print("\n2. Using typed AccountBalanceRequest:")
+    out.append("\n2. Using typed AccountBalanceRequest:")
     balance_req = AccountBalanceRequest(
         account_id=account_id,
         balance_type=BalanceType.CURRENT_OPEN
     )
     balance2 = client.get_account_balance(balance_req)
 
-    print(f"  ✓ Retrieved {BalanceType.CURRENT_OPEN.value} balance")
-    print(f"  Cash Balance: ${balance2.balances[0].cash_balance:,.2f}")
+    out.append(f"  ✓ Retrieved {BalanceType.CURRENT_OPEN.value} balance")
+    out.append(f"  Cash Balance: ${balance2.balances[0].cash_balance:,.2f}")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def example_positions(client, account_id):
     """Get and display current positions."""
-    print("\n" + "="*70)
-    print("EXAMPLE 2: Positions")
-    print("="*70)
+    out = []
+    out.append("\n" + "="*70)
+    out.append("EXAMPLE 2: Positions")
+    out.append("="*70)
 
     positions = client.get_positions(account_id)
 
-    print(f"  Total Positions: {len(positions.positions)}")
+    out.append(f"  Total Positions: {len(positions.positions)}")
 
     if len(positions.positions) == 0:
-        print("  No open positions")
+        out.append("  No open positions")
     else:
         for i, pos in enumerate(positions.positions, 1):
-            print(f"\n  Position {i}:")
-            print(f"    Symbol: {pos.exch_sym}")
-            print(f"    Side: {pos.side}")  # LONG or SHORT
-            print(f"    Quantity: {pos.quantity}")
-            print(f"    Entry Price: ${pos.price:,.2f}")
+            # Side is LONG or SHORT
+            out.append(_POS_LINE(i, pos.exch_sym, pos.side, pos.quantity, pos.price))
 
             if pos.unrealized_pl is not None:
                 pnl_color = "profit" if pos.unrealized_pl >= 0 else "loss"
-                print(f"    Unrealized P&L: ${pos.unrealized_pl:,.2f} ({pnl_color})")
+                out.append(f"    Unrealized P&L: ${pos.unrealized_pl:,.2f} ({pnl_color})")
 
             if pos.date_opened:
-                print(f"    Opened: {pos.date_opened}")
+                out.append(f"    Opened: {pos.date_opened}")
+
+    sys.stdout.write("\n".join(out) + "\n")
+
 
 def example_risk(client, account_id):
     """Get and display risk information."""
-    print("\n" + "="*70)
-    print("EXAMPLE 3: Risk Management")
-    print("="*70)
+    out = []
+    out.append("\n" + "="*70)
+    out.append("EXAMPLE 3: Risk Management")
+    out.append("="*70)
 
     risk = client.get_risk(account_id)
 
-    print(f"  Status: {risk.status}")
-    print(f"  Total Risk Entries: {len(risk.risks)}")
+    out.append(f"  Status: {risk.status}")
+    out.append(f"  Total Risk Entries: {len(risk.risks)}")
 
     # Show all risk entries
     for i, r in enumerate(risk.risks, 1):
-        print(f"\n  Risk Entry {i}:")
-        print(f"    Account: {r.account_id}")
+        out.append(f"\n  Risk Entry {i}:")
+        out.append(f"    Account: {r.account_id}")
 
         if r.reg_code:
-            print(f"    Regulation: {r.reg_code}")
+            out.append(f"    Regulation: {r.reg_code}")
         if r.currency_code:
-            print(f"    Currency: {r.currency_code}")
+            out.append(f"    Currency: {r.currency_code}")
         if r.liquidation_value is not None:
-            print(f"    Liquidation Value: ${r.liquidation_value:,.2f}")
+            out.append(f"    Liquidation Value: ${r.liquidation_value:,.2f}")
         if r.margin_requirement is not None:
-            print(f"    Margin Requirement: ${r.margin_requirement:,.2f}")
+            out.append(f"    Margin Requirement: ${r.margin_requirement:,.2f}")
         if r.buying_power is not None:
-            print(f"    Buying Power: ${r.buying_power:,.2f}")
+            out.append(f"    Buying Power: ${r.buying_power:,.2f}")
 
     # Convenience access to first risk entry
     if risk.risk:
-        print(f"\n  ✓ Primary Account: {risk.risk.account_id}")
+        out.append(f"\n  ✓ Primary Account: {risk.risk.account_id}")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def example_fills(client, account_id):
     """Get and display fill history."""
-    print("\n" + "="*70)
-    print("EXAMPLE 4: Fill History")
-    print("="*70)
-
-    fills = client.get_fills(account_id)
-
-    print(f"  Total Fills: {len(fills.fills)}")
-
-    if len(fills.fills) == 0:
-        print("  No fills in history")
+    out = []
+    out.append("\n" + "="*70)
+    out.append("EXAMPLE 4: Fill History")
+    out.append("="*70)
+
+    # Aggregate while the fills stream in: keep the first five for display and
+    # running [fills, buy, sell] totals per symbol instead of the whole list
+    total = 0
+    recent = []
+    summary = defaultdict(lambda: [0, 0, 0])
+    for fill in client.get_fills_iter(account_id, lite=True):
+        total += 1
+        if len(recent) < 5:
+            recent.append(fill)
+        totals = summary[fill.exch_sym]
+        totals[0] += 1
+        side = fill.side
+        if side is OrderSide.BUY:
+            totals[1] += fill.quantity
+        elif side is OrderSide.SELL:
+            totals[2] += fill.quantity
+
+    out.append(f"  Total Fills: {total}")
+
+    if total == 0:
+        out.append("  No fills in history")
     else:
-        # Group fills by symbol
-        fills_by_symbol = {}
-        for fill in fills.fills:
-            symbol = fill.exch_sym
-            if symbol not in fills_by_symbol:
-                fills_by_symbol[symbol] = []
-            fills_by_symbol[symbol].append(fill)
-
-        print(f"\n  Symbols with fills: {len(fills_by_symbol)}")
+        out.append(f"\n  Symbols with fills: {len(summary)}")
 
         # Show recent fills (last 5)
-        print(f"\n  Recent Fills (last 5):")
-        for i, fill in enumerate(fills.fills[:5], 1):
-            print(f"\n  Fill {i}:")
+        out.append(f"\n  Recent Fills (last 5):")
+        for i, fill in enumerate(recent, 1):
+            out.append(f"\n  Fill {i}:")
             if fill.fill_id:
-                print(f"    Fill ID: {fill.fill_id}")
-            print(f"    Order ID: {fill.order_id}")
-            print(f"    Symbol: {fill.exch_sym}")
-            print(f"    Side: {fill.side}")  # BUY or SELL
-            print(f"    Quantity: {fill.quantity}")
+                out.append(f"    Fill ID: {fill.fill_id}")
+            # Side is BUY or SELL
+            out.append(_FILL_LINE(fill.order_id, fill.exch_sym, fill.side, fill.quantity))
             if fill.price is not None:
-                print(f"    Fill Price: ${fill.price:,.2f}")
+                out.append(f"    Fill Price: ${fill.price:,.2f}")
             if fill.fill_time:
-                print(f"    Fill Time: {fill.fill_time}")
+                out.append(f"    Fill Time: {fill.fill_time}")
 
         # Show summary by symbol
-        print(f"\n  Summary by Symbol:")
-        for symbol, symbol_fills in fills_by_symbol.items():
-            buy_qty = sum(f.quantity for f in symbol_fills if f.side.value == "BUY")
-            sell_qty = sum(f.quantity for f in symbol_fills if f.side.value == "SELL")
-            net = buy_qty - sell_qty
+        out.append(f"\n  Summary by Symbol:")
+        for symbol, (count, buy_qty, sell_qty) in summary.items():
+            out.append(_FILL_SUMMARY_LINE(
+                symbol, count, buy_qty, sell_qty, buy_qty - sell_qty
+            ))
 
-            print(f"\n    {symbol}:")
-            print(f"      Total Fills: {len(symbol_fills)}")
-            print(f"      Buy Quantity: {buy_qty}")
-            print(f"      Sell Quantity: {sell_qty}")
-            print(f"      Net Position: {net:+.0f}")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
-def example_account_summary(client, account_id):
+async def example_account_summary(client, account_id, trader):
     """Comprehensive account summary."""
-    print("\n" + "="*70)
-    print("EXAMPLE 5: Complete Account Summary")
-    print("="*70)
-
-    # Get all account data
-    trader = client.get_trader_info()
-    balance = client.get_account_balance(account_id)
-    positions = client.get_positions(account_id)
-    risk = client.get_risk(account_id)
-    fills = client.get_fills(account_id)
+    out = []
+    out.append("\n" + "="*70)
+    out.append("EXAMPLE 5: Complete Account Summary")
+    out.append("="*70)
+
+    # Get the rest of the account data (trader info comes from setup_client) -
+    # the requests are independent, so run them concurrently in worker threads
+    balance, positions, risk, fills = await asyncio.gather(
+        asyncio.to_thread(client.get_account_balance, account_id),
+        asyncio.to_thread(client.get_positions, account_id),
+        asyncio.to_thread(client.get_risk, account_id),
+        asyncio.to_thread(client.get_fills, account_id),
+    )
 
     # Display summary
-    print(f"\n  ACCOUNT: {account_id}")
-    print(f"  Trader ID: {trader.trader_id}")
-    print(f"  Account Type: {'LIVE' if trader.is_live else 'DEMO'}")
+    out.append(f"\n  ACCOUNT: {account_id}")
+    out.append(f"  Trader ID: {trader.trader_id}")
+    out.append(f"  Account Type: {'LIVE' if trader.is_live else 'DEMO'}")
 
-    print(f"\n  BALANCE:")
+    out.append(f"\n  BALANCE:")
     bal = balance.balances[0]
-    print(f"    Cash: ${bal.cash_balance:,.2f}")
-    print(f"    Open Trade Equity: ${bal.open_trade_equity:,.2f}")
+    out.append(f"    Cash: ${bal.cash_balance:,.2f}")
+    out.append(f"    Open Trade Equity: ${bal.open_trade_equity:,.2f}")
 
-    print(f"\n  POSITIONS:")
-    print(f"    Open Positions: {len(positions.positions)}")
+    out.append(f"\n  POSITIONS:")
+    out.append(f"    Open Positions: {len(positions.positions)}")
     if positions.positions:
-        total_value = sum(pos.quantity * pos.price for pos in positions.positions)
-        print(f"    Total Position Value: ${total_value:,.2f}")
+        n = len(positions.positions)
+        qtys = np.fromiter((pos.quantity for pos in positions.positions), np.float64, count=n)
+        prices = np.fromiter((pos.price for pos in positions.positions), np.float64, count=n)
+        total_value = float(qtys @ prices)
+        out.append(f"    Total Position Value: ${total_value:,.2f}")
 
-    print(f"\n  RISK:")
+    out.append(f"\n  RISK:")
     if risk.risks:
         r = risk.risks[0]
         if r.margin_requirement is not None:
-            print(f"    Margin Requirement: ${r.margin_requirement:,.2f}")
+            out.append(f"    Margin Requirement: ${r.margin_requirement:,.2f}")
         if r.buying_power is not None:
-            print(f"    Buying Power: ${r.buying_power:,.2f}")
+            out.append(f"    Buying Power: ${r.buying_power:,.2f}")
+
+    out.append(f"\n  ACTIVITY:")
+    out.append(f"    Total Fills: {len(fills.fills)}")
+
+    out.append(f"\n  ✓ Account summary complete")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
-    print(f"\n  ACTIVITY:")
-    print(f"    Total Fills: {len(fills.fills)}")
 
-    print(f"\n  ✓ Account summary complete")
+async def run_examples(client, account_id, trader):
+    """Run the examples concurrently.
+
+    The examples don't depend on each other, so their requests overlap.
+    Each one writes its section in a single write once it has its data,
+    so sections print whole, in the order they finish.
+    """
+    limit = asyncio.Semaphore(MAX_CONCURRENT_EXAMPLES)
+
+    async def limited(coro):
+        async with limit:
+            await coro
+
+    await asyncio.gather(
+        limited(asyncio.to_thread(example_account_balance, client, account_id)),
+        limited(asyncio.to_thread(example_positions, client, account_id)),
+        limited(asyncio.to_thread(example_risk, client, account_id)),
+        limited(asyncio.to_thread(example_fills, client, account_id)),
+        limited(example_account_summary(client, account_id, trader)),
+    )
 
 
 def main():
@@ -219,15 +288,12 @@ def main():
     print("="*70)
 
     # Setup
-    client, account_id = setup_client()
+    client, trader = setup_client()
+    account_id = trader.accounts[0]
     print(f"\n✓ Authenticated - Account: {account_id}")
 
     # Run examples
-    example_account_balance(client, account_id)
-    example_positions(client, account_id)
-    example_risk(client, account_id)
-    example_fills(client, account_id)
-    example_account_summary(client, account_id)
+    asyncio.run(run_examples(client, account_id, trader))
 
     print("\n" + "="*70)
     print("EXAMPLES COMPLETE")
@@ -2,7 +2,13 @@
 Example 3: Market Data
 Demonstrates quotes, market depth, trades, and symbol search
 """
-from ironbeam import IronBeam
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from ironbeam import get_client
 
 # Demo credentials
 DEMO_USERNAME = "51392077"
@@ -12,28 +18,46 @@ DEMO_KEY = "cfcf8651c7914cf988ffc026db9849b1"
 # Test symbols
 SYMBOLS = ["XCEC:MGC.Z25", "XCME:ES.Z25", "XCME:NQ.Z25"]
 
+# Row templates for the search result loops
+_SEARCH_LINE = "    {:<25} {:<40} [{}, {}]".format
+_FUTURES_LINE = "    {:<15} {} {} - {}".format
+
 
 def setup_client():
-    """Initialize and authenticate client."""
-    client = IronBeam(
+    """Get the shared authenticated client."""
+    return get_client(
         api_key=DEMO_KEY,
         username=DEMO_USERNAME,
         password=DEMO_PASSWORD
     )
-    client.authenticate()
-    return client
 
 
-def example_quotes(client):
+def fetch_market_data(client):
+    """Fetch quotes, depth and security definitions for all SYMBOLS.
+
+    One request per data type covers every symbol, and the three requests
+    run concurrently. A failed security definitions request comes back as
+    (None, error) so the examples can report it.
+    """
+    results = client.batch(
+        ('get_quotes', SYMBOLS),
+        ('get_depth', SYMBOLS),
+        ('try_get_security_definitions', SYMBOLS),
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+    quotes, depth_resp, (defs, defs_error) = results
+    return quotes, depth_resp, defs, defs_error
+
+
+def example_quotes(quotes):
     """Get real-time quotes for symbols."""
     print("\n" + "="*70)
     print("EXAMPLE 1: Market Quotes")
     print("="*70)
 
-    print(f"\n  Requesting quotes for {len(SYMBOLS)} symbols...")
-
-    quotes = client.get_quotes(SYMBOLS)
-
+    print(f"\n  Quotes for {len(SYMBOLS)} symbols...")
     print(f"  Status: {quotes.status}")
     print(f"  Quotes received: {len(quotes.quotes)}")
 
@@ -64,21 +88,21 @@ def example_quotes(client):
             print(f"    Volume: {quote.volume:,}")
 
 
-def example_market_depth(client):
+def example_market_depth(depth_response):
     """Get market depth (order book) data."""
     print("\n" + "="*70)
     print("EXAMPLE 2: Market Depth (Order Book)")
     print("="*70)
 
     symbol = SYMBOLS[0]  # Use Micro Gold
-    print(f"\n  Requesting market depth for {symbol}...")
-
-    depth_response = client.get_depth([symbol])
+    print(f"\n  Market depth for {symbol}...")
 
     print(f"  Status: {depth_response.status}")
 
-    if depth_response.depths:
-        depth = depth_response.depths[0]
+    depth_by_symbol = {d.exch_sym: d for d in depth_response.depths}
+    depth = depth_by_symbol.get(symbol)
+
+    if depth:
         print(f"\n  Symbol: {depth.exch_sym}")
 
         # Display bid side
@@ -109,33 +133,42 @@ def example_market_depth(client):
 
 def example_symbol_search(client):
     """Search for symbols by keyword."""
-    print("\n" + "="*70)
-    print("EXAMPLE 3: Symbol Search")
-    print("="*70)
+    out = []
+    out.append("\n" + "="*70)
+    out.append("EXAMPLE 3: Symbol Search")
+    out.append("="*70)
 
     keywords = ["gold", "oil", "es"]
 
-    for keyword in keywords:
-        print(f"\n  Searching for '{keyword}'...")
+    # Searches are independent requests - run them concurrently and print
+    # the results in keyword order
+    with ThreadPoolExecutor(max_workers=min(8, len(keywords))) as executor:
+        results = executor.map(
+            lambda kw: client.get_symbols(kw, limit=5, prefer_active=True), keywords
+        )
 
-        result = client.get_symbols(keyword, limit=5, prefer_active=True)
+    for keyword, result in zip(keywords, results):
+        out.append(f"\n  Searching for '{keyword}'...")
 
-        print(f"  Found {len(result['symbols'])} results:")
+        out.append(f"  Found {len(result['symbols'])} results:")
 
         for sym in result['symbols']:
-            symbol = sym.get('symbol', 'N/A')
-            desc = sym.get('description', 'N/A')
-            currency = sym.get('currency', 'N/A')
-            sym_type = sym.get('symbolType', 'N/A')
+            out.append(_SEARCH_LINE(
+                sym.get('symbol', 'N/A'),
+                sym.get('description', 'N/A'),
+                sym.get('symbolType', 'N/A'),
+                sym.get('currency', 'N/A'),
+            ))
 
-            print(f"    {symbol:<25} {desc:<40} [{sym_type}, {currency}]")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def example_futures_search(client):
     """Search for futures contracts."""
-    print("\n" + "="*70)
-    print("EXAMPLE 4: Futures Search")
-    print("="*70)
+    out = []
+    out.append("\n" + "="*70)
+    out.append("EXAMPLE 4: Futures Search")
+    out.append("="*70)
 
     exchanges = [
         ("CME", "ES"),      # E-mini S&P 500
@@ -143,65 +176,68 @@ def example_futures_search(client):
         ("NYMEX", "CL")     # Crude Oil
     ]
 
-    for exchange, product in exchanges:
-        print(f"\n  Searching {exchange} for {product} futures...")
+    # Run all searches concurrently; errors surface per search in .result()
+    with ThreadPoolExecutor(max_workers=min(8, len(exchanges))) as executor:
+        futures = [executor.submit(client.search_futures, exchange, product)
+                   for exchange, product in exchanges]
+
+    for (exchange, product), future in zip(exchanges, futures):
+        out.append(f"\n  Searching {exchange} for {product} futures...")
 
         try:
-            result = client.search_futures(exchange, product)
+            result = future.result()
 
             symbols = result.get('symbols', [])
-            print(f"  Found {len(symbols)} contracts:")
+            out.append(f"  Found {len(symbols)} contracts:")
 
             # Show first 5 contracts
             for sym in symbols[:5]:
-                symbol = sym.get('symbol', 'N/A')
-                month = sym.get('maturityMonth', 'N/A')
-                year = sym.get('maturityYear', 'N/A')
-                desc = sym.get('description', 'N/A')
-
-                print(f"    {symbol:<15} {month} {year} - {desc}")
+                out.append(_FUTURES_LINE(
+                    sym.get('symbol', 'N/A'),
+                    sym.get('maturityMonth', 'N/A'),
+                    sym.get('maturityYear', 'N/A'),
+                    sym.get('description', 'N/A'),
+                ))
 
             if len(symbols) > 5:
-                print(f"    ... and {len(symbols) - 5} more contracts")
+                out.append(f"    ... and {len(symbols) - 5} more contracts")
 
         except Exception as e:
-            print(f"  Error: {e}")
+            out.append(f"  Error: {e}")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
-def example_security_definitions(client):
+def example_security_definitions(defs, error):
     """Get detailed security definitions."""
     print("\n" + "="*70)
     print("EXAMPLE 5: Security Definitions")
     print("="*70)
 
-    symbols_to_check = [SYMBOLS[0]]  # Just check Micro Gold
+    print(f"\n  Security definitions for {len(SYMBOLS)} symbol(s)...")
 
-    print(f"\n  Getting security definitions for {len(symbols_to_check)} symbol(s)...")
+    if error is not None:
+        print(f"  Error: {error}")
+        return
 
-    try:
-        defs = client.get_security_definitions(symbols_to_check)
+    print(f"  Status: {defs.status}")
 
-        print(f"  Status: {defs.status}")
+    for sec_def in defs.security_definitions:
+        print(f"\n  Symbol: {sec_def.exch_sym}")
+        print(f"    Currency: {sec_def.currency}")
+        print(f"    Description: {sec_def.description}")
 
-        for sec_def in defs.security_definitions:
-            print(f"\n  Symbol: {sec_def.exch_sym}")
-            print(f"    Currency: {sec_def.currency}")
-            print(f"    Description: {sec_def.description}")
+        if sec_def.contract_size:
+            print(f"    Contract Size: {sec_def.contract_size}")
+        if sec_def.tick_size:
+            print(f"    Tick Size: {sec_def.tick_size}")
+        if sec_def.tick_value:
+            print(f"    Tick Value: ${sec_def.tick_value}")
 
-            if sec_def.contract_size:
-                print(f"    Contract Size: {sec_def.contract_size}")
-            if sec_def.tick_size:
-                print(f"    Tick Size: {sec_def.tick_size}")
-            if sec_def.tick_value:
-                print(f"    Tick Value: ${sec_def.tick_value}")
-
-            if sec_def.exchange:
-                print(f"    Exchange: {sec_def.exchange}")
-            if sec_def.product_type:
-                print(f"    Product Type: {sec_def.product_type}")
-
-    except Exception as e:
-        print(f"  Error: {e}")
+        if sec_def.exchange:
+            print(f"    Exchange: {sec_def.exchange}")
+        if sec_def.product_type:
+            print(f"    Product Type: {sec_def.product_type}")
 
 
 def example_popular_symbols(client):
@@ -229,7 +265,7 @@ def example_popular_symbols(client):
         print(f"    {sym['symbol']:<20} {sym['name']:<35} [{sym['exchange']}]")
 
 
-def example_market_data_combination(client):
+def example_market_data_combination(quotes, depth_resp, defs):
     """Combine multiple market data calls for analysis."""
     print("\n" + "="*70)
     print("EXAMPLE 7: Combined Market Analysis")
@@ -238,20 +274,11 @@ def example_market_data_combination(client):
     symbol = "XCEC:MGC.Z25"
     print(f"\n  Analyzing {symbol}...")
 
-    # Get quote
-    quotes = client.get_quotes([symbol])
-    quote = quotes.quotes[0] if quotes.quotes else None
-
-    # Get depth
-    depth_resp = client.get_depth([symbol])
-    depth = depth_resp.depths[0] if depth_resp.depths else None
+    # Reuse the prefetched responses rather than requesting the symbol again
+    quote = {q.exch_sym: q for q in quotes.quotes}.get(symbol)
+    depth = {d.exch_sym: d for d in depth_resp.depths}.get(symbol)
 
-    # Get definition
-    try:
-        defs = client.get_security_definitions([symbol])
-        sec_def = defs.security_definitions[0] if defs.security_definitions else None
-    except:
-        sec_def = None
+    sec_def = {d.exch_sym: d for d in defs.security_definitions}.get(symbol) if defs else None
 
     # Display combined analysis
     print(f"\n  SYMBOL: {symbol}")
@@ -279,15 +306,38 @@ def example_market_data_combination(client):
         print(f"    Best Ask: ${best_ask:,.2f} x {ask_size}")
         print(f"    Spread: ${best_ask - best_bid:.2f}")
 
-        # Calculate liquidity
-        total_bid_liquidity = sum(level.size for level in depth.bids[:10])
-        total_ask_liquidity = sum(level.size for level in depth.asks[:10])
+        # Calculate liquidity from the top 10 levels of each side
+        bid_sizes = np.array([level.size for level in depth.bids[:10]], dtype=np.float64)
+        ask_sizes = np.array([level.size for level in depth.asks[:10]], dtype=np.float64)
+        total_bid_liquidity = float(bid_sizes.sum())
+        total_ask_liquidity = float(ask_sizes.sum())
 
         print(f"\n  LIQUIDITY (Top 10 levels):")
         print(f"    Bid Liquidity: {total_bid_liquidity}")
         print(f"    Ask Liquidity: {total_ask_liquidity}")
 
 
+async def run_examples(client):
+    """Run the examples, overlapping everything that makes requests.
+
+    The prefetch and the two searches are independent, so they run
+    concurrently; the searches write their sections whole once done. The
+    examples that only format the prefetched data run afterwards.
+    """
+    fetch, _, _ = await asyncio.gather(
+        asyncio.to_thread(fetch_market_data, client),
+        asyncio.to_thread(example_symbol_search, client),
+        asyncio.to_thread(example_futures_search, client),
+    )
+    quotes, depth_resp, defs, defs_error = fetch
+
+    example_quotes(quotes)
+    example_market_depth(depth_resp)
+    example_security_definitions(defs, defs_error)
+    example_popular_symbols(client)
+    example_market_data_combination(quotes, depth_resp, defs)
+
+
 def main():
     """Run all market data examples."""
     print("\n" + "="*70)
@@ -299,13 +349,7 @@ def main():
     print("\n✓ Authenticated")
 
     # Run examples
-    example_quotes(client)
-    example_market_depth(client)
-    example_symbol_search(client)
-    example_futures_search(client)
-    example_security_definitions(client)
-    example_popular_symbols(client)
-    example_market_data_combination(client)
+    asyncio.run(run_examples(client))
 
     print("\n" + "="*70)
     print("EXAMPLES COMPLETE")
@@ -2,7 +2,9 @@
 Example 4: Order Management
 Demonstrates placing, updating, and cancelling various order types
 """
-from ironbeam import IronBeam, OrderRequest, OrderUpdateRequest, OrderType, OrderSide, DurationType, OrderStatus
+from ironbeam import get_client, OrderRequest, OrderUpdateRequest, OrderType, OrderSide, DurationType, OrderStatus
+import asyncio
+import sys
 import time
 
 # Demo credentials
@@ -10,38 +12,82 @@ DEMO_USERNAME = "51392077"
 DEMO_PASSWORD = "207341"
 DEMO_KEY = "cfcf8651c7914cf988ffc026db9849b1"
 
+# Section divider
+SEP = "=" * 70
+
 # Test symbol
 TEST_SYMBOL = "XCEC:MGC.Z25"  # Micro Gold
 
+# Most order IDs sent in one cancel_multiple_orders request
+CANCEL_BATCH_SIZE = 50
+
+# Most order placements in flight at once
+MAX_CONCURRENT_ORDERS = 4
+
+# How long to wait for a market order fill, and how often to check
+FILL_TIMEOUT = 2.0
+FILL_POLL_INTERVAL = 0.25
+
+# Last fetched reference price per symbol, as (price, monotonic time)
+_reference_prices = {}
+
 
 def setup_client():
-    """Initialize and authenticate client."""
-    client = IronBeam(
+    """Get the shared authenticated client."""
+    client = get_client(
         api_key=DEMO_KEY,
         username=DEMO_USERNAME,
         password=DEMO_PASSWORD
     )
-    client.authenticate()
     trader_info = client.get_trader_info()
     return client, trader_info.accounts[0]
 
 
-def get_reference_price(client):
-    """Get current market price for calculations."""
+def get_reference_price(client, ttl=1.0):
+    """Get current market price for calculations.
+
+    A fetched price is reused for ttl seconds, so repeated calls (e.g. when
+    building a grid of orders) don't each request a quote. Use a smaller
+    ttl where prices need to stay fresh.
+    """
+    now = time.monotonic()
+    cached = _reference_prices.get(TEST_SYMBOL)
+    if cached and now - cached[1] < ttl:
+        return cached[0]
+
     try:
         quotes = client.get_quotes([TEST_SYMBOL])
         if quotes.quotes and quotes.quotes[0].last_price:
-            return quotes.quotes[0].last_price
+            price = quotes.quotes[0].last_price
+            _reference_prices[TEST_SYMBOL] = (price, now)
+            return price
     except:
         pass
     return 2700.0  # Default for MGC
 
 
+async def snapshot(client, account_id):
+    """Fetch the quote, positions and working orders concurrently.
+
+    The three reads are independent, so they run in worker threads at the
+    same time. A failed read comes back as its exception.
+
+    Returns:
+        (quotes, positions, orders)
+    """
+    return tuple(await asyncio.gather(
+        asyncio.to_thread(client.get_quotes, [TEST_SYMBOL]),
+        asyncio.to_thread(client.get_positions, account_id),
+        asyncio.to_thread(client.get_orders, account_id, OrderStatus.WORKING.value),
+        return_exceptions=True,
+    ))
+
+
 def example_market_order(client, account_id):
     """Place a market order (executes immediately at current price)."""
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("EXAMPLE 1: Market Order")
-    print("="*70)
+    print(SEP)
 
     print(f"\n  Placing MARKET BUY order for {TEST_SYMBOL}...")
 
@@ -64,14 +110,19 @@ def example_market_order(client, account_id):
             print(f"    Strategy ID: {response.strategy_id}")
         print(f"    Status: {response.status}")
 
-        # Wait briefly for fill
+        # Check for the fill until it shows up or FILL_TIMEOUT passes
         print(f"\n  Checking for fill...")
-        time.sleep(2)
-
-        positions = client.get_positions(account_id)
-        for pos in positions.positions:
-            if TEST_SYMBOL in pos.exch_sym:
+        deadline = time.monotonic() + FILL_TIMEOUT
+        while True:
+            positions = client.get_positions(account_id)
+            pos = next((p for p in positions.positions if p.exch_sym == TEST_SYMBOL), None)
+            if pos is not None:
                 print(f"  ✓ Position opened: {pos.quantity} @ ${pos.price:,.2f}")
+                break
+            if time.monotonic() >= deadline:
+                print(f"  Not filled within {FILL_TIMEOUT:.0f}s")
+                break
+            time.sleep(FILL_POLL_INTERVAL)
 
         return response.order_id
 
@@ -82,15 +133,16 @@ def example_market_order(client, account_id):
 
 def example_limit_order(client, account_id, ref_price):
     """Place a limit order (executes only at specified price or better)."""
-    print("\n" + "="*70)
-    print("EXAMPLE 2: Limit Order")
-    print("="*70)
+    out = []
+    out.append("\n" + SEP)
+    out.append("EXAMPLE 2: Limit Order")
+    out.append(SEP)
 
     # Set limit price below current market (buy limit)
     limit_price = round(ref_price - 10, 2)
 
-    print(f"\n  Placing LIMIT BUY order at ${limit_price:,.2f}")
-    print(f"  (Current market: ~${ref_price:,.2f})")
+    out.append(f"\n  Placing LIMIT BUY order at ${limit_price:,.2f}")
+    out.append(f"  (Current market: ~${ref_price:,.2f})")
 
     order = OrderRequest(
         account_id=account_id,
@@ -105,30 +157,34 @@ def example_limit_order(client, account_id, ref_price):
     try:
         response = client.place_order(account_id, order)
 
-        print(f"  ✓ Limit order placed!")
-        print(f"    Order ID: {response.order_id}")
-        print(f"    Limit Price: ${limit_price:,.2f}")
-        print(f"    Status: {response.status}")
-        print(f"\n  Note: Order will only execute if price reaches ${limit_price:,.2f}")
+        out.append(f"  ✓ Limit order placed!")
+        out.append(f"    Order ID: {response.order_id}")
+        out.append(f"    Limit Price: ${limit_price:,.2f}")
+        out.append(f"    Status: {response.status}")
+        out.append(f"\n  Note: Order will only execute if price reaches ${limit_price:,.2f}")
 
         return response.order_id
 
     except Exception as e:
-        print(f"  ✗ Error: {e}")
+        out.append(f"  ✗ Error: {e}")
         return None
 
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
+
 
 def example_stop_order(client, account_id, ref_price):
     """Place a stop order (becomes market order when stop price is hit)."""
-    print("\n" + "="*70)
-    print("EXAMPLE 3: Stop Order")
-    print("="*70)
+    out = []
+    out.append("\n" + SEP)
+    out.append("EXAMPLE 3: Stop Order")
+    out.append(SEP)
 
     # Set stop price above current market
     stop_price = round(ref_price + 15, 2)
 
-    print(f"\n  Placing STOP BUY order at ${stop_price:,.2f}")
-    print(f"  (Current market: ~${ref_price:,.2f})")
+    out.append(f"\n  Placing STOP BUY order at ${stop_price:,.2f}")
+    out.append(f"  (Current market: ~${ref_price:,.2f})")
 
     order = OrderRequest(
         account_id=account_id,
@@ -143,32 +199,36 @@ def example_stop_order(client, account_id, ref_price):
     try:
         response = client.place_order(account_id, order)
 
-        print(f"  ✓ Stop order placed!")
-        print(f"    Order ID: {response.order_id}")
-        print(f"    Stop Price: ${stop_price:,.2f}")
-        print(f"    Status: {response.status}")
-        print(f"\n  Note: Becomes market order if price reaches ${stop_price:,.2f}")
+        out.append(f"  ✓ Stop order placed!")
+        out.append(f"    Order ID: {response.order_id}")
+        out.append(f"    Stop Price: ${stop_price:,.2f}")
+        out.append(f"    Status: {response.status}")
+        out.append(f"\n  Note: Becomes market order if price reaches ${stop_price:,.2f}")
 
         return response.order_id
 
     except Exception as e:
-        print(f"  ✗ Error: {e}")
+        out.append(f"  ✗ Error: {e}")
         return None
 
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
+
 
 def example_stop_limit_order(client, account_id, ref_price):
     """Place a stop-limit order (becomes limit order when stop price is hit)."""
-    print("\n" + "="*70)
-    print("EXAMPLE 4: Stop-Limit Order")
-    print("="*70)
+    out = []
+    out.append("\n" + SEP)
+    out.append("EXAMPLE 4: Stop-Limit Order")
+    out.append(SEP)
 
     stop_price = round(ref_price + 20, 2)
     limit_price = round(stop_price + 5, 2)  # Limit 5 above stop
 
-    print(f"\n  Placing STOP-LIMIT BUY order")
-    print(f"    Stop Price: ${stop_price:,.2f}")
-    print(f"    Limit Price: ${limit_price:,.2f}")
-    print(f"    (Current market: ~${ref_price:,.2f})")
+    out.append(f"\n  Placing STOP-LIMIT BUY order")
+    out.append(f"    Stop Price: ${stop_price:,.2f}")
+    out.append(f"    Limit Price: ${limit_price:,.2f}")
+    out.append(f"    (Current market: ~${ref_price:,.2f})")
 
     order = OrderRequest(
         account_id=account_id,
@@ -184,33 +244,37 @@ def example_stop_limit_order(client, account_id, ref_price):
     try:
         response = client.place_order(account_id, order)
 
-        print(f"  ✓ Stop-limit order placed!")
-        print(f"    Order ID: {response.order_id}")
-        print(f"    Stop: ${stop_price:,.2f}, Limit: ${limit_price:,.2f}")
-        print(f"\n  Note: Becomes limit order at ${limit_price:,.2f} when price hits ${stop_price:,.2f}")
+        out.append(f"  ✓ Stop-limit order placed!")
+        out.append(f"    Order ID: {response.order_id}")
+        out.append(f"    Stop: ${stop_price:,.2f}, Limit: ${limit_price:,.2f}")
+        out.append(f"\n  Note: Becomes limit order at ${limit_price:,.2f} when price hits ${stop_price:,.2f}")
 
         return response.order_id
 
     except Exception as e:
-        print(f"  ✗ Error: {e}")
+        out.append(f"  ✗ Error: {e}")
         return None
 
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
+
 
 def example_bracket_order(client, account_id, ref_price):
     """Place a bracket order (entry with stop-loss and take-profit)."""
-    print("\n" + "="*70)
-    print("EXAMPLE 5: Bracket Order")
-    print("="*70)
+    out = []
+    out.append("\n" + SEP)
+    out.append("EXAMPLE 5: Bracket Order")
+    out.append(SEP)
 
     entry_price = round(ref_price - 5, 2)
     stop_loss = round(entry_price - 20, 2)
     take_profit = round(entry_price + 40, 2)
 
-    print(f"\n  Placing BRACKET order:")
-    print(f"    Entry (Limit): ${entry_price:,.2f}")
-    print(f"    Stop Loss: ${stop_loss:,.2f}")
-    print(f"    Take Profit: ${take_profit:,.2f}")
-    print(f"    Risk/Reward: 1:2 ratio")
+    out.append(f"\n  Placing BRACKET order:")
+    out.append(f"    Entry (Limit): ${entry_price:,.2f}")
+    out.append(f"    Stop Loss: ${stop_loss:,.2f}")
+    out.append(f"    Take Profit: ${take_profit:,.2f}")
+    out.append(f"    Risk/Reward: 1:2 ratio")
 
     order = OrderRequest(
         account_id=account_id,
@@ -227,27 +291,51 @@ def example_bracket_order(client, account_id, ref_price):
     try:
         response = client.place_order(account_id, order)
 
-        print(f"  ✓ Bracket order placed!")
-        print(f"    Order ID: {response.order_id}")
+        out.append(f"  ✓ Bracket order placed!")
+        out.append(f"    Order ID: {response.order_id}")
         if response.strategy_id:
-            print(f"    Strategy ID: {response.strategy_id}")
-        print(f"\n  This creates 3 related orders:")
-        print(f"    1. Entry limit buy @ ${entry_price:,.2f}")
-        print(f"    2. Stop loss sell @ ${stop_loss:,.2f}")
-        print(f"    3. Take profit sell @ ${take_profit:,.2f}")
+            out.append(f"    Strategy ID: {response.strategy_id}")
+        out.append(f"\n  This creates 3 related orders:")
+        out.append(f"    1. Entry limit buy @ ${entry_price:,.2f}")
+        out.append(f"    2. Stop loss sell @ ${stop_loss:,.2f}")
+        out.append(f"    3. Take profit sell @ ${take_profit:,.2f}")
 
         return response.order_id, response.strategy_id
 
     except Exception as e:
-        print(f"  ✗ Error: {e}")
+        out.append(f"  ✗ Error: {e}")
         return None, None
 
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
+
+
+async def place_test_orders(client, account_id, ref_price):
+    """Place the limit, stop, stop-limit and bracket examples concurrently.
+
+    The placements don't depend on each other, so they run in worker threads
+    at the same time. Each example writes its section whole once its order
+    is placed. Returns the examples' results in the order listed.
+    """
+    limit = asyncio.Semaphore(MAX_CONCURRENT_ORDERS)
+
+    async def limited(example):
+        async with limit:
+            return await asyncio.to_thread(example, client, account_id, ref_price)
+
+    return await asyncio.gather(
+        limited(example_limit_order),
+        limited(example_stop_order),
+        limited(example_stop_limit_order),
+        limited(example_bracket_order),
+    )
+
 
 def example_update_order(client, account_id, order_id, ref_price):
     """Update an existing order."""
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("EXAMPLE 6: Update Order")
-    print("="*70)
+    print(SEP)
 
     if not order_id:
         print("  No order to update")
@@ -277,9 +365,9 @@ def example_update_order(client, account_id, order_id, ref_price):
 
 def example_cancel_order(client, account_id, order_id):
     """Cancel an order."""
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("EXAMPLE 7: Cancel Order")
-    print("="*70)
+    print(SEP)
 
     if not order_id:
         print("  No order to cancel")
@@ -300,9 +388,9 @@ def example_cancel_order(client, account_id, order_id):
 
 def example_get_orders(client, account_id):
     """Retrieve and display working orders."""
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("EXAMPLE 8: Get Working Orders")
-    print("="*70)
+    print(SEP)
 
     print(f"\n  Retrieving all working orders...")
 
@@ -312,39 +400,53 @@ def example_get_orders(client, account_id):
         print(f"  Status: {orders.status}")
         print(f"  Working Orders: {len(orders.orders)}")
 
-        if orders.orders:
-            # Filter for test symbol
-            test_orders = [o for o in orders.orders if TEST_SYMBOL in o.exch_sym]
+        # Filter for test symbol
+        test_orders = [o for o in orders.orders if o.exch_sym == TEST_SYMBOL]
 
-            if test_orders:
-                print(f"\n  Orders for {TEST_SYMBOL}:")
+        if test_orders:
+            print(f"\n  Orders for {TEST_SYMBOL}:")
 
-                for order in test_orders:
-                    print(f"\n    Order ID: {order.order_id}")
-                    print(f"      Type: {order.order_type}")
-                    print(f"      Side: {order.side}")
-                    print(f"      Quantity: {order.quantity}")
+            for order in test_orders:
+                print(f"\n    Order ID: {order.order_id}")
+                print(f"      Type: {order.order_type}")
+                print(f"      Side: {order.side}")
+                print(f"      Quantity: {order.quantity}")
 
-                    if order.limit_price:
-                        print(f"      Limit Price: ${order.limit_price:,.2f}")
-                    if order.stop_price:
-                        print(f"      Stop Price: ${order.stop_price:,.2f}")
+                if order.limit_price:
+                    print(f"      Limit Price: ${order.limit_price:,.2f}")
+                if order.stop_price:
+                    print(f"      Stop Price: ${order.stop_price:,.2f}")
 
-                    print(f"      Status: {order.status}")
-                    print(f"      Duration: {order.duration}")
+                print(f"      Status: {order.status}")
+                print(f"      Duration: {order.duration}")
 
-        return [o.order_id for o in orders.orders if TEST_SYMBOL in o.exch_sym]
+        return [o.order_id for o in test_orders]
 
     except Exception as e:
         print(f"  ✗ Error: {e}")
         return []
 
 
+async def cancel_individually(client, account_id, order_ids):
+    """Cancel orders one by one, with the requests running concurrently.
+
+    Fallback for when cancel_multiple_orders fails. Returns each
+    cancel_order result, or the exception it raised, in order_ids order.
+    """
+    limit = asyncio.Semaphore(MAX_CONCURRENT_ORDERS)
+
+    async def cancel(order_id):
+        async with limit:
+            return await asyncio.to_thread(client.cancel_order, account_id, order_id)
+
+    return await asyncio.gather(*(cancel(order_id) for order_id in order_ids), return_exceptions=True)
+
+
 def example_cancel_all_test_orders(client, account_id, order_ids):
     """Cancel all test orders."""
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("EXAMPLE 9: Cancel All Test Orders")
-    print("="*70)
+    print(SEP)
 
     if not order_ids:
         print("  No orders to cancel")
@@ -352,32 +454,65 @@ def example_cancel_all_test_orders(client, account_id, order_ids):
 
     print(f"\n  Cancelling {len(order_ids)} orders...")
 
+    # One request per batch of IDs instead of one per order
     cancelled = 0
-    for order_id in order_ids:
+    for start in range(0, len(order_ids), CANCEL_BATCH_SIZE):
+        batch = order_ids[start:start + CANCEL_BATCH_SIZE]
         try:
-            client.cancel_order(account_id, order_id)
-            print(f"  ✓ Cancelled {order_id}")
-            cancelled += 1
+            response = client.cancel_multiple_orders(account_id, batch)
         except Exception as e:
-            print(f"  ✗ Failed to cancel {order_id}: {e}")
+            print(f"  ✗ Batch cancel failed ({e}), cancelling {len(batch)} orders individually")
+            results = asyncio.run(cancel_individually(client, account_id, batch))
+            for order_id, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    print(f"  ✗ Failed to cancel {order_id}: {result}")
+                else:
+                    print(f"  ✓ Cancelled {order_id}")
+                    cancelled += 1
+            continue
+
+        results = response.get('results')
+        if results:
+            for result in results:
+                if result.get('success'):
+                    print(f"  ✓ Cancelled {result.get('orderId')}")
+                    cancelled += 1
+                else:
+                    print(f"  ✗ Failed to cancel {result.get('orderId')}: {result.get('message')}")
+        else:
+            # No per-order results - fall back to the reported count
+            count = response.get('cancelledCount', len(batch))
+            print(f"  ✓ Cancelled {count} orders ({response.get('status', 'N/A')})")
+            cancelled += count
 
     print(f"\n  ✓ Cancelled {cancelled}/{len(order_ids)} orders")
 
 
 def main():
     """Run all order management examples."""
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("IRONBEAM SDK - ORDER MANAGEMENT EXAMPLES")
-    print("="*70)
+    print(SEP)
     print(f"Symbol: {TEST_SYMBOL}")
 
     # Setup
     client, account_id = setup_client()
     print(f"\n✓ Authenticated - Account: {account_id}")
 
-    # Get reference price
-    ref_price = get_reference_price(client)
+    # Get the starting quote, positions and working orders in one round trip
+    quotes, positions, orders = asyncio.run(snapshot(client, account_id))
+
+    # Reference price comes from the snapshot quote, or a fresh fetch if
+    # the quote read failed
+    if not isinstance(quotes, Exception) and quotes.quotes and quotes.quotes[0].last_price:
+        ref_price = quotes.quotes[0].last_price
+    else:
+        ref_price = get_reference_price(client)
     print(f"✓ Reference price: ${ref_price:,.2f}")
+    if not isinstance(positions, Exception):
+        print(f"✓ Open positions: {len(positions.positions)}")
+    if not isinstance(orders, Exception):
+        print(f"✓ Working orders: {len(orders.orders)}")
 
     # Track orders for cleanup
     test_order_ids = []
@@ -385,21 +520,12 @@ def main():
     # Run examples (skip market order to avoid fills)
     # example_market_order(client, account_id)  # Skipped - would execute
 
-    limit_id = example_limit_order(client, account_id, ref_price)
-    if limit_id:
-        test_order_ids.append(limit_id)
-
-    stop_id = example_stop_order(client, account_id, ref_price)
-    if stop_id:
-        test_order_ids.append(stop_id)
-
-    stop_limit_id = example_stop_limit_order(client, account_id, ref_price)
-    if stop_limit_id:
-        test_order_ids.append(stop_limit_id)
-
-    bracket_id, strategy_id = example_bracket_order(client, account_id, ref_price)
-    if bracket_id:
-        test_order_ids.append(bracket_id)
+    limit_id, stop_id, stop_limit_id, (bracket_id, strategy_id) = asyncio.run(
+        place_test_orders(client, account_id, ref_price)
+    )
+    for order_id in (limit_id, stop_id, stop_limit_id, bracket_id):
+        if order_id:
+            test_order_ids.append(order_id)
 
     # Update first order
     if test_order_ids:
@@ -410,15 +536,16 @@ def main():
         example_cancel_order(client, account_id, test_order_ids[1])
         test_order_ids.remove(test_order_ids[1])
 
-    # Get all working orders
-    working_order_ids = example_get_orders(client, account_id)
+    # Show working orders
+    example_get_orders(client, account_id)
 
-    # Cancel all remaining test orders
-    example_cancel_all_test_orders(client, account_id, working_order_ids)
+    # Cancel all remaining test orders. Their IDs are already tracked, so
+    # the orders listed above are only displayed, not re-collected
+    example_cancel_all_test_orders(client, account_id, test_order_ids)
 
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("EXAMPLES COMPLETE")
-    print("="*70)
+    print(SEP)
     print("\nKey Takeaways:")
     print("  1. Market orders execute immediately")
     print("  2. Limit orders execute at specified price or better")
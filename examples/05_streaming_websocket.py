@@ -3,36 +3,47 @@ Example 5: WebSocket Streaming
 Demonstrates real-time market data streaming via WebSockets
 """
 import asyncio
-from ironbeam import IronBeam, IronBeamStream
+import logging
+from ironbeam import get_client, IronBeamStream
+from ironbeam.streaming import decode_frame
 
 # Demo credentials
 DEMO_USERNAME = "51392077"
 DEMO_PASSWORD = "207341"
 DEMO_KEY = "cfcf8651c7914cf988ffc026db9849b1"
 
+# Sample messages are logged at DEBUG; raise the level to silence them
+log = logging.getLogger(__name__)
+
+# Section divider
+SEP = "=" * 70
+
 # Test symbols
 SYMBOLS = ["XCEC:MGC.Z25", "XCME:ES.Z25"]
 
 
+class LatestQuote:
+    """Most recent quote fields for one symbol, overwritten in place."""
+    __slots__ = ('last', 'bid', 'ask')
+
+    def __init__(self):
+        self.last = self.bid = self.ask = None
+
+
 def setup_client():
-    """Initialize and authenticate client."""
-    client = IronBeam(
+    """Get the shared authenticated client."""
+    return get_client(
         api_key=DEMO_KEY,
         username=DEMO_USERNAME,
         password=DEMO_PASSWORD
     )
-    client.authenticate()
-    return client
 
 
-async def example_basic_streaming(client):
+async def example_basic_streaming(stream):
     """Basic streaming with quotes, depth, and trades."""
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("EXAMPLE 1: Basic Streaming")
-    print("="*70)
-
-    # Create stream
-    stream = IronBeamStream(client)
+    print(SEP)
 
     # Message counter
     message_count = {'total': 0, 'quotes': 0, 'depths': 0, 'trades': 0}
@@ -40,67 +51,39 @@ async def example_basic_streaming(client):
     # Define message handler
     async def on_message(msg):
         message_count['total'] += 1
+        total = message_count['total']
 
-        # Identify message type
-        if 'q' in msg or 'quotes' in str(msg).lower():
-            message_count['quotes'] += 1
-        elif 'd' in msg or 'depth' in str(msg).lower():
-            message_count['depths'] += 1
-        elif 't' in msg or 'trade' in str(msg).lower():
-            message_count['trades'] += 1
-
-        # Print first few messages
-        if message_count['total'] <= 3:
-            print(f"\n  Message {message_count['total']}:")
-            print(f"    {str(msg)[:150]}...")
-
-    # Define connection handler
-    async def on_connect(stream_id):
-        print(f"\n  ✓ Connected to stream: {stream_id}")
-
-    # Define error handler
-    async def on_error(error):
-        print(f"\n  ✗ Stream error: {error}")
-
-    # Register handlers
+        # Identify message type by its top-level key (q/d/tr)
+        if isinstance(msg, dict):
+            if 'q' in msg:
+                message_count['quotes'] += 1
+            elif 'd' in msg:
+                message_count['depths'] += 1
+            elif 'tr' in msg:
+                message_count['trades'] += 1
+
+        # Log first few messages; formatting is deferred to the logger
+        if total <= 3:
+            log.debug("\n  Message %d:\n    %.150s...", total, msg)
+
+    # Register handler on the shared stream
     stream.on_message(on_message)
-    stream.on_connect(on_connect)
-    stream.on_error(on_error)
-
-    print(f"\n  Connecting to WebSocket...")
 
     try:
-        # Connect
-        await stream.connect()
-
-        # Subscribe to data
-        print(f"\n  Subscribing to quotes for {SYMBOLS}...")
-        stream.subscribe_quotes(SYMBOLS)
-
-        print(f"  Subscribing to depth for {SYMBOLS}...")
-        stream.subscribe_depths(SYMBOLS)
+        # Subscribe to quotes, depth and trades in one go
+        print(f"\n  Subscribing to quotes, depth and trades for {SYMBOLS}...")
+        stream.subscribe(SYMBOLS)
 
-        print(f"  Subscribing to trades for {SYMBOLS}...")
-        stream.subscribe_trades(SYMBOLS)
-
-        # Start listening
+        # The stream is already being listened to - just wait with progress
         print(f"\n  Listening for 15 seconds...")
-        listen_task = asyncio.create_task(stream.listen())
-
-        # Wait with progress
         for i in range(15):
             await asyncio.sleep(1)
             if i % 5 == 4:
                 print(f"    {i+1}s - Messages: {message_count['total']}")
 
-        # Stop and close
-        listen_task.cancel()
-        try:
-            await listen_task
-        except asyncio.CancelledError:
-            pass
-
-        await stream.close()
+        # Stop this example's data; the connection stays open for the next one
+        stream.unsubscribe(SYMBOLS)
+        stream.on_message(None)
 
         # Print summary
         print(f"\n  Streaming Summary:")
@@ -110,155 +93,112 @@ async def example_basic_streaming(client):
         print(f"    Trade Messages: {message_count['trades']}")
 
     except Exception as e:
-        print(f"\n  ✗ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"\n  ✗ Error: {type(e).__name__}: {e}")
 
 
-async def example_quote_processing(client):
+async def example_quote_processing(stream):
     """Stream and process quote data."""
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("EXAMPLE 2: Processing Quote Data")
-    print("="*70)
-
-    stream = IronBeamStream(client)
-
-    # Store latest quotes
-    latest_quotes = {}
-
-    async def on_message(msg):
-        # Try to extract quote data
-        if isinstance(msg, dict):
-            # Check for quote message structure
-            if 'q' in msg and isinstance(msg['q'], list):
-                for quote in msg['q']:
-                    symbol = quote.get('s', 'unknown')
-                    last = quote.get('l')
-                    bid = quote.get('b')
-                    ask = quote.get('a')
-
-                    if last:
-                        latest_quotes[symbol] = {
-                            'last': last,
-                            'bid': bid,
-                            'ask': ask
-                        }
-
-    async def on_connect(stream_id):
-        print(f"  ✓ Connected: {stream_id}")
-
+    print(SEP)
+
+    # One slot per subscribed symbol, updated in place on each tick
+    latest_quotes = {symbol: LatestQuote() for symbol in SYMBOLS}
+
+    async def on_message(frame):
+        # Frames arrive as typed StreamFrame objects
+        for quote in frame.q:
+            latest = latest_quotes.get(quote.s)
+            if latest is not None and quote.l:
+                latest.last = quote.l
+                latest.bid = quote.b
+                latest.ask = quote.a
+
+    json_decoder = stream.decoder
+    stream.decoder = decode_frame
     stream.on_message(on_message)
-    stream.on_connect(on_connect)
 
     try:
-        await stream.connect()
         stream.subscribe_quotes(SYMBOLS)
 
         print(f"\n  Collecting quotes for 10 seconds...")
-
-        listen_task = asyncio.create_task(stream.listen())
         await asyncio.sleep(10)
 
-        listen_task.cancel()
-        try:
-            await listen_task
-        except asyncio.CancelledError:
-            pass
-
-        await stream.close()
+        stream.unsubscribe_quotes(SYMBOLS)
+        stream.on_message(None)
+        stream.decoder = json_decoder
 
         # Display collected quotes
         print(f"\n  Latest Quotes Collected:")
         for symbol, quote in latest_quotes.items():
+            if quote.last is None:
+                continue
             print(f"\n    {symbol}:")
-            print(f"      Last: ${quote['last']:,.2f}" if quote['last'] else "      Last: N/A")
-            if quote['bid'] and quote['ask']:
-                spread = quote['ask'] - quote['bid']
-                print(f"      Bid: ${quote['bid']:,.2f}")
-                print(f"      Ask: ${quote['ask']:,.2f}")
+            print(f"      Last: ${quote.last:,.2f}")
+            if quote.bid and quote.ask:
+                spread = quote.ask - quote.bid
+                print(f"      Bid: ${quote.bid:,.2f}")
+                print(f"      Ask: ${quote.ask:,.2f}")
                 print(f"      Spread: ${spread:.2f}")
 
     except Exception as e:
         print(f"\n  ✗ Error: {e}")
 
 
-async def example_depth_analysis(client):
+async def example_depth_analysis(stream):
     """Stream and analyze order book depth."""
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("EXAMPLE 3: Order Book Depth Analysis")
-    print("="*70)
-
-    stream = IronBeamStream(client)
+    print(SEP)
 
     # Track depth updates
     depth_updates = {'count': 0}
-    latest_depth = {}
+    latest_depth = dict.fromkeys(SYMBOLS[:1])
 
-    async def on_message(msg):
-        if isinstance(msg, dict) and 'd' in msg:
+    async def on_message(frame):
+        if frame.d:
             depth_updates['count'] += 1
 
-            # Parse depth data
-            depths = msg.get('d', [])
-            for depth in depths:
-                if isinstance(depth, dict):
-                    symbol = depth.get('s')
-                    bids = depth.get('b', [])
-                    asks = depth.get('a', [])
-
-                    if symbol and (bids or asks):
-                        latest_depth[symbol] = {
-                            'bids': bids[:5],  # Top 5 levels
-                            'asks': asks[:5]
-                        }
-
-    async def on_connect(stream_id):
-        print(f"  ✓ Connected: {stream_id}")
+            # Frames arrive as typed StreamFrame objects
+            for depth in frame.d:
+                if depth.s in latest_depth and (depth.b or depth.a):
+                    # Keep the frame's own level lists; only the printout
+                    # slices the top 5, so updates don't copy anything
+                    latest_depth[depth.s] = depth
 
+    json_decoder = stream.decoder
+    stream.decoder = decode_frame
     stream.on_message(on_message)
-    stream.on_connect(on_connect)
 
     try:
-        await stream.connect()
-
         # Subscribe to depth only
         stream.subscribe_depths([SYMBOLS[0]])  # Just one symbol
 
         print(f"\n  Collecting depth data for 10 seconds...")
-
-        listen_task = asyncio.create_task(stream.listen())
         await asyncio.sleep(10)
 
-        listen_task.cancel()
-        try:
-            await listen_task
-        except asyncio.CancelledError:
-            pass
-
-        await stream.close()
+        stream.unsubscribe_depths([SYMBOLS[0]])
+        stream.on_message(None)
+        stream.decoder = json_decoder
 
         # Display results
         print(f"\n  Depth Updates Received: {depth_updates['count']}")
 
-        if latest_depth:
+        if any(latest_depth.values()):
             for symbol, depth in latest_depth.items():
+                if depth is None:
+                    continue
                 print(f"\n  Latest Order Book for {symbol}:")
 
-                if depth['bids']:
+                if depth.b:
                     print(f"\n    Top 5 Bids:")
-                    for i, bid in enumerate(depth['bids'][:5], 1):
-                        if isinstance(bid, dict):
-                            price = bid.get('p', 0)
-                            size = bid.get('s', 0)
-                            print(f"      {i}. ${price:,.2f} x {size}")
+                    for i, bid in enumerate(depth.b[:5], 1):
+                        print(f"      {i}. ${bid.p:,.2f} x {bid.sz}")
 
-                if depth['asks']:
+                if depth.a:
                     print(f"\n    Top 5 Asks:")
-                    for i, ask in enumerate(depth['asks'][:5], 1):
-                        if isinstance(ask, dict):
-                            price = ask.get('p', 0)
-                            size = ask.get('s', 0)
-                            print(f"      {i}. ${price:,.2f} x {size}")
+                    for i, ask in enumerate(depth.a[:5], 1):
+                        print(f"      {i}. ${ask.p:,.2f} x {ask.sz}")
         else:
             print("\n  No depth data received (may be outside market hours)")
 
@@ -268,9 +208,9 @@ async def example_depth_analysis(client):
 
 async def example_connection_lifecycle(client):
     """Demonstrate connection lifecycle management."""
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("EXAMPLE 4: Connection Lifecycle")
-    print("="*70)
+    print(SEP)
 
     stream = IronBeamStream(client)
 
@@ -316,31 +256,60 @@ async def example_connection_lifecycle(client):
 
 async def main():
     """Run all streaming examples."""
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("IRONBEAM SDK - WEBSOCKET STREAMING EXAMPLES")
-    print("="*70)
+    print(SEP)
 
     # Setup
     client = setup_client()
     print("\n✓ Authenticated")
 
+    # One connection shared by the data examples - each swaps in its own
+    # handler and subscriptions instead of opening a new WebSocket
+    stream = IronBeamStream(client)
+
+    async def on_connect(stream_id):
+        print(f"\n  ✓ Connected to stream: {stream_id}")
+
+    async def on_error(error):
+        print(f"\n  ✗ Stream error: {error}")
+
+    stream.on_connect(on_connect)
+    stream.on_error(on_error)
+
+    print(f"\n  Connecting to WebSocket...")
+    await stream.connect()
+    listen_task = asyncio.create_task(stream.listen())
+
     # Run examples
-    await example_basic_streaming(client)
-    await example_quote_processing(client)
-    await example_depth_analysis(client)
+    try:
+        await example_basic_streaming(stream)
+        await example_quote_processing(stream)
+        await example_depth_analysis(stream)
+    finally:
+        listen_task.cancel()
+        try:
+            await listen_task
+        except asyncio.CancelledError:
+            pass
+        await stream.close()
+
+    # The lifecycle example opens and closes its own stream on purpose
     await example_connection_lifecycle(client)
 
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("EXAMPLES COMPLETE")
-    print("="*70)
+    print(SEP)
     print("\nKey Takeaways:")
     print("  1. Use IronBeamStream for WebSocket connections")
     print("  2. Register handlers for messages, connections, and errors")
-    print("  3. Subscribe to quotes, depths, and trades separately")
+    print("  3. Subscribe to quotes, depths, and trades with one call")
     print("  4. Process messages in async handlers")
     print("  5. Always close stream when done")
     print("  6. Market data availability depends on market hours")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(format="%(message)s")
+    log.setLevel(logging.DEBUG)
     asyncio.run(main())
@@ -355,14 +355,15 @@ async def combined_management():
 
 # Pattern 1: Complete Trading Workflow
 def complete_workflow():
-    # Authenticate
+    # Open two pooled connections up front, then authenticate
+    client.warm_up(connections=2)
     client.authenticate()
 
-    # Check balance
-    balance = client.get_account_balance("account_id")
-
-    # Get quote
-    quotes = client.get_quotes(["XCME:ES.Z24"])
+    # Check balance and get a quote concurrently over the pooled connections
+    balance, quotes = client.batch(
+        ('get_account_balance', "account_id"),
+        ('get_quotes', ["XCME:ES.Z24"]),
+    )
     current_price = quotes['quotes'][0]['lastPrice']
 
     # Place order with bracket
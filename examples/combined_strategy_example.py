@@ -8,7 +8,6 @@ on the same position for comprehensive trade management.
 import asyncio
 from ironbeam import (
     IronBeam,
-    IronBeamStream,
     AsyncExecutor,
     AutoBreakevenConfig,
     RunningTPConfig,
@@ -100,8 +99,7 @@ async def full_trade_management_example():
 
     # Step 5: Set up async executor with WebSocket
     print(f"\n=== Starting Trade Management ===")
-    stream = IronBeamStream(client)
-    executor = AsyncExecutor(client, account_id, stream)
+    executor = AsyncExecutor(client, account_id)
 
     # Add both managers
     await executor.add_auto_breakeven(order_id, position, breakeven_config)
@@ -264,6 +262,7 @@ async def comparison_threaded_vs_async():
     print("\n=== ThreadedExecutor (Polling) ===")
     print("Pros: Simple, works anywhere, lower resource usage")
     print("Cons: 1-2 second latency, polling overhead")
+    print("Tip: use_stream=True feeds it WebSocket quotes instead of polling")
 
     threaded = ThreadedExecutor(client, "your_account_id", poll_interval=1.0)
     threaded.add_auto_breakeven("test_order", position, config)
@@ -289,9 +288,16 @@ async def comparison_threaded_vs_async():
 
 
 if __name__ == "__main__":
+    # uvloop is optional; when installed it speeds up the streaming loop
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    run = uvloop.run if uvloop is not None else asyncio.run
+
     # Run full trade management example
-    asyncio.run(full_trade_management_example())
+    run(full_trade_management_example())
 
     # Or try other examples:
-    # asyncio.run(multiple_positions_example())
-    # asyncio.run(comparison_threaded_vs_async())
+    # run(multiple_positions_example())
+    # run(comparison_threaded_vs_async())
@@ -10,7 +10,6 @@ Demonstrates how to use the RunningTPManager with multiple strategies:
 import asyncio
 from ironbeam import (
     IronBeam,
-    IronBeamStream,
     AsyncExecutor,
     RunningTPConfig,
     PositionState,
@@ -53,8 +52,7 @@ async def main():
     )
 
     # Use AsyncExecutor for real-time WebSocket updates
-    stream = IronBeamStream(client)
-    executor = AsyncExecutor(client, account_id, stream)
+    executor = AsyncExecutor(client, account_id)
 
     # Add position for running TP management
     await executor.add_running_tp(
@@ -221,10 +219,17 @@ async def short_position_example():
 
 
 if __name__ == "__main__":
+    # uvloop is optional; when installed it speeds up the streaming loop
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    run = uvloop.run if uvloop is not None else asyncio.run
+
     # Run the main example
-    asyncio.run(main())
+    run(main())
 
     # Or try other examples:
-    # asyncio.run(profit_levels_example())
-    # asyncio.run(combined_modes_example())
-    # asyncio.run(short_position_example())
+    # run(profit_levels_example())
+    # run(combined_modes_example())
+    # run(short_position_example())
@@ -48,6 +48,7 @@ For full documentation: help(ironbeam.IronBeam) or see README.md
 # and using __all__ to control what's shown
 
 from .client import IronBeam
+from ._session import get_client
 from .streaming import IronBeamStream, ConnectionState
 from .trade_manager import (
     AutoBreakevenManager,
@@ -81,6 +82,7 @@ from .models import (
     Risk,
     AccountRisk,
     Fill,
+    FillLite,
     AccountFills,
     # Order Models
     OrderRequest,
@@ -174,6 +176,7 @@ __version__ = "0.1.0"
 __all__ = [
     # === CORE CLASSES (main functionality) ===
     "IronBeam",
+    "get_client",
     "IronBeamStream", 
     "ConnectionState",
     
@@ -0,0 +1,41 @@
+"""Process-wide shared IronBeam clients."""
+import threading
+import time
+
+from .client import IronBeam
+
+# Seconds a shared client's token is reused before it logs in again
+TOKEN_TTL = 3600.0
+
+_clients = {}
+_lock = threading.Lock()
+
+
+def get_client(api_key, username, password=None, mode="demo", token_ttl=TOKEN_TTL) -> IronBeam:
+    """Get an authenticated IronBeam client shared across the process.
+
+    The first call for a set of credentials creates and authenticates the
+    client; later calls return the same instance, so its token and pooled
+    HTTPS connections are reused instead of logging in again. Once the
+    token is older than token_ttl the client re-authenticates in place.
+
+    Args:
+        api_key: API key
+        username: Account username
+        password: Account password (optional)
+        mode: "demo" or "live"
+        token_ttl: Seconds before the cached token is refreshed
+
+    Returns:
+        Authenticated IronBeam client
+    """
+    key = (api_key, username, password, mode)
+    with _lock:
+        client, authenticated_at = _clients.get(key, (None, 0.0))
+        if client is None:
+            client = IronBeam(api_key=api_key, username=username, password=password, mode=mode)
+        now = time.monotonic()
+        if client.token is None or now - authenticated_at >= token_ttl:
+            client.authenticate()
+            _clients[key] = (client, now)
+        return client
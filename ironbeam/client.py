@@ -1,12 +1,20 @@
+import json
+import logging
 import requests
-from typing import List, Optional, Union, Dict, Any
+import threading
+import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Union, Dict, Any, Tuple, Iterator
 from .exceptions import AuthenticationError, InvalidRequestError
 from .models import (
     # Authentication
     AuthenticationRequest, Token, LogoutResponse,
     # Account
     AccountBalanceRequest, AccountBalance, TraderInfo, UserInfo,
-    AccountPositions, AccountRisk, AccountFills,
+    AccountPositions, AccountRisk, AccountFills, Fill, FillLite,
     # Orders
     OrderRequest, OrderUpdateRequest, OrderResponse, OrdersRequest, OrdersResponse,
     CancelOrderResponse, CancelMultipleRequest, CancelMultipleResponse, OrderStatusResponse,
@@ -36,6 +44,42 @@ from .models import (
     BalanceType, OrderStatus
 )
 
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+try:
+    import ijson
+except ImportError:  # ijson is optional, get_fills_iter falls back to response.json()
+    ijson = None
+
+try:
+    import httpx
+except ImportError:  # httpx is only needed for IronBeam(http2=True)
+    httpx = None
+
+# Transport errors for a failed or timed-out request, whichever client is in use
+_HTTP_ERRORS = (requests.HTTPError, requests.Timeout) + ((httpx.HTTPError,) if httpx else ())
+
+logger = logging.getLogger(__name__)
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default timeout to requests sent without one."""
+
+    def __init__(self, *args, timeout=None, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
 class IronBeam:
     """
     IronBeam API Client - Complete trading interface with 49+ endpoints
@@ -52,7 +96,39 @@ class IronBeam:
         client.authenticate()
         quotes = client.get_quotes(["XCME:ES.Z24"])
     """
-    def __init__(self, api_key, username, password=None, mode="demo"):
+    # Seconds a security definitions response is reused for the same symbols
+    security_definitions_ttl = 300.0
+    # Most symbol sets whose security definitions are cached at once
+    security_definitions_cache_size = 64
+    # Retries for rate-limited (429) and 5xx responses on idempotent requests,
+    # waiting backoff * 2**n seconds between attempts (or Retry-After if sent)
+    max_retries = 3
+    retry_backoff = 0.5
+    # Most connections kept open, and requests in flight, per host
+    max_connections = 32
+    # Idle connections kept alive for reuse (http2=True)
+    max_keepalive_connections = 16
+    # Seconds to wait for a connection, and for each response read, so a
+    # stalled request fails instead of holding a pooled connection forever
+    connect_timeout = 2.0
+    read_timeout = 10.0
+    # Sent with every request on the pooled session
+    session_headers = {"Connection": "keep-alive", "User-Agent": "ironbeam-sdk-python"}
+    # Seconds queue_subscription waits for more symbols before sending
+    subscription_batch_window = 0.005
+
+    def __init__(self, api_key, username, password=None, mode="demo", http2=False):
+        """Create a client.
+
+        Args:
+            api_key: API key
+            username: Account username
+            password: Account password (optional)
+            mode: "demo" or "live"
+            http2: Send requests over httpx with HTTP/2, so concurrent calls
+                share one multiplexed connection. Requires the 'http2' extra;
+                HTTP errors are then raised as httpx.HTTPStatusError.
+        """
         self.api_key = api_key
         self.username = username
         self.password = password
@@ -61,6 +137,67 @@ class IronBeam:
         if mode == "live":
             self.base_url = "https://live.ironbeamapi.com/v2/"
         self.token = None
+        self._security_definitions_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._security_definitions_lock = threading.Lock()
+        self._pending_subscriptions = {}
+        self._subscription_timer = None
+        self._subscription_lock = threading.Lock()
+        self._http2 = http2
+        if http2:
+            if httpx is None:
+                raise ImportError("http2=True requires httpx: pip install 'ironbeam-sdk[http2]'")
+            self._session = httpx.Client(
+                http2=True,
+                headers={"User-Agent": self.session_headers["User-Agent"]},
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                ),
+                timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout),
+            )
+        else:
+            # One pooled session so every call reuses kept-alive TCP/TLS connections.
+            # pool_block caps concurrent requests per host at max_connections, so
+            # wide thread pools queue here instead of tripping the rate limit.
+            retry = Retry(
+                total=self.max_retries,
+                backoff_factor=self.retry_backoff,
+                status_forcelist=(429, 500, 502, 503, 504),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            self._session = requests.Session()
+            self._session.headers.update(self.session_headers)
+            self._session.mount("https://", _TimeoutHTTPAdapter(
+                pool_connections=16, pool_maxsize=self.max_connections,
+                pool_block=True, max_retries=retry,
+                timeout=(self.connect_timeout, self.read_timeout),
+            ))
+
+    def warm_up(self, connections: int = 1) -> int:
+        """Open pooled connections before the first real requests.
+
+        Sends HEAD requests to the API host concurrently, so up to
+        connections kept-alive TCP/TLS connections are in the pool and the
+        calls that follow (authenticate, a batch()) skip the handshake.
+        Warming is best effort: failures are logged and ignored.
+
+        Args:
+            connections: Number of connections to open
+
+        Returns:
+            Number of warm-up requests that got a response
+        """
+        def head(_):
+            try:
+                self._session.head(self.base_url)
+                return True
+            except Exception as e:
+                logger.debug("Connection warm-up failed: %s", e)
+                return False
+
+        with ThreadPoolExecutor(max_workers=max(1, min(connections, self.max_connections))) as executor:
+            return sum(executor.map(head, range(connections)))
 
     def authenticate(self, request: Optional[AuthenticationRequest] = None) -> Token:
         """Authenticate and get a token.
@@ -87,7 +224,9 @@ class IronBeam:
             if self.password:
                 payload["password"] = self.password
 
-        response = requests.post(f"{self.base_url}/auth", json=payload)
+        response = self._session.post(
+            f"{self.base_url}/auth", headers={"Content-Type": "application/json"}, **self._json_body(payload)
+        )
         if response.status_code == 401:
             raise AuthenticationError("Unauthorized: Invalid API key or credentials.")
         if response.status_code == 400:
@@ -98,6 +237,12 @@ class IronBeam:
         self.token = token_data.get("token")
         return Token(**token_data)
 
+    def _json_body(self, payload) -> Dict[str, bytes]:
+        """Request kwargs sending payload as an already encoded JSON body."""
+        body = _json_dumps(payload)
+        # httpx takes raw bytes as content=; data= is for form fields there
+        return {"content": body} if self._http2 else {"data": body}
+
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for authenticated requests."""
         if not self.token:
@@ -118,7 +263,7 @@ class IronBeam:
             TraderInfo with account details
         """
         headers = self._get_headers()
-        response = requests.get(f"{self.base_url}/info/trader", headers=headers)
+        response = self._session.get(f"{self.base_url}/info/trader", headers=headers)
         response.raise_for_status()
         return TraderInfo(**response.json())
 
@@ -149,7 +294,7 @@ class IronBeam:
             bt = request.balance_type
             params = {"balanceType": bt.value if isinstance(bt, BalanceType) else bt}
 
-        response = requests.get(f"{self.base_url}/account/{account_id}/balance", headers=headers, params=params)
+        response = self._session.get(f"{self.base_url}/account/{account_id}/balance", headers=headers, params=params)
         response.raise_for_status()
         return AccountBalance(**response.json())
 
@@ -163,7 +308,7 @@ class IronBeam:
             AccountPositions with position list
         """
         headers = self._get_headers()
-        response = requests.get(f"{self.base_url}/account/{account_id}/positions", headers=headers)
+        response = self._session.get(f"{self.base_url}/account/{account_id}/positions", headers=headers)
         response.raise_for_status()
         return AccountPositions(**response.json())
 
@@ -177,7 +322,7 @@ class IronBeam:
             AccountRisk with risk metrics
         """
         headers = self._get_headers()
-        response = requests.get(f"{self.base_url}/account/{account_id}/risk", headers=headers)
+        response = self._session.get(f"{self.base_url}/account/{account_id}/risk", headers=headers)
         response.raise_for_status()
         return AccountRisk(**response.json())
 
@@ -191,10 +336,46 @@ class IronBeam:
             AccountFills with fill history
         """
         headers = self._get_headers()
-        response = requests.get(f"{self.base_url}/account/{account_id}/fills", headers=headers)
+        response = self._session.get(f"{self.base_url}/account/{account_id}/fills", headers=headers)
         response.raise_for_status()
         return AccountFills(**response.json())
 
+    def get_fills_iter(self, account_id: str, lite: bool = False) -> Iterator[Union[Fill, FillLite]]:
+        """Iterate over account fills as they are parsed.
+
+        With ijson installed the response body is streamed and each fill is
+        yielded as soon as it is decoded, so the full list is never held in
+        memory. Without it, or with http2=True, the response is parsed in
+        one go.
+
+        Args:
+            account_id: Account ID
+            lite: Yield FillLite models, which validate only the id, symbol,
+                side, quantity, price and time fields
+
+        Yields:
+            Fill (or FillLite) for each entry in the account's fill history
+        """
+        model = FillLite if lite else Fill
+        headers = self._get_headers()
+        url = f"{self.base_url}/account/{account_id}/fills"
+        streaming = ijson is not None and not self._http2
+        if streaming:
+            response = self._session.get(url, headers=headers, stream=True)
+        else:
+            response = self._session.get(url, headers=headers)
+        try:
+            response.raise_for_status()
+            if not streaming:
+                items = response.json().get("fills", [])
+            else:
+                response.raw.decode_content = True
+                items = ijson.items(response.raw, "fills.item", use_float=True)
+            for item in items:
+                yield model.model_validate(item)
+        finally:
+            response.close()
+
     def get_quotes(self, symbols) -> QuotesResponse:
         """Get quotes for a list of symbols.
 
@@ -203,7 +384,7 @@ class IronBeam:
         """
         headers = self._get_headers()
         params = {"symbols": ",".join(symbols)}
-        response = requests.get(f"{self.base_url}/market/quotes", headers=headers, params=params)
+        response = self._session.get(f"{self.base_url}/market/quotes", headers=headers, params=params)
         response.raise_for_status()
         return QuotesResponse(**response.json())
 
@@ -215,7 +396,7 @@ class IronBeam:
         """
         headers = self._get_headers()
         params = {"symbols": ",".join(symbols)}
-        response = requests.get(f"{self.base_url}/market/depth", headers=headers, params=params)
+        response = self._session.get(f"{self.base_url}/market/depth", headers=headers, params=params)
         response.raise_for_status()
         return DepthResponse(**response.json())
 
@@ -227,7 +408,7 @@ class IronBeam:
         """
         headers = self._get_headers()
         url = f"{self.base_url}/market/trades/{symbol}/{from_time}/{to_time}/{max_records}/{earlier}"
-        response = requests.get(url, headers=headers)
+        response = self._session.get(url, headers=headers)
         response.raise_for_status()
         return TradesResponse(**response.json())
 
@@ -241,7 +422,7 @@ class IronBeam:
         # Convert Pydantic model to dict if necessary
         if hasattr(order, 'model_dump'):
             order = order.model_dump(by_alias=True, exclude_none=True)
-        response = requests.post(f"{self.base_url}/order/{account_id}/place", headers=headers, json=order)
+        response = self._session.post(f"{self.base_url}/order/{account_id}/place", headers=headers, **self._json_body(order))
         response.raise_for_status()
         return OrderResponse(**response.json())
 
@@ -255,7 +436,7 @@ class IronBeam:
         # Convert Pydantic model to dict if necessary
         if hasattr(order_update, 'model_dump'):
             order_update = order_update.model_dump(by_alias=True, exclude_none=True)
-        response = requests.put(f"{self.base_url}/order/{account_id}/update/{order_id}", headers=headers, json=order_update)
+        response = self._session.put(f"{self.base_url}/order/{account_id}/update/{order_id}", headers=headers, **self._json_body(order_update))
         response.raise_for_status()
         return OrderResponse(**response.json())
 
@@ -266,7 +447,7 @@ class IronBeam:
             CancelOrderResponse with cancellation status
         """
         headers = self._get_headers()
-        response = requests.delete(f"{self.base_url}/order/{account_id}/cancel/{order_id}", headers=headers)
+        response = self._session.delete(f"{self.base_url}/order/{account_id}/cancel/{order_id}", headers=headers)
         response.raise_for_status()
         return CancelOrderResponse(**response.json())
 
@@ -277,7 +458,7 @@ class IronBeam:
             OrdersResponse with list of orders
         """
         headers = self._get_headers()
-        response = requests.get(f"{self.base_url}/order/{account_id}/{order_status}", headers=headers)
+        response = self._session.get(f"{self.base_url}/order/{account_id}/{order_status}", headers=headers)
         response.raise_for_status()
         return OrdersResponse(**response.json())
 
@@ -359,7 +540,7 @@ class IronBeam:
             OrderStatusResponse with the status of the order
         """
         headers = self._get_headers()
-        response = requests.get(f"{self.base_url}/order/{account_id}/{order_status}", headers=headers)
+        response = self._session.get(f"{self.base_url}/order/{account_id}/{order_status}", headers=headers)
         response.raise_for_status()
         # extract orders list from response
         order_status_data = response.json()['orders']
@@ -379,48 +560,114 @@ class IronBeam:
             OrdersFillsResponse with fill history
         """
         headers = self._get_headers()
-        response = requests.get(f"{self.base_url}/order/{account_id}/fills", headers=headers)
+        response = self._session.get(f"{self.base_url}/order/{account_id}/fills", headers=headers)
         response.raise_for_status()
         return OrdersFillsResponse(**response.json())
 
     def get_security_definitions(self, symbols) -> SecurityDefinitionsResponse:
         """Get security definitions for a list of symbols.
 
+        Definitions are reference data, so responses are cached per symbol
+        set for security_definitions_ttl seconds, keeping the
+        security_definitions_cache_size most recently used sets. A cached
+        response is shared by every caller asking for the same symbols, so
+        treat it as read-only.
+
         Returns:
             SecurityDefinitionsResponse with security details
         """
+        key = tuple(sorted(symbols))
+        cache = self._security_definitions_cache
+        with self._security_definitions_lock:
+            cached = cache.get(key)
+            if cached and time.monotonic() - cached[0] < self.security_definitions_ttl:
+                cache.move_to_end(key)
+                return cached[1]
+
         headers = self._get_headers()
         params = {"symbols": ",".join(symbols)}
-        response = requests.get(f"{self.base_url}/info/security/definitions", headers=headers, params=params)
+        response = self._session.get(f"{self.base_url}/info/security/definitions", headers=headers, params=params)
         response.raise_for_status()
-        return SecurityDefinitionsResponse(**response.json())
+        definitions = SecurityDefinitionsResponse(**response.json())
+        with self._security_definitions_lock:
+            cache[key] = (time.monotonic(), definitions)
+            cache.move_to_end(key)
+            while len(cache) > self.security_definitions_cache_size:
+                cache.popitem(last=False)
+        return definitions
+
+    def try_get_security_definitions(self, symbols) -> Tuple[Optional[SecurityDefinitionsResponse], Optional[Exception]]:
+        """Get security definitions, returning HTTP failures instead of raising.
+
+        Only HTTP status errors and timeouts are caught; anything else (such
+        as a missing token) still raises.
+
+        Returns:
+            (definitions, None) on success, or (None, error) if the request failed
+        """
+        try:
+            return self.get_security_definitions(symbols), None
+        except _HTTP_ERRORS as e:
+            return None, e
+
+    def batch(self, *calls: Tuple, max_workers: int = 8) -> List[Any]:
+        """Run several client calls concurrently.
+
+        The REST API has no batch endpoint, so each call is still its own
+        request; they are issued in parallel so the batch takes about one
+        round-trip instead of one per call.
+
+        Args:
+            *calls: (method_name, *args) tuples, e.g. ('get_quotes', [symbol])
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            Results in call order. A call that fails returns its exception
+            instead of raising, so one failure doesn't lose the other results.
+
+        Example:
+            quotes, depth, defs = client.batch(
+                ('get_quotes', [symbol]),
+                ('get_depth', [symbol]),
+                ('get_security_definitions', [symbol]),
+            )
+        """
+        def run(call):
+            method, *args = call
+            try:
+                return getattr(self, method)(*args)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(calls)))) as executor:
+            return list(executor.map(run, calls))
 
     def get_symbols(self, text, limit=100, prefer_active=True):
         """Search for symbols."""
         headers = self._get_headers()
         params = {"text": text, "limit": limit, "preferActive": prefer_active}
-        response = requests.get(f"{self.base_url}/info/symbols", headers=headers, params=params)
+        response = self._session.get(f"{self.base_url}/info/symbols", headers=headers, params=params)
         response.raise_for_status()
         return response.json()
 
     def create_simulated_trader(self, trader_details):
         """Create a simulated trader."""
         headers = self._get_headers()
-        response = requests.post(f"{self.base_url}/simulatedTraderCreate", headers=headers, json=trader_details)
+        response = self._session.post(f"{self.base_url}/simulatedTraderCreate", headers=headers, **self._json_body(trader_details))
         response.raise_for_status()
         return response.json()
 
     def add_simulated_account(self, account_details):
         """Add a simulated account to a trader."""
         headers = self._get_headers()
-        response = requests.post(f"{self.base_url}/simulatedAccountAdd", headers=headers, json=account_details)
+        response = self._session.post(f"{self.base_url}/simulatedAccountAdd", headers=headers, **self._json_body(account_details))
         response.raise_for_status()
         return response.json()
 
     def create_stream(self):
         """Create a new stream for websocket communication."""
         headers = self._get_headers()
-        response = requests.get(f"{self.base_url}/stream/create", headers=headers)
+        response = self._session.get(f"{self.base_url}/stream/create", headers=headers)
         response.raise_for_status()
         stream_id = response.json().get("streamId")
         return stream_id
@@ -430,7 +677,7 @@ class IronBeam:
     def logout(self):
         """Logout and invalidate the current token."""
         headers = self._get_headers()
-        response = requests.post(f"{self.base_url}/logout", headers=headers)
+        response = self._session.post(f"{self.base_url}/logout", headers=headers)
         response.raise_for_status()
         self.token = None
         return response.json()
@@ -440,7 +687,7 @@ class IronBeam:
     def get_user_info(self):
         """Get user information."""
         headers = self._get_headers()
-        response = requests.get(f"{self.base_url}/info/user", headers=headers)
+        response = self._session.get(f"{self.base_url}/info/user", headers=headers)
         response.raise_for_status()
         return response.json()
 
@@ -452,7 +699,7 @@ class IronBeam:
         """
         headers = self._get_headers()
         params = {"symbols": ",".join(symbols)}
-        response = requests.get(f"{self.base_url}/info/security/margin", headers=headers, params=params)
+        response = self._session.get(f"{self.base_url}/info/security/margin", headers=headers, params=params)
         response.raise_for_status()
         return response.json()
 
@@ -464,14 +711,14 @@ class IronBeam:
         """
         headers = self._get_headers()
         params = {"symbols": ",".join(symbols)}
-        response = requests.get(f"{self.base_url}/info/security/status", headers=headers, params=params)
+        response = self._session.get(f"{self.base_url}/info/security/status", headers=headers, params=params)
         response.raise_for_status()
         return response.json()
 
     def get_exchange_sources(self):
         """Get list of available exchange sources."""
         headers = self._get_headers()
-        response = requests.get(f"{self.base_url}/info/exchangeSources", headers=headers)
+        response = self._session.get(f"{self.base_url}/info/exchangeSources", headers=headers)
         response.raise_for_status()
         return response.json()
 
@@ -482,7 +729,7 @@ class IronBeam:
             exchange: Exchange code (e.g., "CME", "CBOT")
         """
         headers = self._get_headers()
-        response = requests.get(f"{self.base_url}/info/complexes/{exchange}", headers=headers)
+        response = self._session.get(f"{self.base_url}/info/complexes/{exchange}", headers=headers)
         response.raise_for_status()
         return response.json()
 
@@ -494,7 +741,7 @@ class IronBeam:
             market_group: Market group
         """
         headers = self._get_headers()
-        response = requests.get(f"{self.base_url}/info/symbol/search/futures/{exchange}/{market_group}", headers=headers)
+        response = self._session.get(f"{self.base_url}/info/symbol/search/futures/{exchange}/{market_group}", headers=headers)
         response.raise_for_status()
         return response.json()
 
@@ -505,7 +752,7 @@ class IronBeam:
             complex: Complex identifier
         """
         headers = self._get_headers()
-        response = requests.get(f"{self.base_url}/info/symbol/search/groups/{complex}", headers=headers)
+        response = self._session.get(f"{self.base_url}/info/symbol/search/groups/{complex}", headers=headers)
         response.raise_for_status()
         return response.json()
 
@@ -516,7 +763,7 @@ class IronBeam:
             symbol: Underlying symbol
         """
         headers = self._get_headers()
-        response = requests.get(f"{self.base_url}/info/symbol/search/options/{symbol}", headers=headers)
+        response = self._session.get(f"{self.base_url}/info/symbol/search/options/{symbol}", headers=headers)
         response.raise_for_status()
         return response.json()
 
@@ -527,7 +774,7 @@ class IronBeam:
             symbol: Underlying symbol
         """
         headers = self._get_headers()
-        response = requests.get(f"{self.base_url}/info/symbol/search/options/spreads/{symbol}", headers=headers)
+        response = self._session.get(f"{self.base_url}/info/symbol/search/options/spreads/{symbol}", headers=headers)
         response.raise_for_status()
         return response.json()
 
@@ -540,7 +787,7 @@ class IronBeam:
         """
         headers = self._get_headers()
         params = {"orderIds": ",".join(order_ids)}
-        response = requests.get(f"{self.base_url}/info/strategyId", headers=headers, params=params)
+        response = self._session.get(f"{self.base_url}/info/strategyId", headers=headers, params=params)
         response.raise_for_status()
         return response.json()
 
@@ -555,10 +802,31 @@ class IronBeam:
         """
         headers = self._get_headers()
         payload = {"orderIds": order_ids}
-        response = requests.delete(f"{self.base_url}/order/{account_id}/cancelMultiple", headers=headers, json=payload)
+        response = self._session.request("DELETE", f"{self.base_url}/order/{account_id}/cancelMultiple", headers=headers, **self._json_body(payload))
         response.raise_for_status()
         return response.json()
 
+    def update_multiple_orders(self, account_id, updates: Dict[str, Any], max_workers: int = 8) -> Dict[str, Any]:
+        """Update multiple orders at once.
+
+        The API has no batch update endpoint, so the updates are sent
+        concurrently through batch() and take about one round-trip.
+
+        Args:
+            account_id: Account ID
+            updates: Update request per order ID
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            OrderResponse per order ID, or the exception for an update that failed
+        """
+        order_ids = list(updates)
+        results = self.batch(
+            *(('update_order', account_id, order_id, updates[order_id]) for order_id in order_ids),
+            max_workers=max_workers,
+        )
+        return dict(zip(order_ids, results))
+
     def get_to_order_id(self, account_id, strategy_id):
         """Convert strategy ID to order ID.
 
@@ -567,7 +835,7 @@ class IronBeam:
             strategy_id: Strategy ID
         """
         headers = self._get_headers()
-        response = requests.get(f"{self.base_url}/order/{account_id}/toorderid/{strategy_id}", headers=headers)
+        response = self._session.get(f"{self.base_url}/order/{account_id}/toorderid/{strategy_id}", headers=headers)
         response.raise_for_status()
         return response.json()
 
@@ -579,7 +847,7 @@ class IronBeam:
             order_id: Order ID
         """
         headers = self._get_headers()
-        response = requests.get(f"{self.base_url}/order/{account_id}/tostrategyId/{order_id}", headers=headers)
+        response = self._session.get(f"{self.base_url}/order/{account_id}/tostrategyId/{order_id}", headers=headers)
         response.raise_for_status()
         return response.json()
 
@@ -600,7 +868,7 @@ class IronBeam:
         print(f"🔍 Debug - Payload: {payload}")
         print(f"🔍 Debug - URL: {self.base_url}/simulatedAccountReset")
         
-        response = requests.put(f"{self.base_url}/simulatedAccountReset", headers=headers, json=payload)
+        response = self._session.put(f"{self.base_url}/simulatedAccountReset", headers=headers, **self._json_body(payload))
         
         # Debug the response
         print(f"🔍 Debug - Response status: {response.status_code}")
@@ -619,7 +887,7 @@ class IronBeam:
         """
         headers = self._get_headers()
         payload = {"accountId": account_id, "password": password}
-        response = requests.delete(f"{self.base_url}/simulatedAccountExpire", headers=headers, json=payload)
+        response = self._session.request("DELETE", f"{self.base_url}/simulatedAccountExpire", headers=headers, **self._json_body(payload))
         response.raise_for_status()
         return response.json()
 
@@ -639,7 +907,7 @@ class IronBeam:
             "amount": amount,
             "currency": currency
         }
-        response = requests.post(f"{self.base_url}/simulatedAccount/addCash", headers=headers, json=payload)
+        response = self._session.post(f"{self.base_url}/simulatedAccount/addCash", headers=headers, **self._json_body(payload))
         response.raise_for_status()
         return response.json()
 
@@ -650,7 +918,7 @@ class IronBeam:
             account_id: Account ID
         """
         headers = self._get_headers()
-        response = requests.get(f"{self.base_url}/simulatedAccount/getCashReport/{account_id}", headers=headers)
+        response = self._session.get(f"{self.base_url}/simulatedAccount/getCashReport/{account_id}", headers=headers)
         response.raise_for_status()
         return response.json()
 
@@ -665,7 +933,7 @@ class IronBeam:
         """
         headers = self._get_headers()
         params = {"symbols": ",".join(symbols)}
-        response = requests.get(f"{self.base_url}/market/quotes/subscribe/{stream_id}", headers=headers, params=params)
+        response = self._session.get(f"{self.base_url}/market/quotes/subscribe/{stream_id}", headers=headers, params=params)
         response.raise_for_status()
         return response.json()
 
@@ -678,7 +946,7 @@ class IronBeam:
         """
         headers = self._get_headers()
         params = {"symbols": ",".join(symbols)}
-        response = requests.get(f"{self.base_url}/market/depths/subscribe/{stream_id}", headers=headers, params=params)
+        response = self._session.get(f"{self.base_url}/market/depths/subscribe/{stream_id}", headers=headers, params=params)
         response.raise_for_status()
         return response.json()
 
@@ -691,7 +959,7 @@ class IronBeam:
         """
         headers = self._get_headers()
         params = {"symbols": ",".join(symbols)}
-        response = requests.get(f"{self.base_url}/market/trades/subscribe/{stream_id}", headers=headers, params=params)
+        response = self._session.get(f"{self.base_url}/market/trades/subscribe/{stream_id}", headers=headers, params=params)
         response.raise_for_status()
         return response.json()
 
@@ -704,7 +972,7 @@ class IronBeam:
         """
         headers = self._get_headers()
         params = {"symbols": ",".join(symbols)}
-        response = requests.get(f"{self.base_url}/market/quotes/unsubscribe/{stream_id}", headers=headers, params=params)
+        response = self._session.get(f"{self.base_url}/market/quotes/unsubscribe/{stream_id}", headers=headers, params=params)
         response.raise_for_status()
         return response.json()
 
@@ -717,7 +985,7 @@ class IronBeam:
         """
         headers = self._get_headers()
         params = {"symbols": ",".join(symbols)}
-        response = requests.get(f"{self.base_url}/market/depths/unsubscribe/{stream_id}", headers=headers, params=params)
+        response = self._session.get(f"{self.base_url}/market/depths/unsubscribe/{stream_id}", headers=headers, params=params)
         response.raise_for_status()
         return response.json()
 
@@ -730,10 +998,55 @@ class IronBeam:
         """
         headers = self._get_headers()
         params = {"symbols": ",".join(symbols)}
-        response = requests.get(f"{self.base_url}/market/trades/unsubscribe/{stream_id}", headers=headers, params=params)
+        response = self._session.get(f"{self.base_url}/market/trades/unsubscribe/{stream_id}", headers=headers, params=params)
         response.raise_for_status()
         return response.json()
 
+    def queue_subscription(self, stream_id, channel, symbols):
+        """Queue a market data subscription to be sent together with others.
+
+        Subscriptions queued within subscription_batch_window of each other
+        for the same stream and channel go out as one subscribe request
+        carrying all their symbols. Use flush_subscriptions() to send the
+        queue straight away.
+
+        Args:
+            stream_id: Stream ID from create_stream()
+            channel: 'quotes', 'depths' or 'trades'
+            symbols: List of symbols to subscribe
+        """
+        if channel not in ('quotes', 'depths', 'trades'):
+            raise ValueError(f"Unknown channel: {channel}")
+        with self._subscription_lock:
+            self._pending_subscriptions.setdefault((stream_id, channel), set()).update(symbols)
+            if self._subscription_timer is None:
+                self._subscription_timer = threading.Timer(self.subscription_batch_window, self.flush_subscriptions)
+                self._subscription_timer.daemon = True
+                self._subscription_timer.start()
+
+    def flush_subscriptions(self) -> List[Any]:
+        """Send all queued subscriptions now.
+
+        Returns:
+            One result per stream and channel, as from batch(): the
+            subscribe response, or the exception it raised
+        """
+        with self._subscription_lock:
+            pending, self._pending_subscriptions = self._pending_subscriptions, {}
+            timer, self._subscription_timer = self._subscription_timer, None
+        if timer is not None:
+            timer.cancel()
+        if not pending:
+            return []
+
+        calls = [(f"subscribe_{channel}", stream_id, sorted(symbols))
+                 for (stream_id, channel), symbols in pending.items()]
+        results = self.batch(*calls)
+        for call, result in zip(calls, results):
+            if isinstance(result, Exception):
+                logger.error("Queued %s for %s failed: %s", call[0], call[2], result)
+        return results
+
     def subscribe_tick_bars(self, stream_id, symbol, bar_size):
         """Subscribe to tick bar indicator.
 
@@ -744,7 +1057,7 @@ class IronBeam:
         """
         headers = self._get_headers()
         payload = {"exchSym": symbol, "barSize": bar_size}
-        response = requests.post(f"{self.base_url}/indicator/{stream_id}/tickBars/subscribe", headers=headers, json=payload)
+        response = self._session.post(f"{self.base_url}/indicator/{stream_id}/tickBars/subscribe", headers=headers, **self._json_body(payload))
         response.raise_for_status()
         return response.json()
 
@@ -758,7 +1071,7 @@ class IronBeam:
         """
         headers = self._get_headers()
         payload = {"exchSym": symbol, "barSize": bar_size}
-        response = requests.post(f"{self.base_url}/indicator/{stream_id}/tradeBars/subscribe", headers=headers, json=payload)
+        response = self._session.post(f"{self.base_url}/indicator/{stream_id}/tradeBars/subscribe", headers=headers, **self._json_body(payload))
         response.raise_for_status()
         return response.json()
 
@@ -772,7 +1085,7 @@ class IronBeam:
         """
         headers = self._get_headers()
         payload = {"exchSym": symbol, "barSize": bar_size}
-        response = requests.post(f"{self.base_url}/indicator/{stream_id}/timeBars/subscribe", headers=headers, json=payload)
+        response = self._session.post(f"{self.base_url}/indicator/{stream_id}/timeBars/subscribe", headers=headers, **self._json_body(payload))
         response.raise_for_status()
         return response.json()
 
@@ -786,7 +1099,7 @@ class IronBeam:
         """
         headers = self._get_headers()
         payload = {"exchSym": symbol, "barSize": bar_size}
-        response = requests.post(f"{self.base_url}/indicator/{stream_id}/volumeBars/subscribe", headers=headers, json=payload)
+        response = self._session.post(f"{self.base_url}/indicator/{stream_id}/volumeBars/subscribe", headers=headers, **self._json_body(payload))
         response.raise_for_status()
         return response.json()
 
@@ -798,7 +1111,7 @@ class IronBeam:
             indicator_id: Indicator ID to unsubscribe
         """
         headers = self._get_headers()
-        response = requests.delete(f"{self.base_url}/indicator/{stream_id}/unsubscribe/{indicator_id}", headers=headers)
+        response = self._session.delete(f"{self.base_url}/indicator/{stream_id}/unsubscribe/{indicator_id}", headers=headers)
         response.raise_for_status()
         return response.json()
 
@@ -998,7 +1311,7 @@ class IronBeam:
         margin_requirements = self.get_security_margin(symbol)['initialMarginLong']
 
         # Fetch contract details from the symbols info endpoint
-        response = requests.get(url, params=params)
+        response = self._session.get(url, params=params)
         if response.status_code != 200:
             raise Exception(f"Failed to get contract details for {symbol}: {response.text}")
 
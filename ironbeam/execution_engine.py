@@ -2,7 +2,8 @@
 Execution Engine for Trade Management
 
 Provides two execution models:
-1. ThreadedExecutor: Polls positions via REST API at intervals
+1. ThreadedExecutor: Polls positions via REST API at intervals, or with
+   use_stream=True reacts to WebSocket quotes from a background thread
 2. AsyncExecutor: Real-time execution using WebSocket price updates
 """
 
@@ -10,7 +11,8 @@ import threading
 import time
 import asyncio
 import logging
-from typing import Dict, Optional, List
+import queue
+from typing import Callable, Dict, Optional, List, Tuple
 from dataclasses import dataclass
 from .trade_manager import (
     AutoBreakevenManager,
@@ -22,6 +24,11 @@ from .trade_manager import (
 from .streaming import IronBeamStream
 from .models import OrderSide
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional, fall back to the default event loop
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,19 +40,45 @@ class ThreadedExecutor:
 
     Polls positions and market data via REST API at regular intervals.
     Good for lower-frequency updates and simpler deployment.
+
+    With use_stream=True, quotes come from an IronBeamStream run on its own
+    event loop thread instead. Ticks are handed to the executor thread
+    through a bounded queue and each one is checked as it arrives; the REST
+    poll then only runs every reconcile_interval as a fallback.
     """
 
-    def __init__(self, client, account_id: str, poll_interval: float = 1.0):
+    # Ticks buffered between the stream thread and the executor thread;
+    # the oldest tick is dropped when the executor falls behind
+    quote_queue_size = 1024
+
+    def __init__(
+        self,
+        client,
+        account_id: str,
+        poll_interval: float = 1.0,
+        use_stream: bool = False,
+        reconcile_interval: float = 30.0,
+        loop_factory: Optional[Callable[[], asyncio.AbstractEventLoop]] = None
+    ):
         """Initialize threaded executor.
 
         Args:
             client: IronBeam client instance
             account_id: Account ID to manage
             poll_interval: Polling interval in seconds (default: 1.0)
+            use_stream: Drive checks from WebSocket quotes instead of polling
+            reconcile_interval: Seconds between REST polls when use_stream
+                is set (default: 30.0)
+            loop_factory: Creates the stream thread's event loop, to run it
+                on another loop implementation (e.g. an io_uring-backed one);
+                defaults to uvloop when installed
         """
         self.client = client
         self.account_id = account_id
         self.poll_interval = poll_interval
+        self.use_stream = use_stream
+        self.reconcile_interval = reconcile_interval
+        self.loop_factory = loop_factory
 
         # Trade managers
         self.breakeven_manager = AutoBreakevenManager(client, account_id)
@@ -55,11 +88,23 @@ class ThreadedExecutor:
         self._thread: Optional[threading.Thread] = None
         self._running = False
         self._lock = threading.Lock()
+        # Set to cut the poll wait short (new position, stop)
+        self._wake = threading.Event()
 
         # Rate limiting
         self._last_update_time: Dict[str, float] = {}
         self._min_update_interval = 0.5  # Minimum 0.5s between updates per order
 
+        # Streaming (use_stream=True)
+        self._symbols: set = set()
+        self._quote_queue: "queue.Queue[Tuple[str, float]]" = queue.Queue(maxsize=self.quote_queue_size)
+        self._stream: Optional[IronBeamStream] = None
+        self._stream_thread: Optional[threading.Thread] = None
+        self._stream_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stream_task: Optional[asyncio.Task] = None
+        # Set by the stream thread once its loop and task exist
+        self._stream_ready = threading.Event()
+
     def add_auto_breakeven(
         self,
         order_id: str,
@@ -75,6 +120,8 @@ class ThreadedExecutor:
         """
         with self._lock:
             self.breakeven_manager.start_monitoring(order_id, position, config)
+        self._track_symbol(position.symbol)
+        self._wake.set()
 
     def add_running_tp(
         self,
@@ -91,6 +138,8 @@ class ThreadedExecutor:
         """
         with self._lock:
             self.tp_manager.start_monitoring(order_id, position, config)
+        self._track_symbol(position.symbol)
+        self._wake.set()
 
     def remove_position(self, order_id: str):
         """Remove a position from management.
@@ -102,6 +151,24 @@ class ThreadedExecutor:
             self.breakeven_manager.stop_monitoring(order_id)
             self.tp_manager.stop_monitoring(order_id)
 
+    def _track_symbol(self, symbol: str):
+        """Remember a managed symbol and subscribe to it if streaming."""
+        with self._lock:
+            if symbol in self._symbols:
+                return
+            self._symbols.add(symbol)
+        stream, loop = self._stream, self._stream_loop
+        if stream is not None and loop is not None and stream.stream_id:
+            # The stream loop reads subscriptions when resubscribing, so
+            # record the symbol from that loop rather than this thread
+            try:
+                loop.call_soon_threadsafe(stream.subscriptions['quotes'].add, symbol)
+            except RuntimeError:  # Loop closed, the stream is stopping
+                return
+            # Positions are often added in a burst; let the client merge
+            # their subscriptions into one request
+            self.client.queue_subscription(stream.stream_id, 'quotes', [symbol])
+
     def start(self):
         """Start the background execution thread."""
         if self._running:
@@ -109,9 +176,20 @@ class ThreadedExecutor:
             return
 
         self._running = True
+        if self.use_stream:
+            self._stream = IronBeamStream(self.client)
+            self._stream.on_message(self._enqueue_quotes)
+            self._stream_ready.clear()
+            self._stream_thread = threading.Thread(target=self._run_stream, daemon=True)
+            self._stream_thread.start()
+            # Wait for the stream loop so stop() always has a task to cancel
+            self._stream_ready.wait(timeout=5.0)
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
-        logger.info(f"ThreadedExecutor started (poll_interval={self.poll_interval}s)")
+        if self.use_stream:
+            logger.info(f"ThreadedExecutor started (streaming, reconcile_interval={self.reconcile_interval}s)")
+        else:
+            logger.info(f"ThreadedExecutor started (poll_interval={self.poll_interval}s)")
 
     def stop(self):
         """Stop the background execution thread."""
@@ -119,19 +197,130 @@ class ThreadedExecutor:
             return
 
         self._running = False
+        self._wake.set()
+        if self.use_stream:
+            # Wake the executor thread from its queue wait
+            self._put_tick(None)
+        # The stream thread clears these when it exits on its own
+        loop, task = self._stream_loop, self._stream_task
+        if loop is not None and task is not None:
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:  # Loop already closed
+                pass
+        if self._stream_thread:
+            self._stream_thread.join(timeout=5.0)
         if self._thread:
             self._thread.join(timeout=5.0)
+        self._stream = None
         logger.info("ThreadedExecutor stopped")
 
+    def _run_stream(self):
+        """Run the quote stream on its own event loop (stream thread)."""
+        if self.loop_factory is not None:
+            loop = self.loop_factory()
+        else:
+            loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._stream_loop = loop
+        try:
+            self._stream_task = loop.create_task(self._stream_quotes())
+            self._stream_ready.set()
+            loop.run_until_complete(self._stream_task)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Quote stream stopped: {e}", exc_info=True)
+        finally:
+            # Unblock start() even if the task could not be created
+            self._stream_ready.set()
+            loop.close()
+            self._stream_loop = None
+            self._stream_task = None
+
+    async def _stream_quotes(self):
+        """Connect, subscribe to the managed symbols and listen."""
+        stream = self._stream
+        try:
+            await stream.connect()
+            with self._lock:
+                symbols = list(self._symbols)
+            if symbols:
+                stream.subscribe_quotes(symbols)
+            await stream.listen()
+        finally:
+            await stream.close()
+
+    async def _enqueue_quotes(self, message):
+        """Pass the prices in a stream message on to the executor thread."""
+        if not isinstance(message, dict):
+            return
+        for quote in message.get('q', ()):
+            # Use last price, or midpoint of bid/ask
+            price = quote.get('l')
+            if not price:
+                bid = quote.get('b')
+                ask = quote.get('a')
+                if bid and ask:
+                    price = (bid + ask) / 2
+            symbol = quote.get('s')
+            if symbol and price:
+                self._put_tick((symbol, price))
+
+    def _put_tick(self, tick: Optional[Tuple[str, float]]):
+        """Queue a tick, dropping the oldest one if the queue is full."""
+        try:
+            self._quote_queue.put_nowait(tick)
+        except queue.Full:
+            try:
+                self._quote_queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._quote_queue.put_nowait(tick)
+            except queue.Full:
+                pass
+
     def _run_loop(self):
         """Main execution loop running in background thread."""
+        if self.use_stream:
+            self._run_stream_loop()
+            return
         while self._running:
             try:
+                self._wake.clear()
                 self._process_positions()
-                time.sleep(self.poll_interval)
+                # Sleep until the next poll, unless a position is added or
+                # stop() is called in the meantime
+                self._wake.wait(self.poll_interval)
+            except Exception as e:
+                logger.error(f"Error in execution loop: {e}", exc_info=True)
+
+    def _run_stream_loop(self):
+        """Check positions on each streamed tick, polling REST as a fallback."""
+        next_reconcile = time.monotonic() + self.reconcile_interval
+        while self._running:
+            try:
+                try:
+                    tick = self._quote_queue.get(timeout=self.poll_interval)
+                except queue.Empty:
+                    pass
+                else:
+                    # None is the wakeup queued by stop()
+                    if tick is not None:
+                        self._dispatch(*tick)
+
+                if time.monotonic() >= next_reconcile:
+                    self._process_positions()
+                    next_reconcile = time.monotonic() + self.reconcile_interval
             except Exception as e:
                 logger.error(f"Error in execution loop: {e}", exc_info=True)
 
+    def _dispatch(self, symbol: str, price: float):
+        """Check the managed positions in symbol against a new price."""
+        with self._lock:
+            self._check_positions({symbol: price})
+
     def _process_positions(self):
         """Process all managed positions."""
         with self._lock:
@@ -158,55 +347,69 @@ class ThreadedExecutor:
                 quotes_response = self.client.get_quotes(list(symbols))
                 quotes_dict = {}
 
-                if 'quotes' in quotes_response:
-                    for quote in quotes_response['quotes']:
-                        symbol = quote.get('exchSym')
-                        # Use last price, or midpoint of bid/ask
-                        price = quote.get('lastPrice')
-                        if not price:
-                            bid = quote.get('bidPrice')
-                            ask = quote.get('askPrice')
-                            if bid and ask:
-                                price = (bid + ask) / 2
-                        if price:
-                            quotes_dict[symbol] = price
-
-                # Process each position
-                current_time = time.time()
-
-                for order_id in all_orders:
-                    # Rate limiting check
-                    last_update = self._last_update_time.get(order_id, 0)
-                    if current_time - last_update < self._min_update_interval:
-                        continue
-
-                    # Get position and current price
-                    position = None
-                    if order_id in self.breakeven_manager.managed_positions:
-                        position, _ = self.breakeven_manager.managed_positions[order_id]
-                    elif order_id in self.tp_manager.managed_positions:
-                        position, _ = self.tp_manager.managed_positions[order_id]
-
-                    if not position or position.symbol not in quotes_dict:
-                        continue
-
-                    current_price = quotes_dict[position.symbol]
-
-                    # Check auto breakeven
-                    if order_id in breakeven_orders:
-                        updated = self.breakeven_manager.check_and_update(order_id, current_price)
-                        if updated:
-                            self._last_update_time[order_id] = current_time
-
-                    # Check running TP
-                    if order_id in tp_orders:
-                        updated = self.tp_manager.check_and_update(order_id, current_price)
-                        if updated:
-                            self._last_update_time[order_id] = current_time
+                for quote in quotes_response.quotes:
+                    # Use last price, or midpoint of bid/ask
+                    price = quote.last_price
+                    if not price:
+                        bid = quote.bid_price
+                        ask = quote.ask_price
+                        if bid and ask:
+                            price = (bid + ask) / 2
+                    if price:
+                        quotes_dict[quote.exch_sym] = price
+
+                self._check_positions(quotes_dict)
 
             except Exception as e:
                 logger.error(f"Error processing positions: {e}", exc_info=True)
 
+    def _check_positions(self, quotes_dict: Dict[str, float]):
+        """Run the managers for positions with a price in quotes_dict.
+
+        Must be called with the executor lock held.
+        """
+        # Breakeven only needs checking where the next trigger is reached
+        breakeven_orders = set()
+        for symbol, price in quotes_dict.items():
+            breakeven_orders.update(self.breakeven_manager.triggered_orders(symbol, price))
+        tp_orders = set(self.tp_manager.managed_positions.keys())
+
+        # Collect the price for each position that isn't rate limited
+        current_time = time.time()
+        breakeven_prices = {}
+        tp_prices = {}
+
+        for order_id in breakeven_orders | tp_orders:
+            # Rate limiting check
+            last_update = self._last_update_time.get(order_id, 0)
+            if current_time - last_update < self._min_update_interval:
+                continue
+
+            # Get position and current price
+            position = None
+            if order_id in self.breakeven_manager.managed_positions:
+                position, _ = self.breakeven_manager.managed_positions[order_id]
+            elif order_id in self.tp_manager.managed_positions:
+                position, _ = self.tp_manager.managed_positions[order_id]
+
+            if not position or position.symbol not in quotes_dict:
+                continue
+
+            current_price = quotes_dict[position.symbol]
+            if order_id in breakeven_orders:
+                breakeven_prices[order_id] = current_price
+            if order_id in tp_orders:
+                tp_prices[order_id] = current_price
+
+        # Moves due on the same pass are sent together
+        if breakeven_prices:
+            for order_id in self.breakeven_manager.check_and_update_many(breakeven_prices):
+                self._last_update_time[order_id] = current_time
+        if tp_prices:
+            for order_id in self.tp_manager.check_and_update_many(tp_prices):
+                self._last_update_time[order_id] = current_time
+
+
 
 # ==================== Async Executor ====================
 
@@ -216,19 +419,35 @@ class AsyncExecutor:
 
     Reacts to price updates via WebSocket streaming for immediate execution.
     Best for low-latency requirements and high-frequency updates.
+
+    Runs on the caller's event loop; starting it with uvloop.run() instead
+    of asyncio.run() (uvloop comes with the 'fast' extra) makes that loop
+    faster, and any other loop implementation can be used the same way.
+
+    Quotes from the stream are put on a bounded queue and checked by a
+    single consumer task, so the stream's parser never waits on order
+    updates. When the consumer falls behind the oldest quote is dropped.
+
+    By default executors for the same client share one stream
+    (IronBeamStream.get_shared), each registering a quote handler for its
+    own symbols, so running several of them opens a single WebSocket.
     """
 
+    # Quotes waiting for the consumer task
+    quote_queue_size = 256
+
     def __init__(self, client, account_id: str, stream: Optional[IronBeamStream] = None):
         """Initialize async executor.
 
         Args:
             client: IronBeam client instance
             account_id: Account ID to manage
-            stream: Optional IronBeamStream instance (will create if not provided)
+            stream: Optional IronBeamStream instance (the client's shared
+                stream if not provided)
         """
         self.client = client
         self.account_id = account_id
-        self.stream = stream or IronBeamStream(client)
+        self.stream = stream or IronBeamStream.get_shared(client)
 
         # Trade managers
         self.breakeven_manager = AutoBreakevenManager(client, account_id)
@@ -236,7 +455,8 @@ class AsyncExecutor:
 
         # Task control
         self._running = False
-        self._listen_task: Optional[asyncio.Task] = None
+        self._consumer_task: Optional[asyncio.Task] = None
+        self._quote_queue: Optional[asyncio.Queue] = None
 
         # Tracked symbols for streaming
         self._tracked_symbols: set = set()
@@ -302,11 +522,11 @@ class AsyncExecutor:
         Args:
             symbol: Symbol to subscribe to
         """
-        if symbol not in self._tracked_symbols:
-            if self.stream.state.value in ["CONNECTED"]:
-                self.stream.subscribe_quotes([symbol])
-                self._tracked_symbols.add(symbol)
-                logger.info(f"Subscribed to quotes for {symbol}")
+        # Before start() the symbols are registered along with the rest
+        if self._running and symbol not in self._tracked_symbols:
+            self.stream.add_quote_handler([symbol], self._enqueue_quote)
+            self._tracked_symbols.add(symbol)
+            logger.info(f"Subscribed to quotes for {symbol}")
 
     async def _cleanup_subscriptions(self):
         """Unsubscribe from symbols no longer needed."""
@@ -320,7 +540,7 @@ class AsyncExecutor:
         # Unsubscribe from symbols no longer needed
         symbols_to_remove = self._tracked_symbols - needed_symbols
         if symbols_to_remove:
-            self.stream.unsubscribe_quotes(list(symbols_to_remove))
+            self.stream.remove_quote_handler(list(symbols_to_remove), self._enqueue_quote)
             self._tracked_symbols -= symbols_to_remove
             logger.info(f"Unsubscribed from {len(symbols_to_remove)} symbols")
 
@@ -332,14 +552,14 @@ class AsyncExecutor:
 
         self._running = True
 
-        # Set up WebSocket callbacks
-        self.stream.on_quote(self._handle_quote)
-        self.stream.on_error(self._handle_error)
+        # Quotes are queued by the stream callbacks and handled by one consumer
+        self._quote_queue = asyncio.Queue(maxsize=self.quote_queue_size)
+        self._consumer_task = asyncio.create_task(self._consume_quotes())
 
-        # Connect and start listening
-        await self.stream.connect()
+        # The stream may be shared, so add a handler rather than replace its callback
+        self.stream.add_error_handler(self._handle_error)
 
-        # Subscribe to all symbols
+        # Route quotes for all symbols to the queue
         all_symbols = set()
         for position, _ in self.breakeven_manager.managed_positions.values():
             all_symbols.add(position.symbol)
@@ -347,11 +567,17 @@ class AsyncExecutor:
             all_symbols.add(position.symbol)
 
         if all_symbols:
-            self.stream.subscribe_quotes(list(all_symbols))
+            self.stream.add_quote_handler(list(all_symbols), self._enqueue_quote)
             self._tracked_symbols.update(all_symbols)
 
-        # Start listening
-        self._listen_task = asyncio.create_task(self.stream.listen())
+        # Connect and start listening, unless the stream already is
+        try:
+            await self.stream.acquire()
+        except Exception:
+            # acquire() already dropped our use of the stream; undo the
+            # rest so start() can be retried
+            await self._detach()
+            raise
 
         logger.info("AsyncExecutor started with WebSocket streaming")
 
@@ -360,37 +586,66 @@ class AsyncExecutor:
         if not self._running:
             return
 
+        await self._detach()
+        # The stream closes once no executor uses it
+        await self.stream.release()
+
+        logger.info("AsyncExecutor stopped")
+
+    async def _detach(self):
+        """Stop the consumer and remove our handlers from the stream."""
         self._running = False
 
-        # Cancel listen task
-        if self._listen_task:
-            self._listen_task.cancel()
+        # Cancel the consumer task
+        if self._consumer_task:
+            self._consumer_task.cancel()
             try:
-                await self._listen_task
+                await self._consumer_task
             except asyncio.CancelledError:
                 pass
+            self._consumer_task = None
 
-        # Close stream
-        await self.stream.close()
+        # Drop our symbols and error handler
+        if self._tracked_symbols:
+            self.stream.remove_quote_handler(list(self._tracked_symbols), self._enqueue_quote)
+            self._tracked_symbols.clear()
+        self.stream.remove_error_handler(self._handle_error)
 
-        logger.info("AsyncExecutor stopped")
+    def _enqueue_quote(self, quote_data: dict):
+        """Queue a quote, dropping the oldest one if the queue is full."""
+        try:
+            self._quote_queue.put_nowait(quote_data)
+        except asyncio.QueueFull:
+            self._quote_queue.get_nowait()
+            self._quote_queue.task_done()
+            self._quote_queue.put_nowait(quote_data)
+
+    async def _consume_quotes(self):
+        """Handle queued quotes one at a time."""
+        while True:
+            quote_data = await self._quote_queue.get()
+            try:
+                await self._handle_quote(quote_data)
+            finally:
+                self._quote_queue.task_done()
 
     async def _handle_quote(self, quote_data: dict):
         """Handle incoming quote data from WebSocket.
 
         Args:
-            quote_data: Quote data from WebSocket
+            quote_data: Quote data from WebSocket, with either the REST
+                (exchSym/lastPrice/...) or the stream (s/l/b/a) field names
         """
         try:
-            symbol = quote_data.get('exchSym')
+            symbol = quote_data.get('exchSym') or quote_data.get('s')
             if not symbol:
                 return
 
             # Extract price
-            price = quote_data.get('lastPrice')
+            price = quote_data.get('lastPrice') or quote_data.get('l')
             if not price:
-                bid = quote_data.get('bidPrice')
-                ask = quote_data.get('askPrice')
+                bid = quote_data.get('bidPrice') or quote_data.get('b')
+                ask = quote_data.get('askPrice') or quote_data.get('a')
                 if bid and ask:
                     price = (bid + ask) / 2
 
@@ -403,29 +658,28 @@ class AsyncExecutor:
             # Process all positions for this symbol
             current_time = asyncio.get_event_loop().time()
 
-            # Check breakeven positions
-            for order_id, (position, _) in list(self.breakeven_manager.managed_positions.items()):
-                if position.symbol == symbol:
-                    # Rate limiting check
-                    last_update = self._last_update_time.get(order_id, 0)
-                    if current_time - last_update < self._min_update_interval:
-                        continue
+            def due(order_ids):
+                # Rate limiting check
+                return {
+                    order_id: price for order_id in order_ids
+                    if current_time - self._last_update_time.get(order_id, 0) >= self._min_update_interval
+                }
 
-                    updated = self.breakeven_manager.check_and_update(order_id, price)
-                    if updated:
-                        self._last_update_time[order_id] = current_time
+            # Check breakeven positions whose next trigger is reached; moves
+            # due on the same tick are sent together
+            breakeven_prices = due(self.breakeven_manager.triggered_orders(symbol, price))
+            if breakeven_prices:
+                for order_id in self.breakeven_manager.check_and_update_many(breakeven_prices):
+                    self._last_update_time[order_id] = current_time
 
             # Check running TP positions
-            for order_id, (position, _) in list(self.tp_manager.managed_positions.items()):
-                if position.symbol == symbol:
-                    # Rate limiting check
-                    last_update = self._last_update_time.get(order_id, 0)
-                    if current_time - last_update < self._min_update_interval:
-                        continue
-
-                    updated = self.tp_manager.check_and_update(order_id, price)
-                    if updated:
-                        self._last_update_time[order_id] = current_time
+            tp_prices = due(
+                order_id for order_id, (position, _) in list(self.tp_manager.managed_positions.items())
+                if position.symbol == symbol
+            )
+            if tp_prices:
+                for order_id in self.tp_manager.check_and_update_many(tp_prices):
+                    self._last_update_time[order_id] = current_time
 
         except Exception as e:
             logger.error(f"Error handling quote: {e}", exc_info=True)
@@ -208,6 +208,19 @@ class Fill(BaseModel):
     class Config:
         populate_by_name = True
 
+class FillLite(BaseModel):
+    """Fill with only the commonly read fields, for cheaper parsing of long histories."""
+    fill_id: Optional[str] = Field(None, validation_alias=AliasChoices('fillId', 'fill_id'))
+    order_id: str = Field(..., validation_alias=AliasChoices('orderId', 'order_id'))
+    exch_sym: str = Field(..., validation_alias=AliasChoices('exchSym', 'exch_sym'))
+    side: OrderSide
+    quantity: int
+    price: Optional[float] = None
+    fill_time: Optional[str] = Field(None, validation_alias=AliasChoices('fillTime', 'fill_time'))
+
+    class Config:
+        populate_by_name = True
+
 class AccountFills(BaseModel):
     status: str
     message: str
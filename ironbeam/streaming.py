@@ -1,12 +1,112 @@
 import asyncio
+import inspect
 import websockets
 import json
 import logging
-from typing import Callable, Optional, Dict, Any, List
+import socket
+import time
+from typing import Callable, Optional, Dict, Any, List, NamedTuple, Tuple
 from enum import Enum
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional, fall back to the stdlib decoder
+    _json_loads = json.loads
+
+try:
+    # websockets>=13: connections built on the Sans-I/O protocol, fed by
+    # asyncio.Protocol.data_received instead of StreamReader.readexactly
+    from websockets.asyncio.client import connect as _ws_connect
+except ImportError:  # older websockets only has the legacy client
+    _ws_connect = websockets.connect
+
+try:
+    import msgspec
+except ImportError:  # msgspec is optional, decode_frame builds tuples instead
+    msgspec = None
+
 logger = logging.getLogger(__name__)
 
+# Streams returned by IronBeamStream.get_shared, one per client
+_shared_streams = {}
+
+
+# Typed stream frames, for IronBeamStream.decoder = decode_frame. With
+# msgspec installed the JSON is decoded straight into structs; otherwise
+# the same attributes are exposed by named tuples built from the dict.
+if msgspec is not None:
+    class QuoteFrame(msgspec.Struct):
+        s: str = ""
+        l: Optional[float] = None
+        b: Optional[float] = None
+        a: Optional[float] = None
+
+    class DepthLevelFrame(msgspec.Struct):
+        p: float = 0.0
+        sz: float = 0.0
+        s: Optional[str] = None  # Side, "B" or "A"
+
+    class DepthFrame(msgspec.Struct):
+        s: str = ""
+        b: List[DepthLevelFrame] = []
+        a: List[DepthLevelFrame] = []
+
+    class StreamFrame(msgspec.Struct):
+        q: List[QuoteFrame] = []
+        d: List[DepthFrame] = []
+        tr: List[Dict[str, Any]] = []
+
+    decode_frame = msgspec.json.Decoder(StreamFrame).decode
+else:
+    class QuoteFrame(NamedTuple):
+        s: str = ""
+        l: Optional[float] = None
+        b: Optional[float] = None
+        a: Optional[float] = None
+
+    class DepthLevelFrame(NamedTuple):
+        p: float = 0.0
+        sz: float = 0.0
+        s: Optional[str] = None  # Side, "B" or "A"
+
+    class DepthFrame(NamedTuple):
+        s: str = ""
+        b: Tuple[DepthLevelFrame, ...] = ()
+        a: Tuple[DepthLevelFrame, ...] = ()
+
+    class StreamFrame(NamedTuple):
+        q: Tuple[QuoteFrame, ...] = ()
+        d: Tuple[DepthFrame, ...] = ()
+        tr: Tuple[Dict[str, Any], ...] = ()
+
+    def _depth_levels(levels) -> Tuple[DepthLevelFrame, ...]:
+        return tuple(DepthLevelFrame(lvl.get('p', 0.0), lvl.get('sz', 0.0), lvl.get('s')) for lvl in levels)
+
+    def decode_frame(message) -> StreamFrame:
+        """Decode a raw stream frame into a StreamFrame."""
+        data = _json_loads(message)
+        if not isinstance(data, dict):
+            return StreamFrame()
+        return StreamFrame(
+            q=tuple(QuoteFrame(q.get('s', ""), q.get('l'), q.get('b'), q.get('a'))
+                    for q in data.get('q', ())),
+            d=tuple(DepthFrame(d.get('s', ""), _depth_levels(d.get('b', ())), _depth_levels(d.get('a', ())))
+                    for d in data.get('d', ())),
+            tr=tuple(data.get('tr', ())),
+        )
+
+
+def _recv_takes_decode(websocket) -> bool:
+    """Whether websocket.recv accepts decode= (websockets>=13 asyncio API)."""
+    recv = getattr(websocket, 'recv', None)
+    if recv is None:
+        return False
+    try:
+        return 'decode' in inspect.signature(recv).parameters
+    except (TypeError, ValueError):
+        return False
+
 
 class ConnectionState(str, Enum):
     DISCONNECTED = "DISCONNECTED"
@@ -24,16 +124,28 @@ class IronBeamStream:
     - Subscription management
     - Event-driven message handling
     - Connection state management
+
+    Several consumers on one event loop can share a stream (see get_shared):
+    each registers a quote handler for its symbols with add_quote_handler,
+    and acquire()/release() connect on first use and close after the last.
     """
 
-    def __init__(self, client, mode="demo", base_url: Optional[str] = None):
+    # Keepalive options passed to websockets.connect unless overridden, so
+    # a dead connection is noticed and reconnected instead of going quiet
+    keepalive_kwargs = {"ping_interval": 20, "ping_timeout": 10, "close_timeout": 5}
+
+    def __init__(self, client, mode="demo", base_url: Optional[str] = None, **connect_kwargs):
         """Initialize the streaming client.
 
         Args:
             client: IronBeam client instance (for API calls and token)
             base_url: WebSocket base URL
+            **connect_kwargs: Extra options for websockets.connect
+                (e.g. compression=None, max_queue=None); these override
+                keepalive_kwargs
         """
         self.client = client
+        self.connect_kwargs = {**self.keepalive_kwargs, **connect_kwargs}
 
         if base_url is None:
             if mode == "demo":
@@ -58,8 +170,36 @@ class IronBeamStream:
         self.auto_reconnect = True
         self.max_reconnect_attempts = 5
         self.reconnect_delay = 1.0  # seconds
+        self.max_reconnect_delay = 30.0  # seconds
         self.reconnect_attempt = 0
 
+        # Frames buffered between the socket reader and the parser task
+        self.recv_queue_size = 1024
+
+        # Turns a raw frame into the object handed to the callbacks;
+        # set to decode_frame to receive typed StreamFrame objects
+        self.decoder: Callable = _json_loads
+
+        # Read text frames as raw bytes (websockets>=13 recv(decode=False)),
+        # skipping the UTF-8 decode; the default decoders parse bytes as-is.
+        # Turn off if a custom decoder needs str
+        self.raw_frames = True
+
+        # Per-frame errors are logged at most once per interval; the rest
+        # are counted and reported with the next logged one
+        self.error_log_interval = 1.0  # seconds
+        self.error_count = 0
+        self._suppressed_errors = 0
+        self._last_error_log = float('-inf')
+
+        # Quote handlers per symbol; a symbol is subscribed while it has one
+        self._quote_handlers: Dict[str, List[Callable]] = {}
+        # Error handlers of the consumers sharing the stream (see on_error)
+        self._error_handlers: List[Callable] = []
+        self._users = 0
+        self._connect_task: Optional[asyncio.Future] = None
+        self._listen_task: Optional[asyncio.Task] = None
+
         # Keep track of subscriptions for reconnection
         self.subscriptions = {
             'quotes': set(),
@@ -68,6 +208,109 @@ class IronBeamStream:
             'indicators': {}
         }
 
+    @classmethod
+    def get_shared(cls, client, **kwargs) -> "IronBeamStream":
+        """Get the stream shared by every consumer of client.
+
+        The first call creates the stream (kwargs are passed to the
+        constructor); later calls return the same instance until its last
+        user releases it, so all symbols are multiplexed over one
+        WebSocket. Use it from a single event loop.
+        """
+        stream = _shared_streams.get(client)
+        if stream is None:
+            stream = _shared_streams[client] = cls(client, **kwargs)
+        return stream
+
+    async def acquire(self):
+        """Start using the stream, connecting and listening on first use.
+
+        Concurrent callers wait on the same connection attempt; if it fails
+        they all get the error and the next acquire() tries again.
+        """
+        self._users += 1
+        if self._connect_task is None:
+            self._connect_task = asyncio.ensure_future(self.connect())
+        connect_task = self._connect_task
+        try:
+            await asyncio.shield(connect_task)
+        except Exception:
+            self._users -= 1
+            if self._connect_task is connect_task:
+                self._connect_task = None
+            raise
+
+        if self._listen_task is None:
+            pending = [s for s in self._quote_handlers if s not in self.subscriptions['quotes']]
+            if pending:
+                self.subscribe_quotes(pending)
+            self._listen_task = asyncio.create_task(self.listen())
+
+    async def release(self):
+        """Stop using the stream; the last user stops listening and closes it."""
+        self._users -= 1
+        if self._users > 0:
+            return
+        self._connect_task = None
+        task, self._listen_task = self._listen_task, None
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if _shared_streams.get(self.client) is self:
+            del _shared_streams[self.client]
+        await self.close()
+
+    def add_quote_handler(self, symbols: List[str], handler: Callable):
+        """Route stream quotes for symbols to handler.
+
+        Symbols are subscribed when they get their first handler (right
+        away if connected, otherwise once acquire() connects). The handler
+        is called with each quote dict on the parser task, so it should
+        return quickly.
+        """
+        new_symbols = []
+        for symbol in symbols:
+            handlers = self._quote_handlers.setdefault(symbol, [])
+            if not handlers:
+                new_symbols.append(symbol)
+            if handler not in handlers:
+                handlers.append(handler)
+        if new_symbols and self.stream_id:
+            self.subscribe_quotes(new_symbols)
+
+    def add_error_handler(self, handler: Callable):
+        """Also pass stream errors to handler (a coroutine function).
+
+        Unlike on_error, which replaces the single callback, each consumer
+        of a shared stream can add and later remove its own handler.
+        """
+        if handler not in self._error_handlers:
+            self._error_handlers.append(handler)
+
+    def remove_error_handler(self, handler: Callable):
+        """Stop passing stream errors to handler."""
+        if handler in self._error_handlers:
+            self._error_handlers.remove(handler)
+
+    def remove_quote_handler(self, symbols: List[str], handler: Callable):
+        """Stop routing quotes for symbols to handler.
+
+        Symbols left without a handler are unsubscribed.
+        """
+        unused_symbols = []
+        for symbol in symbols:
+            handlers = self._quote_handlers.get(symbol)
+            if handlers and handler in handlers:
+                handlers.remove(handler)
+                if not handlers:
+                    del self._quote_handlers[symbol]
+                    unused_symbols.append(symbol)
+        if unused_symbols and self.stream_id:
+            self.unsubscribe_quotes(unused_symbols)
+
     async def connect(self):
         """Create a stream and connect to the websocket."""
         try:
@@ -81,7 +324,8 @@ class IronBeamStream:
             uri = f"{self.base_url}/stream/{self.stream_id}?token={self.client.token}"
 
             # Connect to WebSocket
-            self.websocket = await websockets.connect(uri)
+            self.websocket = await _ws_connect(uri, **self.connect_kwargs)
+            self._set_nodelay()
             self.state = ConnectionState.CONNECTED
             self.reconnect_attempt = 0
 
@@ -96,32 +340,107 @@ class IronBeamStream:
         except Exception as e:
             self.state = ConnectionState.DISCONNECTED
             logger.error(f"Failed to connect: {e}")
-            if self.on_error_callback:
-                await self.on_error_callback(e)
+            await self._notify_error(e)
             raise
 
+    def _set_nodelay(self):
+        """Disable Nagle's algorithm so small frames (subscriptions, pongs) go out immediately."""
+        transport = getattr(self.websocket, 'transport', None)
+        sock = transport.get_extra_info('socket') if transport else None
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as e:
+            logger.debug(f"Could not set TCP_NODELAY: {e}")
+
     async def listen(self):
-        """Listen for messages from the stream with auto-reconnect."""
+        """Listen for messages from the stream with auto-reconnect.
+
+        Frames are read into a bounded queue and decoded and dispatched by a
+        separate parser task, so a slow handler doesn't stall the socket
+        read. When the queue is full the reader waits for the parser.
+        """
+        queue = asyncio.Queue(maxsize=self.recv_queue_size)
+        parser = asyncio.create_task(self._parse_loop(queue))
+        try:
+            await self._read_loop(queue)
+            # Dispatch whatever was read before the stream ended
+            await queue.join()
+        finally:
+            parser.cancel()
+            try:
+                await parser
+            except asyncio.CancelledError:
+                pass
+
+    async def _parse_loop(self, queue: asyncio.Queue):
+        """Decode queued frames and route them to the callbacks."""
+        while True:
+            message = await queue.get()
+            try:
+                data = self.decoder(message)
+                await self._handle_message(data)
+            except json.JSONDecodeError as e:
+                self._log_frame_error("Failed to decode message", e)
+                await self._notify_error(e)
+            except Exception as e:
+                self._log_frame_error("Error in message handler", e)
+                await self._notify_error(e)
+            finally:
+                queue.task_done()
+
+    async def _notify_error(self, error: Exception):
+        """Pass an error to the error callback and the error handlers.
+
+        A failing callback is logged and otherwise ignored: if it took the
+        parser task down, the reader would fill the queue and block forever.
+        """
+        callbacks = list(self._error_handlers)
+        if self.on_error_callback:
+            callbacks.insert(0, self.on_error_callback)
+        for callback in callbacks:
+            try:
+                await callback(error)
+            except Exception:
+                logger.exception("Error callback failed")
+
+    def _log_frame_error(self, what: str, error: Exception):
+        """Log a per-frame error, rate limited to one per error_log_interval."""
+        self.error_count += 1
+        now = time.monotonic()
+        if now - self._last_error_log < self.error_log_interval:
+            self._suppressed_errors += 1
+            return
+        if self._suppressed_errors:
+            logger.error(f"{what}: {error} ({self._suppressed_errors} more errors suppressed)")
+        else:
+            logger.error(f"{what}: {error}")
+        self._last_error_log = now
+        self._suppressed_errors = 0
+
+    async def _read_loop(self, queue: asyncio.Queue):
+        """Read frames into the queue, reconnecting when the connection drops."""
         while True:
             try:
                 if self.state != ConnectionState.CONNECTED:
+                    # connect() resets the attempt counter, so check first
+                    reconnecting = self.reconnect_attempt > 0
                     await self.connect()
 
                     # Resubscribe after reconnection
-                    if self.reconnect_attempt > 0:
+                    if reconnecting:
                         await self._resubscribe()
 
                 if self.websocket is None:
                     continue
 
-                async for message in self.websocket:
-                    try:
-                        data = json.loads(message)
-                        await self._handle_message(data)
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to decode message: {e}")
-                        if self.on_error_callback:
-                            await self.on_error_callback(e)
+                if self.raw_frames and _recv_takes_decode(self.websocket):
+                    while True:
+                        await queue.put(await self.websocket.recv(decode=False))
+                else:
+                    async for message in self.websocket:
+                        await queue.put(message)
 
             except websockets.exceptions.ConnectionClosed:
                 self.state = ConnectionState.DISCONNECTED
@@ -138,20 +457,28 @@ class IronBeamStream:
 
             except Exception as e:
                 logger.error(f"Error in listen loop: {e}")
-                if self.on_error_callback:
-                    await self.on_error_callback(e)
+                await self._notify_error(e)
 
                 if self.auto_reconnect:
                     await self._reconnect()
                 else:
                     break
 
-    async def _handle_message(self, data: Dict[str, Any]):
+    async def _handle_message(self, data: Any):
         """Handle incoming messages and route to appropriate callbacks."""
         # Generic message callback
         if self.on_message_callback:
             await self.on_message_callback(data)
 
+        # Typed frames carry no message type to route on
+        if not isinstance(data, dict):
+            return
+
+        if self._quote_handlers:
+            for quote in data.get('q', ()):
+                for handler in self._quote_handlers.get(quote.get('s'), ()):
+                    handler(quote)
+
         # Route to specific callbacks based on message type
         message_type = data.get('type') or data.get('messageType')
 
@@ -167,7 +494,7 @@ class IronBeamStream:
         self.state = ConnectionState.RECONNECTING
         self.reconnect_attempt += 1
 
-        delay = self.reconnect_delay * (2 ** (self.reconnect_attempt - 1))
+        delay = min(self.reconnect_delay * (2 ** (self.reconnect_attempt - 1)), self.max_reconnect_delay)
         logger.info(f"Reconnecting in {delay} seconds (attempt {self.reconnect_attempt}/{self.max_reconnect_attempts})")
 
         await asyncio.sleep(delay)
@@ -265,6 +592,46 @@ class IronBeamStream:
         self.subscriptions['trades'].difference_update(symbols)
         logger.info(f"Unsubscribed from trades: {symbols}")
 
+    def subscribe(self, symbols: List[str], channels: Tuple[str, ...] = ('quotes', 'depths', 'trades')):
+        """Subscribe to several market data channels at once.
+
+        The API takes one subscription request per channel, so the requests
+        are sent concurrently through client.batch rather than one after
+        another.
+
+        Args:
+            symbols: List of symbols to subscribe
+            channels: Any of 'quotes', 'depths' and 'trades'
+        """
+        self._update_channels('subscribe', symbols, channels)
+
+    def unsubscribe(self, symbols: List[str], channels: Tuple[str, ...] = ('quotes', 'depths', 'trades')):
+        """Unsubscribe from several market data channels at once."""
+        self._update_channels('unsubscribe', symbols, channels)
+
+    def _update_channels(self, action: str, symbols: List[str], channels: Tuple[str, ...]):
+        if not self.stream_id:
+            raise RuntimeError("Not connected. Call connect() first.")
+        unknown = set(channels) - {'quotes', 'depths', 'trades'}
+        if unknown:
+            raise ValueError(f"Unknown channels: {sorted(unknown)}")
+
+        results = self.client.batch(
+            *((f"{action}_{channel}", self.stream_id, symbols) for channel in channels)
+        )
+        error = None
+        for channel, result in zip(channels, results):
+            if isinstance(result, Exception):
+                error = error or result
+                continue
+            if action == 'subscribe':
+                self.subscriptions[channel].update(symbols)
+            else:
+                self.subscriptions[channel].difference_update(symbols)
+            logger.info(f"{action.capitalize()}d {channel}: {symbols}")
+        if error is not None:
+            raise error
+
     def on_message(self, callback: Callable):
         """Register callback for all messages."""
         self.on_message_callback = callback
@@ -6,6 +6,7 @@ Provides automated trade and risk management functions:
 - Running Take Profit: Dynamically adjusts take profit based on market conditions
 """
 
+import bisect
 import logging
 import time
 import functools
@@ -196,6 +197,61 @@ class AutoBreakevenManager:
         self.last_sl_values = {}     # Track last SL value to prevent duplicates
         self.min_update_interval_seconds = 10.0  # Minimum time between updates
 
+        # Per symbol: long and short order IDs with their next trigger
+        # prices, sorted by trigger price; rebuilt after positions are
+        # added or removed or a move completes
+        self._trigger_index: Dict[str, tuple] = {}
+
+    def _next_trigger_price(self, position: PositionState, config: AutoBreakevenConfig) -> Optional[float]:
+        """Price at which the position's next move triggers.
+
+        Returns None once the position is marked COMPLETED. When all moves
+        are done but it isn't marked yet, returns a price that always
+        triggers so check_and_update gets to mark it.
+        """
+        sign = 1.0 if position.side == OrderSide.BUY else -1.0
+        move_index = position.breakeven_moves_completed
+        if move_index >= len(config.trigger_levels):
+            if position.breakeven_state == BreakevenState.COMPLETED:
+                return None
+            return -sign * float('inf')
+
+        level = config.trigger_levels[move_index]
+        if config.trigger_mode == "percentage":
+            return position.entry_price * (1 + sign * level / 100)
+        return position.entry_price + sign * level
+
+    def _build_trigger_index(self, symbol: str) -> tuple:
+        longs, shorts = [], []
+        for order_id, (position, config) in self.managed_positions.items():
+            if position.symbol != symbol:
+                continue
+            trigger = self._next_trigger_price(position, config)
+            if trigger is None:
+                continue
+            (longs if position.side == OrderSide.BUY else shorts).append((trigger, order_id))
+        longs.sort()
+        shorts.sort()
+        return (
+            [order_id for _, order_id in longs], [trigger for trigger, _ in longs],
+            [order_id for _, order_id in shorts], [trigger for trigger, _ in shorts],
+        )
+
+    def triggered_orders(self, symbol: str, current_price: float) -> List[str]:
+        """Order IDs in symbol whose next breakeven move is due at current_price.
+
+        Longs trigger at or above their price and shorts at or below it, so
+        the due orders are a prefix of the sorted longs and a suffix of the
+        sorted shorts, found by binary search. Callers only need to run
+        check_and_update for the returned orders.
+        """
+        index = self._trigger_index.get(symbol)
+        if index is None:
+            index = self._trigger_index[symbol] = self._build_trigger_index(symbol)
+        long_ids, long_triggers, short_ids, short_triggers = index
+        return (long_ids[:bisect.bisect_right(long_triggers, current_price)]
+                + short_ids[bisect.bisect_left(short_triggers, current_price):])
+
     def _validate_position(self, order_id: str, current_price: float) -> tuple[bool, str]:
         """Validate position state and market conditions.
         
@@ -242,6 +298,7 @@ class AutoBreakevenManager:
             self.last_update_times[order_id] = 0.0
         if order_id not in self.last_sl_values:
             self.last_sl_values[order_id] = position.current_stop_loss or 0.0
+        self._trigger_index.pop(position.symbol, None)
             
         logger.info(f"Started auto breakeven monitoring for {order_id}")
 
@@ -252,7 +309,8 @@ class AutoBreakevenManager:
             order_id: Order ID to stop monitoring
         """
         if order_id in self.managed_positions:
-            del self.managed_positions[order_id]
+            position, _ = self.managed_positions.pop(order_id)
+            self._trigger_index.pop(position.symbol, None)
             
             # Clean up throttling tracking
             self.last_update_times.pop(order_id, None)
@@ -270,14 +328,83 @@ class AutoBreakevenManager:
         Returns:
             True if stop loss was updated, False otherwise
         """
+        move = self._due_move(order_id, current_price)
+        if move is None:
+            return False
+
+        # Update stop loss via API with throttling
+        return self._update_stop_loss_with_throttling(order_id, *move)
+
+    def check_and_update_many(self, prices: Dict[str, float]) -> List[str]:
+        """Check several positions and send the due stop loss moves together.
+
+        Moves due at the same time go out in one client.update_multiple_orders
+        call, so positions triggering on the same tick cost about one
+        round-trip instead of one update_order call after another.
+
+        Args:
+            prices: Current market price per order ID
+
+        Returns:
+            Order IDs whose stop loss was updated
+        """
+        if len(prices) == 1:
+            (order_id, current_price), = prices.items()
+            return [order_id] if self.check_and_update(order_id, current_price) else []
+
+        current_time = time.time()
+        moves = {}
+        for order_id, current_price in prices.items():
+            move = self._due_move(order_id, current_price)
+            if move is not None and not self._is_throttled(order_id, move[1], current_time):
+                moves[order_id] = move
+        if not moves:
+            return []
+
+        results = self.client.update_multiple_orders(self.account_id, {
+            order_id: self._stop_loss_request(order_id, position, new_stop_loss)
+            for order_id, (position, new_stop_loss, *_) in moves.items()
+        })
+
+        updated = []
+        for order_id, move in moves.items():
+            if isinstance(results.get(order_id), Exception):
+                # Retry a failed update on its own
+                try:
+                    self._update_stop_loss(order_id, *move)
+                except Exception as e:
+                    logger.error(f"Failed to update stop loss for {order_id} after retries: {e}")
+                    continue
+            else:
+                self._apply_stop_loss(order_id, *move)
+            self._record_update(order_id, move[1], current_time)
+            updated.append(order_id)
+        return updated
+
+    def _due_move(self, order_id: str, current_price: float) -> Optional[tuple]:
+        """Stop loss move due for a position at current_price.
+
+        Returns:
+            (position, new_stop_loss, move_index, trigger_level, sl_offset),
+            or None if no move is due
+        """
         # Validate position state and market conditions
         is_valid, error_msg = self._validate_position(order_id, current_price)
         if not is_valid:
-            logger.debug(f"Position validation failed for {order_id}: {error_msg}")
-            return False
+            logger.debug("Position validation failed for %s: %s", order_id, error_msg)
+            return None
 
         position, config = self.managed_positions[order_id]
 
+        # Check which level should trigger
+        move_index = position.breakeven_moves_completed
+
+        if move_index >= len(config.trigger_levels):
+            # All moves completed
+            position.breakeven_state = BreakevenState.COMPLETED
+            self._trigger_index.pop(position.symbol, None)
+            return None
+
         # Calculate profit in ticks or percentage
         if position.side == OrderSide.BUY:
             profit_ticks = current_price - position.entry_price
@@ -285,19 +412,10 @@ class AutoBreakevenManager:
             profit_ticks = position.entry_price - current_price
 
         if config.trigger_mode == "percentage":
-            profit_pct = (profit_ticks / position.entry_price) * 100
-            profit_value = profit_pct
+            profit_value = (profit_ticks / position.entry_price) * 100
         else:
             profit_value = profit_ticks
 
-        # Check which level should trigger
-        move_index = position.breakeven_moves_completed
-
-        if move_index >= len(config.trigger_levels):
-            # All moves completed
-            position.breakeven_state = BreakevenState.COMPLETED
-            return False
-
         trigger_level = config.trigger_levels[move_index]
 
         # Check if trigger level reached
@@ -310,12 +428,9 @@ class AutoBreakevenManager:
             else:
                 new_stop_loss = position.entry_price - sl_offset
 
-            # Update stop loss via API with throttling
-            return self._update_stop_loss_with_throttling(
-                order_id, position, new_stop_loss, move_index, trigger_level, sl_offset
-            )
+            return position, new_stop_loss, move_index, trigger_level, sl_offset
 
-        return False
+        return None
 
     def add_position(self, symbol: str, order_id: str, quantity: int, entry_price: float, side: OrderSide,):
         """Add a position to be managed for auto breakeven.
@@ -338,31 +453,16 @@ class AutoBreakevenManager:
 
         config = AutoBreakevenConfig()
         self.managed_positions[order_id] = (position, config)
+        self._trigger_index.pop(symbol, None)
         logger.info(f"Added position {order_id} for auto breakeven monitoring")
 
     def _update_stop_loss_with_throttling(self, order_id: str, position: PositionState, 
                                         new_stop_loss: float, move_index: int, 
                                         trigger_level: float, sl_offset: float) -> bool:
         """Update stop loss with throttling to prevent excessive API calls."""
-        import time
-        
         current_time = time.time()
-        
-        # Check if enough time has passed since last update
-        if order_id in self.last_update_times:
-            time_since_last = current_time - self.last_update_times[order_id]
-            if time_since_last < self.min_update_interval_seconds:
-                logger.debug(
-                    f"Throttling SL update for {order_id}: "
-                    f"Only {time_since_last:.1f}s since last update (min: {self.min_update_interval_seconds}s)"
-                )
-                return False
-        
-        # Check if new SL value is different from last value
-        if order_id in self.last_sl_values:
-            if abs(new_stop_loss - self.last_sl_values[order_id]) < 0.01:  # 1 cent tolerance
-                logger.debug(f"Skipping duplicate SL update for {order_id}: {new_stop_loss}")
-                return False
+        if self._is_throttled(order_id, new_stop_loss, current_time):
+            return False
         
         # Proceed with the update
         try:
@@ -372,19 +472,39 @@ class AutoBreakevenManager:
             return False
         
         if success:
-            # Update tracking variables
-            self.last_update_times[order_id] = current_time
-            self.last_sl_values[order_id] = new_stop_loss
-            logger.debug(f"Throttled SL update successful for {order_id}: {new_stop_loss}")
+            self._record_update(order_id, new_stop_loss, current_time)
         
         return success
 
-    @retry_api_call(max_retries=3, delay=0.5, backoff=1.5)
-    def _update_stop_loss(self, order_id: str, position: PositionState, 
-                         new_stop_loss: float, move_index: int, 
-                         trigger_level: float, sl_offset: float) -> bool:
-        """Update stop loss via API (original implementation)."""
-        update_request = {
+    def _is_throttled(self, order_id: str, new_stop_loss: float, current_time: float) -> bool:
+        """Whether an SL update is too soon after the last one or a duplicate."""
+        # Check if enough time has passed since last update
+        if order_id in self.last_update_times:
+            time_since_last = current_time - self.last_update_times[order_id]
+            if time_since_last < self.min_update_interval_seconds:
+                logger.debug(
+                    "Throttling SL update for %s: Only %.1fs since last update (min: %ss)",
+                    order_id, time_since_last, self.min_update_interval_seconds
+                )
+                return True
+        
+        # Check if new SL value is different from last value
+        if order_id in self.last_sl_values:
+            if abs(new_stop_loss - self.last_sl_values[order_id]) < 0.01:  # 1 cent tolerance
+                logger.debug("Skipping duplicate SL update for %s: %s", order_id, new_stop_loss)
+                return True
+
+        return False
+
+    def _record_update(self, order_id: str, new_stop_loss: float, current_time: float):
+        """Update the throttling tracking after a successful SL update."""
+        self.last_update_times[order_id] = current_time
+        self.last_sl_values[order_id] = new_stop_loss
+        logger.debug("Throttled SL update successful for %s: %s", order_id, new_stop_loss)
+
+    def _stop_loss_request(self, order_id: str, position: PositionState, new_stop_loss: float) -> Dict[str, Any]:
+        """Order update request moving the stop loss to new_stop_loss."""
+        return {
             "orderId": order_id,
             "quantity": position.quantity,
             "limitPrice": 0.0,
@@ -396,23 +516,32 @@ class AutoBreakevenManager:
             "trailingStop": 0.0
         }
 
-        response = self.client.update_order(
+    @retry_api_call(max_retries=3, delay=0.5, backoff=1.5)
+    def _update_stop_loss(self, order_id: str, position: PositionState, 
+                         new_stop_loss: float, move_index: int, 
+                         trigger_level: float, sl_offset: float) -> bool:
+        """Update stop loss via API (original implementation)."""
+        self.client.update_order(
             self.account_id,
             order_id,
-            update_request
+            self._stop_loss_request(order_id, position, new_stop_loss)
         )
+        self._apply_stop_loss(order_id, position, new_stop_loss, move_index, trigger_level, sl_offset)
+        return True
 
-        # Update state
+    def _apply_stop_loss(self, order_id: str, position: PositionState,
+                         new_stop_loss: float, move_index: int,
+                         trigger_level: float, sl_offset: float):
+        """Record a stop loss move the API accepted."""
         position.current_stop_loss = new_stop_loss
         position.breakeven_moves_completed += 1
+        self._trigger_index.pop(position.symbol, None)
 
         logger.info(
             f"Auto breakeven move {move_index + 1} executed for {order_id}: "
             f"SL moved to {new_stop_loss} (trigger: {trigger_level}, offset: {sl_offset})"
         )
 
-        return True
-
 
 
 # ==================== Running Take Profit Manager ====================
@@ -516,11 +645,67 @@ class RunningTPManager:
         Returns:
             True if TP was updated, False otherwise
         """
+        new_tp = self._due_take_profit(order_id, current_price)
+        if new_tp is None:
+            return False
+
+        # Apply throttling and duplicate prevention
+        position, _ = self.managed_positions[order_id]
+        return self._update_take_profit_with_throttling(order_id, position, new_tp)
+
+    def check_and_update_many(self, prices: Dict[str, float]) -> List[str]:
+        """Check several positions and send the TP adjustments together.
+
+        Same as AutoBreakevenManager.check_and_update_many: adjustments due
+        at the same time go out in one client.update_multiple_orders call.
+
+        Args:
+            prices: Current market price per order ID
+
+        Returns:
+            Order IDs whose TP was updated
+        """
+        if len(prices) == 1:
+            (order_id, current_price), = prices.items()
+            return [order_id] if self.check_and_update(order_id, current_price) else []
+
+        current_time = time.time()
+        new_tps = {}
+        for order_id, current_price in prices.items():
+            new_tp = self._due_take_profit(order_id, current_price)
+            if new_tp is not None and not self._is_throttled(order_id, new_tp, current_time):
+                new_tps[order_id] = new_tp
+        if not new_tps:
+            return []
+
+        results = self.client.update_multiple_orders(self.account_id, {
+            order_id: self._take_profit_request(order_id, self.managed_positions[order_id][0], new_tp)
+            for order_id, new_tp in new_tps.items()
+        })
+
+        updated = []
+        for order_id, new_tp in new_tps.items():
+            position, _ = self.managed_positions[order_id]
+            if isinstance(results.get(order_id), Exception):
+                # Retry a failed update on its own
+                try:
+                    self._update_take_profit(order_id, position, new_tp)
+                except Exception as e:
+                    logger.error(f"Failed to update take profit for {order_id} after retries: {e}")
+                    continue
+            else:
+                self._apply_take_profit(order_id, position, new_tp)
+            self._record_update(order_id, new_tp, current_time)
+            updated.append(order_id)
+        return updated
+
+    def _due_take_profit(self, order_id: str, current_price: float) -> Optional[float]:
+        """New TP for a position at current_price, or None if no adjustment is due."""
         # Validate position state and market conditions
         is_valid, error_msg = self._validate_position(order_id, current_price)
         if not is_valid:
-            logger.debug(f"Position validation failed for {order_id}: {error_msg}")
-            return False
+            logger.debug("Position validation failed for %s: %s", order_id, error_msg)
+            return None
 
         position, config = self.managed_positions[order_id]
         position.update_price_extremes(current_price)
@@ -542,11 +727,10 @@ class RunningTPManager:
                 new_tp = tp_from_profit_levels
                 should_update = True
 
-        # Apply throttling and duplicate prevention
         if should_update and new_tp:
-            return self._update_take_profit_with_throttling(order_id, position, new_tp)
+            return new_tp
 
-        return False
+        return None
 
     def _calculate_trailing_tp(self, position: PositionState, current_price: float, config: RunningTPConfig) -> Optional[float]:
         """Calculate TP based on trailing highest/lowest."""
@@ -602,6 +786,9 @@ class RunningTPManager:
 
     def _check_profit_level_trigger(self, position: PositionState, current_price: float, config: RunningTPConfig) -> Optional[float]:
         """Check if profit level triggers should activate."""
+        if len(position.tp_profit_levels_triggered) >= len(config.profit_level_triggers):
+            return None
+
         # Calculate current profit
         if position.side == OrderSide.BUY:
             profit_ticks = current_price - position.entry_price
@@ -637,11 +824,9 @@ class RunningTPManager:
     def _get_next_level(self, current_price: float, levels: List[float], higher: bool) -> Optional[float]:
         """Get next resistance (higher=True) or support (higher=False) level."""
         if higher:
-            next_levels = [l for l in levels if l > current_price]
-            return min(next_levels) if next_levels else None
+            return min((l for l in levels if l > current_price), default=None)
         else:
-            next_levels = [l for l in levels if l < current_price]
-            return max(next_levels) if next_levels else None
+            return max((l for l in levels if l < current_price), default=None)
 
     def _is_better_tp(self, new_tp: float, current_tp: float, side: OrderSide) -> bool:
         """Check if new TP is better than current TP."""
@@ -650,10 +835,9 @@ class RunningTPManager:
         else:
             return new_tp < current_tp
 
-    @retry_api_call(max_retries=3, delay=0.5, backoff=1.5)
-    def _update_take_profit(self, order_id: str, position: PositionState, new_tp: float) -> bool:
-        """Update take profit via API."""
-        update_request = {
+    def _take_profit_request(self, order_id: str, position: PositionState, new_tp: float) -> Dict[str, Any]:
+        """Order update request moving the take profit to new_tp."""
+        return {
                 "orderId": order_id,
                 "quantity": position.quantity,
                 "limitPrice": 0.0,
@@ -665,12 +849,19 @@ class RunningTPManager:
                 "trailingStop": 0.0
             }
 
-        response = self.client.update_order(
+    @retry_api_call(max_retries=3, delay=0.5, backoff=1.5)
+    def _update_take_profit(self, order_id: str, position: PositionState, new_tp: float) -> bool:
+        """Update take profit via API."""
+        self.client.update_order(
             self.account_id,
             order_id,
-            update_request
+            self._take_profit_request(order_id, position, new_tp)
         )
+        self._apply_take_profit(order_id, position, new_tp)
+        return True
 
+    def _apply_take_profit(self, order_id: str, position: PositionState, new_tp: float):
+        """Record a TP adjustment the API accepted."""
         old_tp = position.current_take_profit
         position.current_take_profit = new_tp
         position.tp_moves_completed += 1
@@ -680,29 +871,11 @@ class RunningTPManager:
             f"(move #{position.tp_moves_completed})"
         )
 
-        return True
-
     def _update_take_profit_with_throttling(self, order_id: str, position: PositionState, new_tp: float) -> bool:
         """Update take profit with throttling to prevent excessive API calls."""
-        import time
-        
         current_time = time.time()
-        
-        # Check if enough time has passed since last update
-        if order_id in self.last_update_times:
-            time_since_last = current_time - self.last_update_times[order_id]
-            if time_since_last < self.min_update_interval_seconds:
-                logger.debug(
-                    f"Throttling TP update for {order_id}: "
-                    f"Only {time_since_last:.1f}s since last update (min: {self.min_update_interval_seconds}s)"
-                )
-                return False
-        
-        # Check if new TP value is different from last value
-        if order_id in self.last_tp_values:
-            if abs(new_tp - self.last_tp_values[order_id]) < 0.01:  # 1 cent tolerance
-                logger.debug(f"Skipping duplicate TP update for {order_id}: {new_tp}")
-                return False
+        if self._is_throttled(order_id, new_tp, current_time):
+            return False
         
         # Proceed with the update
         try:
@@ -712,9 +885,32 @@ class RunningTPManager:
             return False
         
         if success:
-            # Update tracking variables
-            self.last_update_times[order_id] = current_time
-            self.last_tp_values[order_id] = new_tp
-            logger.debug(f"Throttled TP update successful for {order_id}: {new_tp}")
+            self._record_update(order_id, new_tp, current_time)
         
         return success
+
+    def _is_throttled(self, order_id: str, new_tp: float, current_time: float) -> bool:
+        """Whether a TP update is too soon after the last one or a duplicate."""
+        # Check if enough time has passed since last update
+        if order_id in self.last_update_times:
+            time_since_last = current_time - self.last_update_times[order_id]
+            if time_since_last < self.min_update_interval_seconds:
+                logger.debug(
+                    "Throttling TP update for %s: Only %.1fs since last update (min: %ss)",
+                    order_id, time_since_last, self.min_update_interval_seconds
+                )
+                return True
+        
+        # Check if new TP value is different from last value
+        if order_id in self.last_tp_values:
+            if abs(new_tp - self.last_tp_values[order_id]) < 0.01:  # 1 cent tolerance
+                logger.debug("Skipping duplicate TP update for %s: %s", order_id, new_tp)
+                return True
+
+        return False
+
+    def _record_update(self, order_id: str, new_tp: float, current_time: float):
+        """Update the throttling tracking after a successful TP update."""
+        self.last_update_times[order_id] = current_time
+        self.last_tp_values[order_id] = new_tp
+        logger.debug("Throttled TP update successful for %s: %s", order_id, new_tp)
@@ -1,13 +1,18 @@
+import io
+import json
 import unittest
+import requests
 from unittest.mock import patch, Mock
 from ironbeam.client import IronBeam
+from ironbeam._session import get_client
+from ironbeam.models import FillLite, OrderSide
 
 class TestIronBeamAPI(unittest.TestCase):
 
     def setUp(self):
         self.api = IronBeam(api_key="test_api_key", username="test_username")
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_authenticate(self, mock_post):
         mock_response = Mock()
         mock_response.status_code = 200
@@ -18,7 +23,7 @@ class TestIronBeamAPI(unittest.TestCase):
         self.assertEqual(token, "test_token")
         self.assertEqual(self.api.token, "test_token")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_trader_info(self, mock_get):
         self.api.token = "test_token"  # Simulate authenticated state
         mock_response = Mock()
@@ -29,7 +34,7 @@ class TestIronBeamAPI(unittest.TestCase):
         trader_info = self.api.get_trader_info()
         self.assertEqual(trader_info, {"traderId": "test_trader"})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_account_balance(self, mock_get):
         self.api.token = "test_token"
         mock_response = Mock()
@@ -40,7 +45,7 @@ class TestIronBeamAPI(unittest.TestCase):
         balance = self.api.get_account_balance("test_account_id")
         self.assertEqual(balance, {"balance": 10000})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_positions(self, mock_get):
         self.api.token = "test_token"
         mock_response = Mock()
@@ -51,7 +56,7 @@ class TestIronBeamAPI(unittest.TestCase):
         positions = self.api.get_positions("test_account_id")
         self.assertEqual(positions, [{"symbol": "AAPL", "quantity": 10}])
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_risk(self, mock_get):
         self.api.token = "test_token"
         mock_response = Mock()
@@ -62,7 +67,7 @@ class TestIronBeamAPI(unittest.TestCase):
         risk = self.api.get_risk("test_account_id")
         self.assertEqual(risk, {"risk_level": "low"})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_fills(self, mock_get):
         self.api.token = "test_token"
         mock_response = Mock()
@@ -73,7 +78,7 @@ class TestIronBeamAPI(unittest.TestCase):
         fills = self.api.get_fills("test_account_id")
         self.assertEqual(fills, [{"symbol": "AAPL", "price": 150}])
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_quotes(self, mock_get):
         self.api.token = "test_token"
         mock_response = Mock()
@@ -84,7 +89,7 @@ class TestIronBeamAPI(unittest.TestCase):
         quotes = self.api.get_quotes(["AAPL", "GOOG"])
         self.assertEqual(quotes, {"Quotes": []})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_depth(self, mock_get):
         self.api.token = "test_token"
         mock_response = Mock()
@@ -95,7 +100,7 @@ class TestIronBeamAPI(unittest.TestCase):
         depth = self.api.get_depth(["AAPL"])
         self.assertEqual(depth, {"Depths": []})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_trades(self, mock_get):
         self.api.token = "test_token"
         mock_response = Mock()
@@ -106,7 +111,7 @@ class TestIronBeamAPI(unittest.TestCase):
         trades = self.api.get_trades("AAPL", 1609459200000, 1609545600000)
         self.assertEqual(trades, {"trades": []})
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_place_order(self, mock_post):
         self.api.token = "test_token"
         mock_response = Mock()
@@ -118,7 +123,13 @@ class TestIronBeamAPI(unittest.TestCase):
         order_response = self.api.place_order("test_account_id", order_details)
         self.assertEqual(order_response, {"orderId": "123"})
 
-    @patch('requests.put')
+        # The body is sent pre-encoded rather than through json=
+        body = mock_post.call_args[1]["data"]
+        self.assertIsInstance(body, bytes)
+        self.assertEqual(json.loads(body), order_details)
+        self.assertEqual(mock_post.call_args[1]["headers"]["Content-Type"], "application/json")
+
+    @patch('requests.Session.put')
     def test_update_order(self, mock_put):
         self.api.token = "test_token"
         mock_response = Mock()
@@ -130,7 +141,7 @@ class TestIronBeamAPI(unittest.TestCase):
         update_response = self.api.update_order("test_account_id", "123", update_details)
         self.assertEqual(update_response, {"status": "OK"})
 
-    @patch('requests.delete')
+    @patch('requests.Session.delete')
     def test_cancel_order(self, mock_delete):
         self.api.token = "test_token"
         mock_response = Mock()
@@ -141,7 +152,7 @@ class TestIronBeamAPI(unittest.TestCase):
         cancel_response = self.api.cancel_order("test_account_id", "123")
         self.assertEqual(cancel_response, {"status": "OK"})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_orders(self, mock_get):
         self.api.token = "test_token"
         mock_response = Mock()
@@ -152,7 +163,7 @@ class TestIronBeamAPI(unittest.TestCase):
         orders = self.api.get_orders("test_account_id")
         self.assertEqual(orders, {"orders": []})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_order_fills(self, mock_get):
         self.api.token = "test_token"
         mock_response = Mock()
@@ -163,7 +174,7 @@ class TestIronBeamAPI(unittest.TestCase):
         fills = self.api.get_order_fills("test_account_id")
         self.assertEqual(fills, {"fills": []})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_security_definitions(self, mock_get):
         self.api.token = "test_token"
         mock_response = Mock()
@@ -174,7 +185,126 @@ class TestIronBeamAPI(unittest.TestCase):
         definitions = self.api.get_security_definitions(["AAPL"])
         self.assertEqual(definitions, {"securityDefinitions": []})
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
+    def test_get_fills_iter(self, mock_get):
+        self.api.token = "test_token"
+        data = {"status": "OK", "message": "", "fills": [
+            {"orderId": "1", "exchSym": "XCME:ES.Z25", "side": "BUY", "quantity": 2},
+            {"orderId": "2", "exchSym": "XCME:ES.Z25", "side": "SELL", "quantity": 1},
+        ]}
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = data
+        mock_response.raw = io.BytesIO(json.dumps(data).encode())
+        mock_get.return_value = mock_response
+
+        fills = list(self.api.get_fills_iter("acc1"))
+        self.assertEqual([f.order_id for f in fills], ["1", "2"])
+        self.assertEqual(fills[0].quantity, 2)
+        mock_response.close.assert_called_once()
+
+    @patch('requests.Session.get')
+    def test_get_fills_iter_lite(self, mock_get):
+        self.api.token = "test_token"
+        data = {"status": "OK", "message": "", "fills": [
+            {"orderId": "1", "exchSym": "XCME:ES.Z25", "side": "BUY", "quantity": 2, "fillQuantity": 2},
+        ]}
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = data
+        mock_response.raw = io.BytesIO(json.dumps(data).encode())
+        mock_get.return_value = mock_response
+
+        fills = list(self.api.get_fills_iter("acc1", lite=True))
+        self.assertIsInstance(fills[0], FillLite)
+        self.assertEqual(fills[0].side, OrderSide.BUY)
+        self.assertFalse(hasattr(fills[0], "fill_quantity"))
+
+    @patch('requests.Session.get')
+    def test_get_security_definitions_cached(self, mock_get):
+        self.api.token = "test_token"
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"status": "OK", "message": "", "definitions": []}
+        mock_get.return_value = mock_response
+
+        first = self.api.get_security_definitions(["XCME:ES.Z25", "XCME:NQ.Z25"])
+        second = self.api.get_security_definitions(["XCME:NQ.Z25", "XCME:ES.Z25"])
+        self.assertIs(first, second)
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch('requests.Session.get')
+    def test_security_definitions_cache_bounded(self, mock_get):
+        self.api.token = "test_token"
+        self.api.security_definitions_cache_size = 2
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"status": "OK", "message": "", "definitions": []}
+        mock_get.return_value = mock_response
+
+        self.api.get_security_definitions(["XCME:ES.Z25"])
+        self.api.get_security_definitions(["XCME:NQ.Z25"])
+        # Using ES makes NQ the least recently used set
+        self.api.get_security_definitions(["XCME:ES.Z25"])
+        self.api.get_security_definitions(["XCME:YM.Z25"])
+        self.assertEqual(list(self.api._security_definitions_cache), [("XCME:ES.Z25",), ("XCME:YM.Z25",)])
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch('requests.Session.get')
+    def test_try_get_security_definitions(self, mock_get):
+        self.api.token = "test_token"
+        mock_response = Mock()
+        mock_response.raise_for_status.side_effect = requests.HTTPError("503")
+        mock_get.return_value = mock_response
+
+        definitions, error = self.api.try_get_security_definitions(["XCME:ES.Z25"])
+        self.assertIsNone(definitions)
+        self.assertIsInstance(error, requests.HTTPError)
+
+    def test_session_retries_rate_limits(self):
+        retry = self.api._session.get_adapter("https://demo.ironbeamapi.com").max_retries
+        self.assertEqual(retry.total, IronBeam.max_retries)
+        self.assertIn(429, retry.status_forcelist)
+        self.assertNotIn("POST", retry.allowed_methods)
+
+    def test_session_default_timeout(self):
+        adapter = self.api._session.get_adapter("https://demo.ironbeamapi.com")
+        self.assertEqual(adapter.timeout, (IronBeam.connect_timeout, IronBeam.read_timeout))
+
+    def test_get_client_refreshes_token(self):
+        def authenticate(client):
+            client.token = "test_token"
+
+        with patch.object(IronBeam, "authenticate", autospec=True, side_effect=authenticate) as mock_auth:
+            first = get_client("ttl_api_key", "ttl_username", token_ttl=60.0)
+            self.assertIs(get_client("ttl_api_key", "ttl_username", token_ttl=60.0), first)
+            self.assertEqual(mock_auth.call_count, 1)
+
+            self.assertIs(get_client("ttl_api_key", "ttl_username", token_ttl=0.0), first)
+            self.assertEqual(mock_auth.call_count, 2)
+
+    @patch('requests.Session.get')
+    def test_queue_subscription(self, mock_get):
+        self.api.token = "test_token"
+        self.api.subscription_batch_window = 60.0
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"status": "OK"}
+        mock_get.return_value = mock_response
+
+        self.api.queue_subscription("sid", "quotes", ["XCME:ES.Z25"])
+        self.api.queue_subscription("sid", "quotes", ["XCME:NQ.Z25", "XCME:ES.Z25"])
+        self.api.queue_subscription("sid", "depths", ["XCME:ES.Z25"])
+        mock_get.assert_not_called()
+
+        results = self.api.flush_subscriptions()
+        self.assertEqual(results, [{"status": "OK"}, {"status": "OK"}])
+        self.assertEqual(mock_get.call_count, 2)
+        quote_call = next(c for c in mock_get.call_args_list if "/market/quotes/subscribe/sid" in c[0][0])
+        self.assertEqual(quote_call[1]["params"], {"symbols": "XCME:ES.Z25,XCME:NQ.Z25"})
+        self.assertEqual(self.api.flush_subscriptions(), [])
+
+    @patch('requests.Session.get')
     def test_get_symbols(self, mock_get):
         self.api.token = "test_token"
         mock_response = Mock()
@@ -185,7 +315,30 @@ class TestIronBeamAPI(unittest.TestCase):
         symbols = self.api.get_symbols("AAP")
         self.assertEqual(symbols, {"symbols": []})
 
-    @patch('requests.post')
+    @patch('requests.Session.get')
+    def test_batch(self, mock_get):
+        self.api.token = "test_token"
+        ok = Mock()
+        ok.json.return_value = {"symbols": []}
+        failed = Mock()
+        failed.raise_for_status.side_effect = Exception("boom")
+        mock_get.side_effect = lambda url, **kwargs: failed if "definitions" in url else ok
+
+        symbols, definitions = self.api.batch(
+            ('get_symbols', "AAP"),
+            ('get_security_definitions', ["AAPL"])
+        )
+        self.assertEqual(symbols, {"symbols": []})
+        self.assertIsInstance(definitions, Exception)
+
+    @patch('requests.Session.head')
+    def test_warm_up(self, mock_head):
+        mock_head.side_effect = [Mock(), requests.ConnectionError("refused"), Mock()]
+        self.assertEqual(self.api.warm_up(3), 2)
+        self.assertEqual(mock_head.call_count, 3)
+        mock_head.assert_called_with("https://demo.ironbeamapi.com/v2")
+
+    @patch('requests.Session.post')
     def test_create_simulated_trader(self, mock_post):
         self.api.token = "test_token"
         mock_response = Mock()
@@ -201,7 +354,7 @@ class TestIronBeamAPI(unittest.TestCase):
         response = self.api.create_simulated_trader(trader_details)
         self.assertEqual(response, {"TraderId": "sim_trader_1"})
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_add_simulated_account(self, mock_post):
         self.api.token = "test_token"
         mock_response = Mock()
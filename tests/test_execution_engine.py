@@ -0,0 +1,173 @@
+"""
+Unit tests for the execution engines.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+from ironbeam.execution_engine import AsyncExecutor, ThreadedExecutor
+from ironbeam.trade_manager import AutoBreakevenConfig, PositionState
+from ironbeam.models import OrderSide, QuotesResponse
+
+
+class TestThreadedExecutor(unittest.TestCase):
+    """Test the threaded executor's quote handling."""
+
+    def setUp(self):
+        self.client = Mock()
+        self.executor = ThreadedExecutor(self.client, "12345", use_stream=True)
+        self.position = PositionState(
+            order_id="order1",
+            account_id="12345",
+            symbol="XCME:ES.Z25",
+            side=OrderSide.BUY,
+            entry_price=5000.0,
+            quantity=1
+        )
+        self.config = AutoBreakevenConfig(trigger_levels=[20, 40, 60], sl_offsets=[10, 30, 50])
+        self.executor.add_auto_breakeven("order1", self.position, self.config)
+        self.executor.breakeven_manager.check_and_update = Mock(return_value=True)
+
+    def test_add_tracks_symbol(self):
+        self.assertEqual(self.executor._symbols, {"XCME:ES.Z25"})
+
+    def test_dispatch_checks_matching_symbol(self):
+        self.executor._dispatch("XCME:NQ.Z25", 18000.0)
+        self.executor.breakeven_manager.check_and_update.assert_not_called()
+
+        self.executor._dispatch("XCME:ES.Z25", 5020.0)
+        self.executor.breakeven_manager.check_and_update.assert_called_once_with("order1", 5020.0)
+
+    def test_enqueue_quotes_drops_oldest(self):
+        with patch.object(ThreadedExecutor, "quote_queue_size", 2):
+            executor = ThreadedExecutor(self.client, "12345", use_stream=True)
+        message = {"q": [
+            {"s": "XCME:ES.Z25", "l": 5001.0},
+            {"s": "XCME:ES.Z25", "b": 5001.0, "a": 5002.0},
+            {"s": "XCME:ES.Z25", "l": 5003.0},
+        ]}
+        asyncio.run(executor._enqueue_quotes(message))
+        ticks = [executor._quote_queue.get_nowait() for _ in range(executor._quote_queue.qsize())]
+        self.assertEqual(ticks, [("XCME:ES.Z25", 5001.5), ("XCME:ES.Z25", 5003.0)])
+
+    def test_process_positions_reads_quote_models(self):
+        self.client.get_quotes.return_value = QuotesResponse(
+            quotes=[{"exchSym": "XCME:ES.Z25", "lastPrice": 5020.0}]
+        )
+        self.executor._process_positions()
+        self.executor.breakeven_manager.check_and_update.assert_called_once_with("order1", 5020.0)
+
+    def test_loop_factory(self):
+        factory = Mock(side_effect=asyncio.new_event_loop)
+        executor = ThreadedExecutor(self.client, "12345", use_stream=True, loop_factory=factory)
+        executor._stream_quotes = AsyncMock()
+        executor._run_stream()
+        factory.assert_called_once_with()
+        executor._stream_quotes.assert_awaited_once()
+
+    def test_start_waits_for_stream_loop(self):
+        executor = ThreadedExecutor(self.client, "12345", use_stream=True)
+        executor._stream_quotes = lambda: asyncio.sleep(60)
+        executor.start()
+        self.assertIsNotNone(executor._stream_task)
+        # Stopping straight away still cancels the stream task
+        executor.stop()
+        self.assertFalse(executor._stream_thread.is_alive())
+
+    def test_stop_after_stream_loop_closed(self):
+        executor = ThreadedExecutor(self.client, "12345", use_stream=True)
+        executor._running = True
+        executor._stream_loop = asyncio.new_event_loop()
+        executor._stream_loop.close()
+        executor._stream_task = Mock()
+        executor.stop()
+        self.assertFalse(executor._running)
+
+    def test_track_symbol_updates_subscriptions_on_stream_loop(self):
+        executor = ThreadedExecutor(self.client, "12345", use_stream=True)
+        executor._stream = Mock(stream_id="sid", subscriptions={'quotes': set()})
+        executor._stream_loop = Mock()
+        executor._track_symbol("XCME:NQ.Z25")
+        executor._stream_loop.call_soon_threadsafe.assert_called_once_with(
+            executor._stream.subscriptions['quotes'].add, "XCME:NQ.Z25"
+        )
+        self.client.queue_subscription.assert_called_once_with("sid", 'quotes', ["XCME:NQ.Z25"])
+
+    def test_stop_wakes_poll_wait(self):
+        executor = ThreadedExecutor(self.client, "12345", poll_interval=60.0)
+        executor._process_positions = Mock()
+        executor.start()
+        executor.add_auto_breakeven("order1", self.position, self.config)
+        executor.stop()
+        self.assertFalse(executor._thread.is_alive())
+
+
+class TestAsyncExecutor(unittest.TestCase):
+    """Test the async executor's quote queue."""
+
+    def setUp(self):
+        self.stream = Mock()
+        self.stream.acquire = AsyncMock()
+        self.stream.release = AsyncMock()
+        self.executor = AsyncExecutor(Mock(), "12345", stream=self.stream)
+        self.position = PositionState(
+            order_id="order1",
+            account_id="12345",
+            symbol="XCME:ES.Z25",
+            side=OrderSide.BUY,
+            entry_price=5000.0,
+            quantity=1
+        )
+        config = AutoBreakevenConfig(trigger_levels=[20, 40, 60], sl_offsets=[10, 30, 50])
+        self.executor.breakeven_manager.start_monitoring("order1", self.position, config)
+        self.executor.breakeven_manager.check_and_update = Mock(return_value=False)
+
+    def test_stream_quotes_reach_consumer(self):
+        async def run_test():
+            await self.executor.start()
+            self.stream.add_quote_handler.assert_called_once_with(["XCME:ES.Z25"], self.executor._enqueue_quote)
+            self.stream.acquire.assert_awaited_once()
+            self.executor._enqueue_quote({"s": "XCME:ES.Z25", "l": 5020.0})
+            self.executor._enqueue_quote({"exchSym": "XCME:ES.Z25", "bidPrice": 5021.0, "askPrice": 5022.0})
+            await self.executor._quote_queue.join()
+            await self.executor.stop()
+            self.stream.remove_quote_handler.assert_called_once_with(["XCME:ES.Z25"], self.executor._enqueue_quote)
+            self.stream.release.assert_awaited_once()
+
+        asyncio.run(run_test())
+        calls = self.executor.breakeven_manager.check_and_update.call_args_list
+        self.assertEqual([c[0] for c in calls], [("order1", 5020.0), ("order1", 5021.5)])
+
+    def test_failed_start_can_be_retried(self):
+        async def run_test():
+            self.stream.acquire.side_effect = ConnectionError("refused")
+            with self.assertRaises(ConnectionError):
+                await self.executor.start()
+            self.assertFalse(self.executor._running)
+            self.assertIsNone(self.executor._consumer_task)
+            self.stream.remove_quote_handler.assert_called_once_with(["XCME:ES.Z25"], self.executor._enqueue_quote)
+            self.stream.remove_error_handler.assert_called_once_with(self.executor._handle_error)
+            # Nothing was acquired, so stop() must not release
+            await self.executor.stop()
+            self.stream.release.assert_not_awaited()
+
+            self.stream.acquire.side_effect = None
+            await self.executor.start()
+            self.assertTrue(self.executor._running)
+            await self.executor.stop()
+            self.stream.release.assert_awaited_once()
+
+        asyncio.run(run_test())
+
+    def test_full_queue_drops_oldest(self):
+        async def run_test():
+            self.executor._quote_queue = asyncio.Queue(maxsize=1)
+            self.executor._enqueue_quote({"s": "XCME:ES.Z25", "l": 5001.0})
+            self.executor._enqueue_quote({"s": "XCME:ES.Z25", "l": 5002.0})
+            return self.executor._quote_queue.get_nowait()
+
+        self.assertEqual(asyncio.run(run_test())["l"], 5002.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,21 @@
 import unittest
 from unittest.mock import patch, Mock, AsyncMock
-from ironbeam.streaming import IronBeamStream
+from websockets.exceptions import ConnectionClosedOK
+from ironbeam.streaming import IronBeamStream, ConnectionState, decode_frame
+
+class FakeWebSocket:
+    """Yields the given frames, then reports a clean close."""
+
+    def __init__(self, frames):
+        self.frames = frames
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.frames:
+            raise ConnectionClosedOK(None, None)
+        return self.frames.pop(0)
 
 class TestIronBeamStream(unittest.TestCase):
 
@@ -17,5 +32,219 @@ class TestIronBeamStream(unittest.TestCase):
         import asyncio
         asyncio.run(run_test())
 
+    def test_listen_dispatches_queued_frames(self):
+        async def run_test():
+            stream = IronBeamStream(Mock())
+            stream.state = ConnectionState.CONNECTED
+            stream.websocket = FakeWebSocket(['{"q": [1]}', 'not json', '{"d": [2]}'])
+            stream.auto_reconnect = False
+            received = []
+            errors = []
+
+            async def on_message(msg):
+                received.append(msg)
+
+            async def on_error(error):
+                errors.append(error)
+
+            stream.on_message(on_message)
+            stream.on_error(on_error)
+            await stream.listen()
+            self.assertEqual(received, [{"q": [1]}, {"d": [2]}])
+            self.assertEqual(len(errors), 1)
+
+        import asyncio
+        asyncio.run(run_test())
+
+    def test_listen_reads_raw_frames(self):
+        async def run_test():
+            stream = IronBeamStream(Mock())
+            stream.state = ConnectionState.CONNECTED
+            stream.auto_reconnect = False
+            frames = [b'{"q": [1]}']
+            decode_args = []
+
+            class RawWebSocket:
+                async def recv(self, decode=None):
+                    decode_args.append(decode)
+                    if not frames:
+                        raise ConnectionClosedOK(None, None)
+                    return frames.pop(0)
+
+            stream.websocket = RawWebSocket()
+            received = []
+
+            async def on_message(msg):
+                received.append(msg)
+
+            stream.on_message(on_message)
+            await stream.listen()
+            self.assertEqual(received, [{"q": [1]}])
+            self.assertEqual(decode_args, [False, False])
+
+        import asyncio
+        asyncio.run(run_test())
+
+    def test_listen_resubscribes_after_reconnect(self):
+        async def run_test():
+            client = Mock()
+            stream = IronBeamStream(client)
+            stream.state = ConnectionState.CONNECTED
+            stream.websocket = FakeWebSocket([])
+            stream.reconnect_delay = 0
+            stream.subscriptions['quotes'].add("XCME:ES.Z25")
+
+            async def reconnect():
+                stream.stream_id = "new_stream_id"
+                stream.websocket = FakeWebSocket([])
+                stream.state = ConnectionState.CONNECTED
+                stream.reconnect_attempt = 0
+                stream.auto_reconnect = False
+
+            stream.connect = AsyncMock(side_effect=reconnect)
+            await stream.listen()
+            stream.connect.assert_awaited_once()
+            client.subscribe_quotes.assert_called_once_with("new_stream_id", ["XCME:ES.Z25"])
+
+        import asyncio
+        asyncio.run(run_test())
+
+    def test_keepalive_defaults(self):
+        stream = IronBeamStream(Mock(), ping_interval=5)
+        self.assertEqual(stream.connect_kwargs["ping_interval"], 5)
+        self.assertEqual(stream.connect_kwargs["ping_timeout"], 10)
+
+    def test_connect_uses_sans_io_client(self):
+        async def run_test():
+            client = Mock()
+            client.create_stream.return_value = "sid"
+            client.token = "tok"
+            stream = IronBeamStream(client)
+            with patch('ironbeam.streaming._ws_connect', new_callable=AsyncMock) as mock_connect:
+                mock_connect.return_value = Mock(transport=None)
+                await stream.connect()
+            mock_connect.assert_awaited_once_with(
+                "wss://demo.ironbeamapi.com/v2/stream/sid?token=tok", **IronBeamStream.keepalive_kwargs
+            )
+            self.assertEqual(stream.state, ConnectionState.CONNECTED)
+
+        import asyncio
+        asyncio.run(run_test())
+
+    def test_subscribe_channels(self):
+        client = Mock()
+        client.batch.return_value = [{}, RuntimeError("rejected")]
+        stream = IronBeamStream(client)
+        stream.stream_id = "sid"
+        with self.assertRaises(RuntimeError):
+            stream.subscribe(["XCME:ES.Z25"], channels=('quotes', 'trades'))
+        client.batch.assert_called_once_with(
+            ('subscribe_quotes', "sid", ["XCME:ES.Z25"]),
+            ('subscribe_trades', "sid", ["XCME:ES.Z25"]),
+        )
+        self.assertEqual(stream.subscriptions['quotes'], {"XCME:ES.Z25"})
+        self.assertEqual(stream.subscriptions['trades'], set())
+
+    def test_shared_stream_quote_handlers(self):
+        async def run_test():
+            client = Mock()
+            stream = IronBeamStream.get_shared(client)
+            self.assertIs(IronBeamStream.get_shared(client), stream)
+            stream.connect = AsyncMock(side_effect=lambda: setattr(stream, 'stream_id', "sid"))
+            stream.listen = AsyncMock()
+            first, second = [], []
+
+            stream.add_quote_handler(["XCME:ES.Z25"], first.append)
+            stream.add_quote_handler(["XCME:ES.Z25", "XCME:NQ.Z25"], second.append)
+            await stream.acquire()
+            await stream.acquire()
+            stream.connect.assert_awaited_once()
+            client.subscribe_quotes.assert_called_once_with("sid", ["XCME:ES.Z25", "XCME:NQ.Z25"])
+
+            await stream._handle_message({"q": [{"s": "XCME:ES.Z25", "l": 1.0}, {"s": "XCME:NQ.Z25", "l": 2.0}]})
+            self.assertEqual(first, [{"s": "XCME:ES.Z25", "l": 1.0}])
+            self.assertEqual(len(second), 2)
+
+            # A symbol is unsubscribed once its last handler is removed
+            stream.remove_quote_handler(["XCME:ES.Z25"], first.append)
+            client.unsubscribe_quotes.assert_not_called()
+            stream.remove_quote_handler(["XCME:ES.Z25", "XCME:NQ.Z25"], second.append)
+            client.unsubscribe_quotes.assert_called_once_with("sid", ["XCME:ES.Z25", "XCME:NQ.Z25"])
+
+            await stream.release()
+            self.assertEqual(stream.state, ConnectionState.DISCONNECTED)
+            await stream.release()
+            self.assertEqual(stream.state, ConnectionState.CLOSED)
+            self.assertIsNot(IronBeamStream.get_shared(client), stream)
+
+        import asyncio
+        asyncio.run(run_test())
+
+    def test_frame_errors_rate_limited(self):
+        async def run_test():
+            stream = IronBeamStream(Mock())
+            stream.state = ConnectionState.CONNECTED
+            stream.websocket = FakeWebSocket(['bad'] * 5)
+            stream.auto_reconnect = False
+            with self.assertLogs('ironbeam.streaming', level='ERROR') as logs:
+                await stream.listen()
+            decode_logs = [line for line in logs.output if "Failed to decode" in line]
+            self.assertEqual(len(decode_logs), 1)
+            self.assertEqual(stream.error_count, 5)
+
+        import asyncio
+        asyncio.run(run_test())
+
+    def test_failing_error_callback_keeps_parsing(self):
+        async def run_test():
+            stream = IronBeamStream(Mock())
+            stream.state = ConnectionState.CONNECTED
+            stream.websocket = FakeWebSocket(['bad', '{"q": [1]}'])
+            stream.auto_reconnect = False
+            received = []
+
+            async def on_message(msg):
+                received.append(msg)
+
+            stream.on_message(on_message)
+            stream.on_error(AsyncMock(side_effect=RuntimeError("handler bug")))
+            with self.assertLogs('ironbeam.streaming', level='ERROR'):
+                await stream.listen()
+            self.assertEqual(received, [{"q": [1]}])
+
+        import asyncio
+        asyncio.run(run_test())
+
+    def test_error_handlers(self):
+        async def run_test():
+            stream = IronBeamStream(Mock())
+            first, second = AsyncMock(), AsyncMock()
+            stream.add_error_handler(first)
+            stream.add_error_handler(second)
+            error = RuntimeError("boom")
+            await stream._notify_error(error)
+            stream.remove_error_handler(first)
+            await stream._notify_error(error)
+            first.assert_awaited_once_with(error)
+            self.assertEqual(second.await_count, 2)
+
+        import asyncio
+        asyncio.run(run_test())
+
+    def test_decode_frame(self):
+        frame = decode_frame(
+            b'{"q": [{"s": "XCME:ES.Z25", "l": 5000.25, "b": 5000.0, "a": 5000.5}],'
+            b' "d": [{"s": "XCME:ES.Z25", "b": [{"s": "B", "p": 5000.0, "sz": 3}], "a": []}],'
+            b' "tr": [{"s": "XCME:ES.Z25", "p": 5000.25}]}'
+        )
+        self.assertEqual(frame.q[0].s, "XCME:ES.Z25")
+        self.assertEqual(frame.q[0].l, 5000.25)
+        self.assertEqual(frame.d[0].b[0].p, 5000.0)
+        self.assertEqual(frame.d[0].b[0].sz, 3)
+        self.assertEqual(frame.d[0].b[0].s, "B")
+        self.assertEqual(len(frame.d[0].a), 0)
+        self.assertEqual(len(frame.tr), 1)
+        self.assertEqual(len(decode_frame(b'{"tr": []}').q), 0)
+
 if __name__ == '__main__':
     unittest.main()
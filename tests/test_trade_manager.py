@@ -205,6 +205,61 @@ class TestAutoBreakevenManager(unittest.TestCase):
         self.assertTrue(result)
         self.assertEqual(self.position.breakeven_moves_completed, 1)
 
+    def test_triggered_orders(self):
+        """Only positions whose next trigger is reached are returned."""
+        short_position = PositionState(
+            order_id="order2",
+            account_id=self.account_id,
+            symbol="XCME:ES.Z24",
+            side=OrderSide.SELL,
+            entry_price=5000.0,
+            quantity=1
+        )
+        self.manager.start_monitoring("order1", self.position, self.config)
+        self.manager.start_monitoring("order2", short_position, self.config)
+        self.mock_client.update_order.return_value = {"status": "OK"}
+
+        self.assertEqual(self.manager.triggered_orders("XCME:ES.Z24", 5010.0), [])
+        self.assertEqual(self.manager.triggered_orders("XCME:ES.Z24", 5020.0), ["order1"])
+        self.assertEqual(self.manager.triggered_orders("XCME:ES.Z24", 4980.0), ["order2"])
+        self.assertEqual(self.manager.triggered_orders("XCME:NQ.Z24", 5020.0), [])
+
+        # After the first move the next trigger is entry + 40
+        self.manager.check_and_update("order1", 5020.0)
+        self.assertEqual(self.manager.triggered_orders("XCME:ES.Z24", 5030.0), [])
+        self.assertEqual(self.manager.triggered_orders("XCME:ES.Z24", 5040.0), ["order1"])
+
+        self.manager.stop_monitoring("order1")
+        self.assertEqual(self.manager.triggered_orders("XCME:ES.Z24", 5040.0), [])
+
+    def test_check_and_update_many(self):
+        """Moves due together are sent in one batch; failures are retried alone."""
+        short_position = PositionState(
+            order_id="order2",
+            account_id=self.account_id,
+            symbol="XCME:ES.Z24",
+            side=OrderSide.SELL,
+            entry_price=5030.0,
+            quantity=1
+        )
+        self.manager.start_monitoring("order1", self.position, self.config)
+        self.manager.start_monitoring("order2", short_position, self.config)
+        self.mock_client.update_multiple_orders.return_value = {
+            "order1": {"status": "OK"},
+            "order2": Exception("timeout"),
+        }
+        self.mock_client.update_order.return_value = {"status": "OK"}
+
+        updated = self.manager.check_and_update_many({"order1": 5020.0, "order2": 5010.0})
+
+        self.assertEqual(updated, ["order1", "order2"])
+        updates = self.mock_client.update_multiple_orders.call_args[0][1]
+        self.assertEqual(updates["order1"]["stopLoss"], 5010.0)
+        self.assertEqual(updates["order2"]["stopLoss"], 5020.0)
+        self.mock_client.update_order.assert_called_once()
+        self.assertEqual(self.position.current_stop_loss, 5010.0)
+        self.assertEqual(short_position.breakeven_moves_completed, 1)
+
 
 class TestRunningTPManager(unittest.TestCase):
     """Test running take profit manager."""